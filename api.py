@@ -7,22 +7,38 @@ FastAPI를 사용한 Excel to Image Converter REST API
 
 import os, sys
 import uuid
+import hashlib
+import json
 import asyncio
 import logging
-import subprocess
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Iterable, Iterator
+from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
 
 from fastapi import FastAPI, File, UploadFile, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import uvicorn
 
-from excel_parser import ExcelParser
+# orjson이 설치되어 있으면 모든 응답을 orjson으로 직렬화 (datetime 기본 지원)
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+    HAS_ORJSON = True
+except ImportError:
+    DefaultJSONResponse = JSONResponse
+    HAS_ORJSON = False
+
+from excel_parser import ExcelParser, read_sheet_names
 from html_renderer import HTMLRenderer
-from image_converter import ImageConverter, convert_html_to_image_async
+from image_converter import ImageConverter, convert_html_to_image_async, close_screenshot_batcher
+from browser_pool import start_browser_pool, close_browser_pools, find_installed_chromium, CDP_ENDPOINT_ENV
+from task_registry import TaskRegistry, run_evictor
+from render_cache import RenderCache, make_cache_key
 
 
 if sys.platform.startswith('win'):
@@ -36,52 +52,30 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def check_and_install_playwright_browsers():
-    """Playwright 브라우저가 설치되어 있는지 확인하고, 없으면 설치합니다."""
+async def ensure_playwright_browsers():
+    """Playwright 브라우저가 설치되어 있는지 확인하고, 없으면 비동기로 설치합니다."""
+    if await asyncio.to_thread(find_installed_chromium):
+        logger.info("Playwright 브라우저가 이미 설치되어 있습니다.")
+        return
+    
+    logger.info("Playwright 브라우저를 설치합니다...")
     try:
-        # Windows에서 asyncio 이벤트 루프 문제 해결
-        import platform
-        if platform.system() == 'Windows':
-            import asyncio
-            try:
-                # Windows에서 ProactorEventLoop 사용
-                if isinstance(asyncio.get_event_loop_policy(), asyncio.WindowsProactorEventLoopPolicy):
-                    pass  # 이미 ProactorEventLoop 사용 중
-                else:
-                    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-                logger.info("Windows 이벤트 루프 정책 설정 완료")
-            except Exception as e:
-                logger.warning(f"Windows 이벤트 루프 정책 설정 실패: {e}")
-        
-        # playwright 브라우저 설치 확인
-        result = subprocess.run(
-            ['playwright', '--version'], 
-            capture_output=True, 
-            text=True, 
-            timeout=10
+        proc = await asyncio.create_subprocess_exec(
+            'playwright', 'install', 'chromium',
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-        
-        if result.returncode != 0:
-            logger.info("Playwright 브라우저를 설치합니다...")
-            subprocess.run(['playwright', 'install', 'chromium'], check=True)
-            logger.info("Playwright 브라우저 설치 완료")
-        else:
-            logger.info("Playwright 브라우저가 이미 설치되어 있습니다.")
-            
-    except subprocess.TimeoutExpired:
-        logger.warning("Playwright 버전 확인 시간 초과, 브라우저 설치를 시도합니다...")
-        try:
-            subprocess.run(['playwright', 'install', 'chromium'], check=True)
-            logger.info("Playwright 브라우저 설치 완료")
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Playwright 브라우저 설치 실패: {e}")
-            raise
     except FileNotFoundError:
         logger.error("Playwright가 설치되어 있지 않습니다. 'pip install playwright'를 실행하세요.")
         raise
-    except Exception as e:
-        logger.error(f"Playwright 브라우저 확인 중 오류: {e}")
-        raise
+    
+    _, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        message = stderr.decode(errors='replace').strip()
+        logger.error(f"Playwright 브라우저 설치 실패: {message}")
+        raise RuntimeError(f"Playwright 브라우저 설치 실패: {message}")
+    
+    logger.info("Playwright 브라우저 설치 완료")
 
 
 # FastAPI 앱 초기화
@@ -89,6 +83,7 @@ app = FastAPI(
     title="Excel to Image Converter API",
     description="Excel 파일을 고품질 이미지로 변환하는 REST API",
     version="1.0.0",
+    default_response_class=DefaultJSONResponse,
 )
 
 # CORS 설정
@@ -100,9 +95,80 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.on_event("startup")
+async def startup_browser_pool():
+    """서버 시작 시 브라우저 설치를 확인하고 브라우저 풀을 미리 실행합니다."""
+    # 브라우저 설치 실패 시 서버를 시작하지 않음 (공유 Chromium 사용 시 생략)
+    if not os.environ.get(CDP_ENDPOINT_ENV):
+        await ensure_playwright_browsers()
+    
+    try:
+        await start_browser_pool()
+    except Exception as e:
+        # 풀 사전 실행 실패 시 첫 변환 요청에서 지연 실행
+        logger.warning(f"브라우저 풀 사전 실행 실패: {e}")
+
+
+@app.on_event("startup")
+async def startup_task_evictor():
+    """만료된 작업을 주기적으로 제거하는 백그라운드 루프를 시작합니다."""
+    app.state.task_evictor = asyncio.create_task(run_evictor(TASKS, TASK_EVICT_INTERVAL))
+
+
+@app.on_event("shutdown")
+async def shutdown_task_evictor():
+    """서버 종료 시 만료 작업 제거 루프를 중지합니다."""
+    evictor = getattr(app.state, "task_evictor", None)
+    if evictor is not None:
+        evictor.cancel()
+        await asyncio.gather(evictor, return_exceptions=True)
+
+
+@app.on_event("shutdown")
+async def shutdown_browser_pool():
+    """서버 종료 시 스크린샷 워커와 브라우저 풀을 정리합니다."""
+    await close_screenshot_batcher()
+    await close_browser_pools()
+
+
+@app.on_event("shutdown")
+async def shutdown_parse_executor():
+    """서버 종료 시 파싱 실행기를 정리합니다."""
+    PARSE_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+
+
 # 전역 변수
-TASKS: Dict[str, Dict[str, Any]] = {}
+# (용량 초과/만료로 제거된 작업의 업로드/출력 파일도 함께 삭제)
+TASKS = TaskRegistry(on_evict=lambda evicted: _remove_task_files(task for _, task in evicted))
+TASK_EVICT_INTERVAL = 300  # 만료 작업 검사 주기 (초)
+MAX_CONCURRENT_SHEETS = 4  # 작업 하나에서 동시에 변환할 최대 시트 수
+PARSE_WORKERS = min(4, os.cpu_count() or 1)  # Excel 파싱/HTML 렌더링 동시 실행 수
+
+# 동기식 파싱/렌더링을 이벤트 루프 밖에서 실행하는 전용 실행기
+# (기본 실행기를 점유하지 않도록 작업자 수를 별도로 제한)
+PARSE_EXECUTOR = ThreadPoolExecutor(max_workers=PARSE_WORKERS, thread_name_prefix="excel-parse")
+
+# 템플릿 환경을 한 번만 만들어 재사용 (jinja2 템플릿 캐시 공유)
+RENDERER = HTMLRenderer()
+
+# 응답에 노출되는 작업 필드 (file_path, request 등 내부 필드 제외)
+PUBLIC_TASK_FIELDS = (
+    "task_id",
+    "status",
+    "progress",
+    "message",
+    "created_at",
+    "completed_at",
+    "output_file",
+    "error",
+)
+# /tasks 응답을 스트리밍할 때 한 번에 내보내는 작업 수
+TASKS_STREAM_CHUNK = 256
+
 UPLOAD_DIR = Path("uploads")
+MAX_UPLOAD_SIZE = 100 * 1024 * 1024  # 100MB
+UPLOAD_CHUNK_SIZE = 64 * 1024  # 64KB
 OUTPUT_DIR = Path("outputs")
 TEMP_DIR = Path("temp")
 
@@ -111,9 +177,13 @@ UPLOAD_DIR.mkdir(exist_ok=True)
 OUTPUT_DIR.mkdir(exist_ok=True)
 TEMP_DIR.mkdir(exist_ok=True)
 
+# (파일 해시, 시트, 범위) 기준 HTML/이미지 캐시
+RENDER_CACHE = RenderCache(TEMP_DIR / "html_cache")
+
 
-# Pydantic 모델
-class ConversionRequest(BaseModel):
+# 변환 요청 (내부 전달용이므로 Pydantic 검증 없이 dataclass 사용)
+@dataclass
+class ConversionRequest:
     """변환 요청 모델"""
     
     sheet_name: Optional[str] = None
@@ -125,23 +195,10 @@ class ConversionRequest(BaseModel):
     width: Optional[int] = None
     height: Optional[int] = None
     type: str = "image"  # "image" 또는 "html"
-    
-    class Config:
-        schema_extra = {
-            "example": {
-                "sheet_name": "Sheet1",
-                "sheet_index": None,
-                "range_start": "A1",
-                "range_end": "D10",
-                "output_format": "png,jpeg,jpg",
-                "quality": 100,
-                "width": 1200,
-                "height": 800,
-                "type": "image|html"
-            }
-        }
+    fast_mode: bool = False  # 스타일 없이 값만 빠르게 추출
 
 
+# Pydantic 모델 (응답 스키마 문서화용)
 class ConversionResponse(BaseModel):
     """변환 응답 모델"""
     
@@ -216,203 +273,247 @@ class APIInfo(BaseModel):
 
 
 async def convert_excel_to_image_task(
-    task_id: str, file_path: str, request: ConversionRequest
+    task_id: str, file_path: str, request: ConversionRequest, file_hash: Optional[str] = None
 ):
     """백그라운드에서 Excel을 이미지로 변환하는 작업"""
-    parser = None
-    
+    # Windows 이벤트 루프 정책은 모듈 import 시 한 번만 설정됨
     try:
-        # Windows 이벤트 루프 정책 재확인 (백그라운드 작업 시작 시)
-        import platform
-        if platform.system() == 'Windows':
-            try:
-                # 현재 이벤트 루프 정책 확인 및 강제 설정
-                current_policy = asyncio.get_event_loop_policy()
-                if not isinstance(current_policy, asyncio.WindowsProactorEventLoopPolicy):
-                    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-                    logger.info(f"백그라운드 작업에서 Windows 이벤트 루프 정책 재설정 완료")
-                else:
-                    logger.info(f"백그라운드 작업에서 Windows 이벤트 루프 정책 확인됨")
-            except Exception as e:
-                logger.warning(f"백그라운드 작업에서 Windows 이벤트 루프 정책 설정 실패: {e}")
-        
         # 파일 경로 검증
-        if not os.path.exists(file_path):
+        if not await asyncio.to_thread(os.path.exists, file_path):
             raise FileNotFoundError(f"업로드된 파일을 찾을 수 없습니다: {file_path}")
 
         # 시트 이름이 지정되지 않으면 모든 시트 변환
         if request.sheet_name is None:
-            await _convert_all_sheets_task(task_id, file_path, request)
+            await _convert_all_sheets_task(task_id, file_path, request, file_hash)
         else:
-            await _convert_single_sheet_task(task_id, file_path, request)
+            await _convert_single_sheet_task(task_id, file_path, request, file_hash)
             
     except Exception as e:
         logger.error(f"작업 {task_id} 실패: {str(e)}")
-        TASKS[task_id]["status"] = "failed"
-        TASKS[task_id]["progress"] = 0
-        TASKS[task_id]["message"] = f"오류 발생: {str(e)}"
-        TASKS[task_id]["completed_at"] = datetime.now()
-        TASKS[task_id]["error"] = str(e)
-    finally:
-        if parser:
-            parser.close()
+        TASKS.update(
+            task_id,
+            status="failed",
+            progress=0,
+            message=f"오류 발생: {str(e)}",
+            completed_at=datetime.now(),
+            error=str(e),
+        )
 
 
-async def _convert_all_sheets_task(task_id: str, file_path: str, request: ConversionRequest):
+async def _convert_all_sheets_task(task_id: str, file_path: str, request: ConversionRequest,
+                                   file_hash: Optional[str] = None):
     """모든 시트를 각각의 이미지로 변환하는 작업"""
     try:
         # 작업 상태 업데이트
-        TASKS[task_id]["status"] = "processing"
-        TASKS[task_id]["progress"] = 5
-        TASKS[task_id]["message"] = "Excel 파일 분석 중..."
-
-        # Excel 파일에서 모든 시트 이름 가져오기
-        parser = ExcelParser(file_path)
-        if not parser.load_workbook():
-            raise Exception("Excel 파일을 로드할 수 없습니다.")
-        
-        sheet_names = parser.get_sheet_names()
-        parser.close()
+        TASKS.update(
+            task_id,
+            status="processing",
+            progress=5,
+            message="Excel 파일 분석 중...",
+        )
+
+        # 시트 이름은 셀을 읽지 않는 읽기 전용 로드로만 확인
+        loop = asyncio.get_running_loop()
+        try:
+            sheet_names = await loop.run_in_executor(PARSE_EXECUTOR, read_sheet_names, file_path)
+        except Exception as e:
+            raise Exception(f"Excel 파일을 로드할 수 없습니다: {str(e)}")
         
         if not sheet_names:
             raise Exception("Excel 파일에 시트가 없습니다.")
         
+        # 모든 시트 변환에서 파서를 공유하고, 워크북은 HTML 캐시에 없는 시트를 처음 파싱할 때만 로드
+        # (수식 계산값용 data_only 워크북도 파서에 남아 시트마다 다시 로드하지 않음)
+        parser = ExcelParser(file_path, fast_mode=request.fast_mode)
+        
         logger.info(f"작업 {task_id}: 총 {len(sheet_names)}개 시트를 변환합니다: {', '.join(sheet_names)}")
         
-        success_count = 0
         total_count = len(sheet_names)
-        output_files = []
+        finished_count = 0
         
-        for i, sheet_name in enumerate(sheet_names):
-            try:
-                # 진행률 업데이트
-                progress = 5 + int((i / total_count) * 90)
-                TASKS[task_id]["progress"] = progress
-                TASKS[task_id]["message"] = f"시트 변환 중: {sheet_name} ({i+1}/{total_count})"
-                
-                # 각 시트별 출력 파일명 생성
-                output_filename = f"{task_id}_{sheet_name}.{request.output_format}"
-                output_path = OUTPUT_DIR / output_filename
-                
-                # 출력 디렉토리 생성 확인
-                output_path.parent.mkdir(exist_ok=True)
-                
-                # 단일 시트 변환
-                success = await _convert_single_sheet_internal(
-                    file_path, str(output_path), sheet_name, request
-                )
-                
-                if success:
-                    success_count += 1
-                    output_files.append(output_filename)
-                    logger.info(f"작업 {task_id}: 시트 '{sheet_name}' 변환 완료")
-                else:
+        # 시트마다 바뀌지 않는 값은 루프 밖에서 한 번만 계산
+        # (HTML 출력은 실제로 기록되는 .html 파일명을 기록해야 정리/다운로드가 같은 파일을 가리킴)
+        output_prefix = f"{task_id}_"
+        output_suffix = ".html" if request.type.lower() == "html" else f".{request.output_format}"
+        
+        # 브라우저 풀에서 여러 시트를 동시에 렌더링 (동시 실행 수 제한)
+        # 공유 워크북 파싱은 한 번에 하나씩만 실행하고, 스크린샷만 동시에 진행
+        semaphore = asyncio.Semaphore(min(MAX_CONCURRENT_SHEETS, total_count))
+        parser_lock = asyncio.Lock()
+        
+        async def convert_one(sheet_name: str) -> Optional[str]:
+            nonlocal finished_count
+            async with semaphore:
+                try:
+                    # 각 시트별 출력 파일명 생성
+                    output_filename = f"{output_prefix}{sheet_name}{output_suffix}"
+                    output_path = OUTPUT_DIR / output_filename
+                    
+                    # 단일 시트 변환
+                    success = await _convert_single_sheet_internal(
+                        file_path, str(output_path), sheet_name, request,
+                        parser=parser, file_hash=file_hash,
+                        parser_lock=parser_lock,
+                    )
+                    
+                    if success:
+                        logger.info(f"작업 {task_id}: 시트 '{sheet_name}' 변환 완료")
+                        return output_filename
                     logger.error(f"작업 {task_id}: 시트 '{sheet_name}' 변환 실패")
+                    return None
                     
-            except Exception as e:
-                logger.error(f"작업 {task_id}: 시트 '{sheet_name}' 변환 중 오류: {str(e)}")
+                except Exception as e:
+                    logger.error(f"작업 {task_id}: 시트 '{sheet_name}' 변환 중 오류: {str(e)}")
+                    return None
+                finally:
+                    # 진행률 업데이트 (이벤트 루프 단일 스레드에서만 변경됨)
+                    finished_count += 1
+                    TASKS.update(
+                        task_id,
+                        progress=5 + int((finished_count / total_count) * 90),
+                        message=f"시트 변환 중: {sheet_name} ({finished_count}/{total_count})",
+                    )
+        
+        try:
+            results = await asyncio.gather(*(convert_one(name) for name in sheet_names))
+        finally:
+            parser.close()
+        output_files = [output_file for output_file in results if output_file]
+        success_count = len(output_files)
         
         # 최종 상태 업데이트
         if success_count > 0:
-            TASKS[task_id]["status"] = "completed"
-            TASKS[task_id]["progress"] = 100
-            TASKS[task_id]["message"] = f"변환 완료 ({success_count}/{total_count} 시트)"
-            TASKS[task_id]["completed_at"] = datetime.now()
-            TASKS[task_id]["output_file"] = ", ".join(output_files)
+            TASKS.update(
+                task_id,
+                status="completed",
+                progress=100,
+                message=f"변환 완료 ({success_count}/{total_count} 시트)",
+                completed_at=datetime.now(),
+                output_file=", ".join(output_files),
+            )
             logger.info(f"작업 {task_id} 완료: {success_count}/{total_count} 시트 성공")
         else:
-            TASKS[task_id]["status"] = "failed"
-            TASKS[task_id]["progress"] = 0
-            TASKS[task_id]["message"] = "모든 시트 변환 실패"
-            TASKS[task_id]["completed_at"] = datetime.now()
-            TASKS[task_id]["error"] = "모든 시트 변환에 실패했습니다."
+            TASKS.update(
+                task_id,
+                status="failed",
+                progress=0,
+                message="모든 시트 변환 실패",
+                completed_at=datetime.now(),
+                error="모든 시트 변환에 실패했습니다.",
+            )
             
     except Exception as e:
         logger.error(f"모든 시트 변환 작업 {task_id} 실패: {str(e)}")
-        TASKS[task_id]["status"] = "failed"
-        TASKS[task_id]["progress"] = 0
-        TASKS[task_id]["message"] = f"오류 발생: {str(e)}"
-        TASKS[task_id]["completed_at"] = datetime.now()
-        TASKS[task_id]["error"] = str(e)
+        TASKS.update(
+            task_id,
+            status="failed",
+            progress=0,
+            message=f"오류 발생: {str(e)}",
+            completed_at=datetime.now(),
+            error=str(e),
+        )
 
 
-async def _convert_single_sheet_task(task_id: str, file_path: str, request: ConversionRequest):
+async def _convert_single_sheet_task(task_id: str, file_path: str, request: ConversionRequest,
+                                     file_hash: Optional[str] = None):
     """단일 시트를 이미지로 변환하는 작업"""
     try:
         # 작업 상태 업데이트
-        TASKS[task_id]["status"] = "processing"
-        TASKS[task_id]["progress"] = 10
-        TASKS[task_id]["message"] = "Excel 파일 파싱 중..."
+        TASKS.update(
+            task_id,
+            status="processing",
+            progress=10,
+            message="Excel 파일 파싱 중...",
+        )
 
-        # 출력 파일명 생성 및 경로 검증
-        output_filename = f"{task_id}.{request.output_format}"
+        # 출력 파일명 생성 및 경로 검증 (HTML 출력은 실제로 기록되는 .html 파일명 사용)
+        output_ext = "html" if request.type.lower() == "html" else request.output_format
+        output_filename = f"{task_id}.{output_ext}"
         output_path = OUTPUT_DIR / output_filename
         
-        # 출력 경로 검증
-        try:
-            output_path_str = str(output_path)
-            if not output_path_str or output_path_str.strip() == '':
-                raise ValueError("출력 경로가 비어있습니다.")
-            
-            # 출력 디렉토리 생성 확인
-            output_dir = output_path.parent
-            output_dir.mkdir(exist_ok=True)
-            logger.info(f"출력 디렉토리 확인/생성: {output_dir}")
-            
-        except Exception as e:
-            logger.error(f"출력 경로 설정 실패: {str(e)}")
-            raise Exception(f"출력 경로 설정 실패: {str(e)}")
-        
         # 단일 시트 변환
         success = await _convert_single_sheet_internal(
-            file_path, str(output_path), request.sheet_name, request
+            file_path, str(output_path), request.sheet_name, request, file_hash=file_hash
         )
         
         if success:
             # 성공 상태 업데이트
-            TASKS[task_id]["status"] = "completed"
-            TASKS[task_id]["progress"] = 100
-            TASKS[task_id]["message"] = "변환 완료"
-            TASKS[task_id]["completed_at"] = datetime.now()
-            TASKS[task_id]["output_file"] = output_filename
+            TASKS.update(
+                task_id,
+                status="completed",
+                progress=100,
+                message="변환 완료",
+                completed_at=datetime.now(),
+                output_file=output_filename,
+            )
             logger.info(f"작업 {task_id} 완료: {output_filename}")
         else:
             raise Exception("이미지 변환에 실패했습니다.")
             
     except Exception as e:
         logger.error(f"단일 시트 변환 작업 {task_id} 실패: {str(e)}")
-        TASKS[task_id]["status"] = "failed"
-        TASKS[task_id]["progress"] = 0
-        TASKS[task_id]["message"] = f"오류 발생: {str(e)}"
-        TASKS[task_id]["completed_at"] = datetime.now()
-        TASKS[task_id]["error"] = str(e)
+        TASKS.update(
+            task_id,
+            status="failed",
+            progress=0,
+            message=f"오류 발생: {str(e)}",
+            completed_at=datetime.now(),
+            error=str(e),
+        )
 
 
-async def _convert_single_sheet_internal(file_path: str, output_path: str, sheet_name: str, request: ConversionRequest) -> bool:
-    """단일 시트 변환의 내부 로직"""
-    parser = None
+async def _convert_single_sheet_internal(file_path: str, output_path: str, sheet_name: str,
+                                         request: ConversionRequest, parser: Optional[ExcelParser] = None,
+                                         file_hash: Optional[str] = None,
+                                         parser_lock: Optional[asyncio.Lock] = None) -> bool:
+    """
+    단일 시트 변환의 내부 로직
+    
+    parser가 주어지면 파일을 다시 로드하지 않고 그 파서의 워크북과 수식 계산값을 사용합니다.
+    워크북은 스레드 간 동시 접근이 안전하지 않으므로 여러 시트가 공유할 때는
+    parser_lock으로 파싱을 한 번에 하나씩만 실행합니다.
+    file_hash가 주어지면 동일한 (파일, 시트, 범위)의 HTML 캐시를 사용하고,
+    이미지는 convert_html_to_image_async가 HTML 내용 기준으로 캐시합니다.
+    """
     try:
-        # 1. Excel 파싱
-        parser = ExcelParser(file_path)
-        sheet_data = parser.parse_sheet(
-            sheet_name=sheet_name,
-            sheet_index=request.sheet_index,
-            range_start=request.range_start,
-            range_end=request.range_end,
-        )
-
-        # 2. HTML 렌더링
-        renderer = HTMLRenderer()
-        html_content = renderer.render_sheet(sheet_data)
+        html_key = None
+        is_html = request.type.lower() == "html"
+        if file_hash:
+            html_key = make_cache_key(
+                file_hash, sheet_name, request.sheet_index, request.range_start, request.range_end,
+                request.fast_mode,
+            )
+        
+        html_content = None
+        if html_key:
+            html_content = await asyncio.to_thread(RENDER_CACHE.get_text, html_key)
+        
+        if html_content is None:
+            # 1~2. Excel 파싱 및 HTML 렌더링 (이벤트 루프를 막지 않도록 실행기에서 처리)
+            loop = asyncio.get_running_loop()
+            async with parser_lock or asyncio.Lock():
+                html_content = await loop.run_in_executor(
+                    PARSE_EXECUTOR,
+                    _parse_and_render,
+                    file_path,
+                    sheet_name,
+                    request.sheet_index,
+                    request.range_start,
+                    request.range_end,
+                    parser,
+                    request.fast_mode,
+                )
+            
+            if html_key:
+                await asyncio.to_thread(RENDER_CACHE.put_text, html_key, html_content)
 
         # 3. type 파라미터에 따라 처리
-        if request.type.lower() == "html":
+        if is_html:
             # HTML만 생성
             try:
                 # HTML 파일로 저장
-                html_output_path = output_path.replace(f".{request.output_format}", ".html")
-                with open(html_output_path, "w", encoding="utf-8") as f:
-                    f.write(html_content)
+                html_output_path = str(Path(output_path).with_suffix(".html"))
+                await asyncio.to_thread(_write_text_file, html_output_path, html_content)
                 logger.info(f"HTML 파일 생성 완료: {html_output_path}")
                 return True
             except Exception as e:
@@ -420,24 +521,181 @@ async def _convert_single_sheet_internal(file_path: str, output_path: str, sheet
                 return False
         else:
             # 이미지 변환 (기본값)
-            success = await convert_html_to_image_async(
+            # 이미지 캐시는 HTML 내용 기준 한 곳에서만 관리 (HTML 캐시 적중 시 파싱도 생략되므로
+            # 같은 파일의 재요청은 캐시 읽기만으로 끝나고, 시트 HTML이 같은 다른 파일도 재사용됨)
+            return await convert_html_to_image_async(
                 html_content,
                 output_path,
                 image_format=request.output_format,
                 quality=request.quality,
                 width=request.width,
                 height=request.height,
+                cache=RENDER_CACHE,
             )
-            return success
         
     except Exception as e:
         logger.error(f"단일 시트 변환 내부 오류: {str(e)}")
         return False
+
+
+def _parse_and_render(file_path: str, sheet_name: Optional[str], sheet_index: Optional[int],
+                      range_start: Optional[str], range_end: Optional[str],
+                      parser: Optional[ExcelParser] = None, fast_mode: bool = False) -> str:
+    """
+    Excel 시트를 파싱하고 HTML로 렌더링합니다. (PARSE_EXECUTOR에서 실행되는 동기 함수)
+    
+    Args:
+        file_path: Excel 파일 경로
+        sheet_name: 시트 이름
+        sheet_index: 시트 인덱스
+        range_start: 시작 셀
+        range_end: 끝 셀
+        parser: 여러 시트가 공유하는 파서 (지정 시 워크북과 수식 계산값을 재사용하고 닫지 않음)
+        fast_mode: 값만 읽기 전용 모드로 추출할지 여부
+        
+    Returns:
+        str: 렌더링된 HTML
+    """
+    owns_parser = parser is None
+    if owns_parser:
+        parser = ExcelParser(file_path, fast_mode=fast_mode)
+    try:
+        sheet_data = parser.parse_sheet(
+            sheet_name=sheet_name,
+            sheet_index=sheet_index,
+            range_start=range_start,
+            range_end=range_end,
+        )
+        return RENDERER.render_sheet(sheet_data)
     finally:
-        if parser:
+        if owns_parser:
             parser.close()
 
 
+async def _save_upload_file(file: UploadFile, file_path: Path) -> str:
+    """
+    업로드 파일을 청크 단위로 디스크에 저장합니다.
+    
+    전체 파일을 메모리에 올리지 않고 UPLOAD_CHUNK_SIZE씩 기록하며,
+    크기 제한 검사와 SHA-256 해시 계산도 기록하면서 수행합니다.
+    
+    Args:
+        file: 업로드된 파일
+        file_path: 저장할 경로
+        
+    Returns:
+        str: 파일 내용의 SHA-256 해시 (렌더링 캐시 키로 사용)
+        
+    Raises:
+        HTTPException: 파일 크기가 MAX_UPLOAD_SIZE를 초과한 경우 (413)
+    """
+    bytes_written = 0
+    file_hash = hashlib.sha256()
+    buffer = await asyncio.to_thread(open, file_path, "wb")
+    try:
+        while True:
+            chunk = await file.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            
+            bytes_written += len(chunk)
+            if bytes_written > MAX_UPLOAD_SIZE:
+                raise HTTPException(
+                    status_code=413, detail="파일 크기는 100MB를 초과할 수 없습니다."
+                )
+            
+            file_hash.update(chunk)
+            await asyncio.to_thread(buffer.write, chunk)
+    except Exception:
+        # 저장 실패 시 부분 파일 삭제
+        await asyncio.to_thread(buffer.close)
+        await asyncio.to_thread(_remove_files, [file_path])
+        raise
+    else:
+        await asyncio.to_thread(buffer.close)
+    
+    return file_hash.hexdigest()
+
+
+def _write_text_file(path: str, content: str):
+    """텍스트 파일을 UTF-8로 저장합니다. (스레드에서 실행)"""
+    # 한 번에 인코딩하여 바이너리로 기록 (텍스트 래퍼 버퍼링 생략)
+    Path(path).write_bytes(content.encode("utf-8"))
+
+
+def _remove_files(paths: List[Path]):
+    """존재하는 파일만 삭제합니다. (스레드에서 실행)"""
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _task_files(task: Dict[str, Any]) -> List[Path]:
+    """작업의 업로드 파일과 출력 파일 경로를 반환합니다."""
+    paths = []
+    if task.get("file_path"):
+        paths.append(Path(task["file_path"]))
+    if task.get("output_file"):
+        paths.extend(OUTPUT_DIR / name.strip() for name in task["output_file"].split(","))
+    return paths
+
+
+def _remove_task_files(tasks: Iterable[Dict[str, Any]]):
+    """작업들의 업로드/출력 파일을 삭제합니다. (스레드에서 실행)"""
+    for task in tasks:
+        _remove_files(_task_files(task))
+
+
+def _public_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """작업 정보에서 응답에 노출되는 필드만 추출합니다."""
+    return {field: task.get(field) for field in PUBLIC_TASK_FIELDS}
+
+
+def _dump_json(content: Any) -> bytes:
+    """값 하나를 JSON 바이트로 직렬화합니다. (orjson이 없으면 표준 json 사용)"""
+    if HAS_ORJSON:
+        return orjson.dumps(content)
+    return json.dumps(jsonable_encoder(content), ensure_ascii=False).encode("utf-8")
+
+
+def _iter_tasks_json(tasks: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """
+    작업 목록을 JSON 배열로 조금씩 직렬화합니다.
+    
+    전체 응답 목록/본문을 메모리에 만들지 않고 TASKS_STREAM_CHUNK개 단위로 내보냅니다.
+    
+    Args:
+        tasks (Iterable[Dict[str, Any]]): 작업 정보
+        
+    Returns:
+        Iterator[bytes]: JSON 배열 조각
+    """
+    yield b"["
+    first = True
+    chunk: List[bytes] = []
+    for task in tasks:
+        chunk.append(_dump_json(_public_task(task)))
+        if len(chunk) >= TASKS_STREAM_CHUNK:
+            yield (b"" if first else b",") + b",".join(chunk)
+            first = False
+            chunk = []
+    if chunk:
+        yield (b"" if first else b",") + b",".join(chunk)
+    yield b"]"
+
+
+def _json_response(content: Any) -> JSONResponse:
+    """
+    서버가 직접 생성한 데이터를 응답 모델 검증 없이 JSON 응답으로 만듭니다.
+    
+    response_model은 문서화(OpenAPI)에만 사용하고 재검증은 생략하며,
+    orjson이 없으면 datetime 변환만 jsonable_encoder로 처리합니다.
+    """
+    if HAS_ORJSON:
+        return DefaultJSONResponse(content=content)
+    return JSONResponse(content=jsonable_encoder(content))
+
+
 @app.get("/", response_model=APIInfo)
 async def get_api_info():
     """
@@ -476,6 +734,7 @@ async def upload_and_convert(
     width: Optional[int] = None,
     height: Optional[int] = None,
     type: str = "image",
+    fast_mode: bool = False,
 ):
     """
     Excel 파일 업로드 및 변환 시작
@@ -525,6 +784,7 @@ async def upload_and_convert(
         width: 강제 이미지 너비 (픽셀)
         height: 강제 이미지 높이 (픽셀)
         type: 출력 타입 ("image" 또는 "html", 기본값: "image")
+        fast_mode: 스타일/병합 셀/행열 크기 없이 값만 빠르게 변환 (기본값: False)
         
     Returns:
         ConversionResponse: 변환 작업 정보
@@ -538,10 +798,10 @@ async def upload_and_convert(
             status_code=400, detail="Excel 파일(.xlsx, .xls)만 업로드 가능합니다."
         )
 
-    # 파일 크기 검증 (100MB 제한)
-    if file.size > 100 * 1024 * 1024:
+    # 파일 크기 검증 (100MB 제한, 크기를 알 수 있는 경우 조기 거부)
+    if file.size is not None and file.size > MAX_UPLOAD_SIZE:
         raise HTTPException(
-            status_code=400, detail="파일 크기는 100MB를 초과할 수 없습니다."
+            status_code=413, detail="파일 크기는 100MB를 초과할 수 없습니다."
         )
 
     # 출력 형식 검증
@@ -562,11 +822,9 @@ async def upload_and_convert(
         # 고유 작업 ID 생성
         task_id = str(uuid.uuid4())
 
-        # 파일 저장
+        # 파일 저장 (청크 단위 스트리밍)
         file_path = UPLOAD_DIR / f"{task_id}_{file.filename}"
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        file_hash = await _save_upload_file(file, file_path)
 
         # 변환 요청 객체 생성
         request = ConversionRequest(
@@ -579,10 +837,11 @@ async def upload_and_convert(
             width=width,
             height=height,
             type=type,
+            fast_mode=fast_mode,
         )
 
         # 작업 정보 저장
-        TASKS[task_id] = {
+        task = {
             "task_id": task_id,
             "status": "pending",
             "progress": 0,
@@ -592,23 +851,27 @@ async def upload_and_convert(
             "output_file": None,
             "error": None,
             "file_path": str(file_path),
-            "request": request.dict(),
+            "request": asdict(request),
         }
+        # 용량 초과 시 제거되는 작업의 파일 삭제가 이벤트 루프를 막지 않도록 스레드에서 등록
+        await asyncio.to_thread(TASKS.set, task_id, task)
 
         # 백그라운드 작업 시작
         background_tasks.add_task(
-            convert_excel_to_image_task, task_id, str(file_path), request
+            convert_excel_to_image_task, task_id, str(file_path), request, file_hash
         )
 
         logger.info(f"새로운 변환 작업 시작: {task_id}")
 
-        return ConversionResponse(
-            task_id=task_id,
-            status="pending",
-            message="변환 작업이 시작되었습니다.",
-            created_at=TASKS[task_id]["created_at"],
-        )
+        return _json_response({
+            "task_id": task_id,
+            "status": "pending",
+            "message": "변환 작업이 시작되었습니다.",
+            "created_at": task["created_at"],
+        })
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"파일 업로드 실패: {str(e)}")
         raise HTTPException(
@@ -655,11 +918,12 @@ async def get_task_status(task_id: str):
     Raises:
         HTTPException: 작업을 찾을 수 없는 경우
     """
-    if task_id not in TASKS:
+    task = TASKS.get(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
 
-    task = TASKS[task_id]
-    return TaskStatus(**task)
+    # TaskStatus 모델 검증 없이 공개 필드만 바로 직렬화
+    return _json_response(_public_task(task))
 
 
 @app.get("/download/{task_id}")
@@ -700,11 +964,10 @@ async def download_result(task_id: str):
     Raises:
         HTTPException: 작업을 찾을 수 없거나 완료되지 않은 경우
     """
-    if task_id not in TASKS:
+    task = TASKS.get(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
 
-    task = TASKS[task_id]
-
     if task["status"] != "completed":
         raise HTTPException(status_code=400, detail="변환이 완료되지 않았습니다.")
 
@@ -720,13 +983,19 @@ async def download_result(task_id: str):
     first_output_file = output_files[0]
     file_path = OUTPUT_DIR / first_output_file
 
-    if not file_path.exists():
+    # stat 결과를 함께 넘겨 FileResponse가 다시 stat 하지 않도록 함
+    try:
+        stat_result = await asyncio.to_thread(os.stat, file_path)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="출력 파일이 존재하지 않습니다.")
 
+    # 서버가 http.response.pathsend 확장을 지원하면 Starlette가 경로만 넘겨 sendfile로 전송
     return FileResponse(
         path=file_path,
         filename=first_output_file,
         media_type="application/octet-stream",
+        stat_result=stat_result,
+        method="GET",
     )
 
 
@@ -775,7 +1044,9 @@ async def get_all_tasks():
     Returns:
         List[TaskStatus]: 모든 작업 상태 목록
     """
-    return [TaskStatus(**task) for task in TASKS.values()]
+    # Pydantic 모델 검증 없이 원본 dict를 조금씩 직렬화하여 스트리밍
+    # (레지스트리 락은 스냅샷을 뜰 때만 잡고, 동기 제너레이터는 스레드 풀에서 순회됨)
+    return StreamingResponse(_iter_tasks_json(TASKS.snapshot()), media_type="application/json")
 
 
 @app.delete("/tasks/{task_id}")
@@ -813,26 +1084,16 @@ async def delete_task(task_id: str):
     Raises:
         HTTPException: 작업을 찾을 수 없는 경우
     """
-    if task_id not in TASKS:
+    task = TASKS.get(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
 
-    task = TASKS[task_id]
-
     try:
-        # 업로드된 파일 삭제
-        if "file_path" in task and os.path.exists(task["file_path"]):
-            os.remove(task["file_path"])
-
-        # 출력 파일 삭제
-        if task["output_file"]:
-            output_files = task["output_file"].split(",")
-            for output_file in output_files:
-                output_path = OUTPUT_DIR / output_file
-                if output_path.exists():
-                    output_path.unlink()
+        # 업로드된 파일과 출력 파일을 이벤트 루프 밖에서 삭제
+        await asyncio.to_thread(_remove_files, _task_files(task))
 
         # 작업 정보 삭제
-        del TASKS[task_id]
+        TASKS.delete(task_id)
 
         logger.info(f"작업 {task_id} 삭제 완료")
 
@@ -876,29 +1137,19 @@ async def health_check():
 
 
 if __name__ == "__main__":
-    # Windows 이벤트 루프 정책 최종 확인
-    import platform
-    if platform.system() == 'Windows':
-        try:
-            current_policy = asyncio.get_event_loop_policy()
-            if not isinstance(current_policy, asyncio.WindowsProactorEventLoopPolicy):
-                asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-                logger.info("서버 시작 시 Windows 이벤트 루프 정책 최종 설정 완료")
-            else:
-                logger.info("Windows 이벤트 루프 정책이 올바르게 설정되어 있습니다.")
-        except Exception as e:
-            logger.warning(f"서버 시작 시 Windows 이벤트 루프 정책 설정 실패: {e}")
-    
-    # Playwright 브라우저 설치 확인
-    try:
-        check_and_install_playwright_browsers()
-    except Exception as e:
-        logger.error(f"Playwright 브라우저 설정 실패: {e}")
-        logger.error("API 서버를 시작할 수 없습니다.")
-        exit(1)
-    
+    # Windows 이벤트 루프 정책은 모듈 상단에서 이미 설정됨
     logger.info("Excel to Image Converter API 서버를 시작합니다...")
     logger.info(f"서버 주소: http://0.0.0.0:8000")
     logger.info(f"API 문서: http://0.0.0.0:8000/docs")
     
-    uvicorn.run("api:app", host="0.0.0.0", port=8000, reload=True, log_level="info")
+    # Linux/macOS에서는 uvloop이 설치되어 있으면 사용 (Windows는 ProactorEventLoop 유지)
+    loop = "asyncio"
+    if not sys.platform.startswith('win'):
+        try:
+            import uvloop  # noqa: F401
+            loop = "uvloop"
+        except ImportError:
+            logger.info("uvloop이 설치되어 있지 않아 기본 asyncio 이벤트 루프를 사용합니다.")
+    
+    # 자동 재시작(reload)은 감시 서브프로세스를 띄우므로 사용하지 않음 (개발 시 uvicorn --reload 사용)
+    uvicorn.run("api:app", host="0.0.0.0", port=8000, loop=loop, log_level="info")
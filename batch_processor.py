@@ -5,118 +5,205 @@ Batch Processor Module
 여러 Excel 파일을 효율적으로 처리하고 실시간 진행률을 제공합니다.
 """
 
+import sys
+import os
 import asyncio
+import functools
+import itertools
 import logging
+import json
 import time
-import platform
+from collections import Counter
 from typing import List, Dict, Any, Optional, Callable
 from pathlib import Path
+from dataclasses import dataclass, asdict
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
-import threading
 
 from excel_parser import ExcelParser
 from html_renderer import HTMLRenderer
-from image_converter import ImageConverter
+from image_converter import convert_html_to_image_async, close_screenshot_batcher
+from browser_pool import start_browser_pool, close_browser_pools
 
 logger = logging.getLogger(__name__)
 
+# 배치 처리 대상 Excel 확장자
+EXCEL_EXTENSIONS = ('.xlsx', '.xls')
+
+# 이벤트 루프 정책 설정 여부 (프로세스당 한 번만 설정)
+_POLICY_SET = False
+
+
+def configure_event_loop_policy():
+    """Windows에서 ProactorEventLoop 정책을 한 번만 설정합니다. (Playwright 서브프로세스 지원)"""
+    global _POLICY_SET
+    if _POLICY_SET:
+        return
+    _POLICY_SET = True
+    if sys.platform.startswith('win'):
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+
+configure_event_loop_policy()
+
+
 class ProgressCallback:
     """진행률 콜백 클래스"""
     
+    # 진행률 로그 출력 간격 (완료 파일 수 / 초)
+    LOG_EVERY_FILES = 16
+    LOG_INTERVAL_SECONDS = 1.0
+    
     def __init__(self, total_files: int):
         self.total_files = total_files
         self.completed_files = 0
         self.failed_files = 0
         self.current_file = ""
         self.start_time = time.time()
-        self.lock = threading.Lock()
+        self._last_log_time = 0.0
+        # 락 없이 증가시키는 카운터 (next()는 C 수준에서 원자적으로 동작)
+        self._completed = itertools.count(1)
+        self._failed = itertools.count(1)
     
     def update(self, file_name: str, status: str, progress: int = 0):
         """진행률 업데이트"""
-        with self.lock:
-            self.current_file = file_name
-            if status == "completed":
-                self.completed_files += 1
-            elif status == "failed":
-                self.failed_files += 1
-            
-            elapsed_time = time.time() - self.start_time
-            if self.completed_files + self.failed_files > 0:
-                avg_time_per_file = elapsed_time / (self.completed_files + self.failed_files)
-                remaining_files = self.total_files - (self.completed_files + self.failed_files)
-                estimated_remaining_time = remaining_files * avg_time_per_file
-            else:
-                estimated_remaining_time = 0
-            
-            logger.info(
-                f"진행률: {self.completed_files + self.failed_files}/{self.total_files} "
-                f"({((self.completed_files + self.failed_files) / self.total_files * 100):.1f}%) "
-                f"| 현재: {file_name} | 상태: {status} | "
-                f"예상 남은 시간: {estimated_remaining_time:.1f}초"
-            )
+        self.current_file = file_name
+        if status in ("completed", "skipped"):
+            self.completed_files = next(self._completed)
+        elif status == "failed":
+            self.failed_files = next(self._failed)
+        else:
+            # 중간 단계(started/parsing/rendering)는 로그를 남기지 않음
+            return
+        
+        # 일정 파일 수 또는 일정 시간마다, 그리고 마지막 파일에서만 로그 출력
+        done = self.completed_files + self.failed_files
+        now = time.time()
+        if (done % self.LOG_EVERY_FILES != 0 and done < self.total_files
+                and now - self._last_log_time < self.LOG_INTERVAL_SECONDS):
+            return
+        self._last_log_time = now
+        
+        elapsed_time = now - self.start_time
+        avg_time_per_file = elapsed_time / done
+        estimated_remaining_time = (self.total_files - done) * avg_time_per_file
+        
+        logger.info(
+            f"진행률: {done}/{self.total_files} "
+            f"({(done / self.total_files * 100):.1f}%) "
+            f"| 현재: {file_name} | 상태: {status} | "
+            f"예상 남은 시간: {estimated_remaining_time:.1f}초"
+        )
     
     def get_summary(self) -> Dict[str, Any]:
         """진행률 요약 반환"""
-        with self.lock:
-            total_processed = self.completed_files + self.failed_files
-            success_rate = (self.completed_files / self.total_files * 100) if self.total_files > 0 else 0
-            elapsed_time = time.time() - self.start_time
-            
-            return {
-                "total_files": self.total_files,
-                "completed_files": self.completed_files,
-                "failed_files": self.failed_files,
-                "success_rate": success_rate,
-                "elapsed_time": elapsed_time,
-                "current_file": self.current_file
-            }
+        success_rate = (self.completed_files / self.total_files * 100) if self.total_files > 0 else 0
+        elapsed_time = time.time() - self.start_time
+        
+        return {
+            "total_files": self.total_files,
+            "completed_files": self.completed_files,
+            "failed_files": self.failed_files,
+            "success_rate": success_rate,
+            "elapsed_time": elapsed_time,
+            "current_file": self.current_file
+        }
+
+@dataclass(slots=True)
+class FileResult:
+    """파일 하나의 처리 결과 (대량 배치에서 dict보다 적은 메모리 사용)"""
+    
+    file_path: str
+    file_name: str
+    status: str = "processing"
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    duration: float = 0.0
+    error: Optional[str] = None
+    output_file: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """기존 dict 형식으로 변환합니다."""
+        return asdict(self)
+
 
 class BatchProcessor:
     """배치 처리 클래스"""
     
-    def __init__(self, max_workers: int = 3, output_dir: str = "outputs"):
+    def __init__(self, max_workers: int = 3, output_dir: str = "outputs",
+                 results_path: Optional[str] = None, read_only: bool = False):
         """
         BatchProcessor 초기화
         
         Args:
             max_workers (int): 최대 동시 처리 작업 수
             output_dir (str): 출력 디렉토리
+            results_path (str, optional): 결과를 JSON Lines로 기록할 파일 경로
+                (지정 시 결과를 메모리에 보관하지 않음)
+            read_only (bool): 읽기 전용 모드로 파싱 (대용량 파일용, 병합 셀/행열 크기 제외)
         """
         self.max_workers = max_workers
+        self.read_only = read_only
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
+        # 출력 디렉토리는 여기서 한 번만 생성 (파일마다 확인하지 않음)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # 공유 리소스
-        self.parser = ExcelParser()
+        # 공유 리소스 (브라우저는 전역 브라우저 풀을 배치 전체에서 재사용)
         self.renderer = HTMLRenderer()
-        self.converter = None
+        
+        # 파싱/렌더링/이미지 후처리 같은 동기 작업을 이벤트 루프 밖에서 실행하는 스레드 풀
+        # (기본 실행기 대신 max_workers로 제한하여 스레드 수가 늘어나지 않도록 함)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='batch-worker')
+        # HTML 렌더링은 GIL을 계속 잡는 순수 파이썬 작업이므로 전용 스레드 하나에서 순서대로 처리
+        # (파싱/이미지 저장 스레드와 GIL을 두고 경쟁하지 않고, 스크린샷 대기와는 겹쳐 실행됨)
+        self._render_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='batch-render')
         
         # 결과 저장
-        self.results: List[Dict[str, Any]] = []
-        self.lock = threading.Lock()
+        self.results: List[FileResult] = []
+        self.results_path = results_path
+        self._results_fp = None
+        
+        # 결과를 보관하지 않아도 통계를 낼 수 있도록 누적 집계
+        self._status_counts: Counter = Counter()
+        self._total_duration = 0.0
     
     async def initialize(self):
-        """초기화"""
-        # Windows에서 asyncio 이벤트 루프 문제 해결
-        if platform.system() == 'Windows':
-            try:
-                # Windows에서 ProactorEventLoop 사용
-                if isinstance(asyncio.get_event_loop_policy(), asyncio.WindowsProactorEventLoopPolicy):
-                    pass  # 이미 ProactorEventLoop 사용 중
-                else:
-                    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-                logger.info("Windows 이벤트 루프 정책 설정 완료")
-            except Exception as e:
-                logger.warning(f"Windows 이벤트 루프 정책 설정 실패: {e}")
-        
-        self.converter = ImageConverter()
-        await self.converter.initialize()
+        """초기화 (브라우저 풀을 미리 실행)"""
+        try:
+            await start_browser_pool()
+        except Exception as e:
+            # 사전 실행 실패 시 첫 변환에서 지연 실행
+            logger.warning(f"브라우저 풀 사전 실행 실패: {e}")
     
     async def close(self):
         """리소스 정리"""
-        if self.converter:
-            await self.converter.close()
+        await close_screenshot_batcher()
+        await close_browser_pools()
+        self._pool.shutdown(wait=False)
+        self._render_pool.shutdown(wait=False)
+    
+    @staticmethod
+    def _is_up_to_date(file_path: Path, output_path: Path) -> bool:
+        """출력 파일이 입력 파일보다 새로운지 확인합니다. (스레드에서 실행)"""
+        try:
+            return output_path.stat().st_mtime >= file_path.stat().st_mtime
+        except FileNotFoundError:
+            return False
+    
+    @staticmethod
+    def _parse_file(file_path: Path, sheet_name: Optional[str] = None,
+                    range_start: Optional[str] = None, range_end: Optional[str] = None,
+                    read_only: bool = False) -> Dict[str, Any]:
+        """Excel 파일을 파싱합니다. (스레드 풀에서 실행)"""
+        parser = ExcelParser(str(file_path), read_only=read_only)
+        try:
+            return parser.parse_sheet(
+                sheet_name=sheet_name,
+                range_start=range_start,
+                range_end=range_end
+            )
+        finally:
+            parser.close()
     
     async def process_single_file(
         self, 
@@ -127,65 +214,76 @@ class BatchProcessor:
         range_start: Optional[str] = None,
         range_end: Optional[str] = None,
         type: str = "image",
-        progress_callback: Optional[ProgressCallback] = None
-    ) -> Dict[str, Any]:
-        """단일 파일 처리"""
-        result = {
-            "file_path": str(file_path),
-            "file_name": file_path.name,
-            "status": "processing",
-            "start_time": datetime.now(),
-            "end_time": None,
-            "error": None,
-            "output_file": None
-        }
+        progress_callback: Optional[ProgressCallback] = None,
+        skip_existing: bool = False
+    ) -> FileResult:
+        """
+        단일 파일 처리
+        
+        skip_existing=True이고 출력 파일이 입력 파일보다 새로우면 변환하지 않고 "skipped"로 반환합니다.
+        (출력 파일 이름에 시트/범위/품질 옵션이 반영되지 않으므로 기본값은 항상 다시 변환)
+        """
+        # 소요 시간은 단조 시계로 측정 (start_time/end_time은 표시용)
+        started = time.perf_counter()
+        file_name = file_path.name
+        file_stem = file_path.stem
+        result = FileResult(
+            file_path=str(file_path),
+            file_name=file_name,
+            start_time=datetime.now()
+        )
         
         try:
+            is_html = type.lower() == "html"
+            output_filename = f"{file_stem}.html" if is_html else f"{file_stem}.{output_format}"
+            output_path = self.output_dir / output_filename
+            
+            # 이미 변환된 결과가 최신이면 파싱/렌더링/변환 생략
+            if skip_existing and await asyncio.to_thread(self._is_up_to_date, file_path, output_path):
+                result.status = "skipped"
+                result.output_file = output_filename
+                if progress_callback:
+                    progress_callback.update(file_name, "skipped", 100)
+                logger.info(f"이미 변환된 파일 건너뜀: {output_path}")
+                return result
+            
             if progress_callback:
-                progress_callback.update(file_path.name, "started", 10)
+                progress_callback.update(file_name, "started", 10)
+            
+            loop = asyncio.get_running_loop()
             
             # 1. Excel 파싱
-            sheet_data = self.parser.parse_sheet(
-                str(file_path),
-                sheet_name=sheet_name,
-                range_start=range_start,
-                range_end=range_end
+            sheet_data = await loop.run_in_executor(
+                self._pool,
+                functools.partial(
+                    self._parse_file,
+                    file_path,
+                    sheet_name=sheet_name,
+                    range_start=range_start,
+                    range_end=range_end,
+                    read_only=self.read_only
+                )
             )
             
             if progress_callback:
-                progress_callback.update(file_path.name, "parsing", 30)
+                progress_callback.update(file_name, "parsing", 30)
             
             # 2. HTML 렌더링
-            html_content = self.renderer.render_sheet(sheet_data)
+            html_content = await loop.run_in_executor(
+                self._render_pool, self.renderer.render_sheet, sheet_data
+            )
             
             if progress_callback:
-                progress_callback.update(file_path.name, "rendering", 50)
+                progress_callback.update(file_name, "rendering", 50)
             
             # 3. type 파라미터에 따라 처리
-            if type.lower() == "html":
-                # HTML만 생성
-                output_filename = f"{file_path.stem}.html"
-                output_path = self.output_dir / output_filename
-                
-                # 출력 경로 검증
+            if is_html:
+                # HTML 파일로 저장 (이벤트 루프를 막지 않도록 스레드에서 기록)
                 try:
-                    output_path_str = str(output_path)
-                    if not output_path_str or output_path_str.strip() == '':
-                        raise ValueError("출력 경로가 비어있습니다.")
-                    
-                    # 출력 디렉토리 생성 확인
-                    output_dir = output_path.parent
-                    output_dir.mkdir(exist_ok=True)
-                    logger.info(f"출력 디렉토리 확인/생성: {output_dir}")
-                    
-                except Exception as e:
-                    logger.error(f"출력 경로 설정 실패: {str(e)}")
-                    raise Exception(f"출력 경로 설정 실패: {str(e)}")
-                
-                # HTML 파일로 저장
-                try:
-                    with open(output_path, "w", encoding="utf-8") as f:
-                        f.write(html_content)
+                    # 한 번에 인코딩하여 바이너리로 기록 (텍스트 래퍼 버퍼링 생략)
+                    await asyncio.to_thread(
+                        output_path.write_bytes, html_content.encode("utf-8")
+                    )
                     success = True
                     logger.info(f"HTML 파일 생성 완료: {output_path}")
                 except Exception as e:
@@ -193,55 +291,36 @@ class BatchProcessor:
                     success = False
             else:
                 # 이미지 변환 (기본값)
-                output_filename = f"{file_path.stem}.{output_format}"
-                output_path = self.output_dir / output_filename
-                
-                # 출력 경로 검증
-                try:
-                    output_path_str = str(output_path)
-                    if not output_path_str or output_path_str.strip() == '':
-                        raise ValueError("출력 경로가 비어있습니다.")
-                    
-                    # 출력 디렉토리 생성 확인
-                    output_dir = output_path.parent
-                    output_dir.mkdir(exist_ok=True)
-                    logger.info(f"출력 디렉토리 확인/생성: {output_dir}")
-                    
-                except Exception as e:
-                    logger.error(f"출력 경로 설정 실패: {str(e)}")
-                    raise Exception(f"출력 경로 설정 실패: {str(e)}")
-                
-                success = await self.converter.convert_html_to_image(
+                # 스크린샷 큐에 제출: 다른 워커가 파싱/렌더링하는 동안 Chromium은 대기 중인 작업을 계속 처리
+                success = await convert_html_to_image_async(
                     html_content,
                     str(output_path),
                     image_format=output_format,
-                    quality=quality
+                    quality=quality,
+                    executor=self._pool
                 )
             
             if success:
-                result["status"] = "completed"
-                result["output_file"] = output_filename
+                result.status = "completed"
+                result.output_file = output_filename
                 if progress_callback:
-                    progress_callback.update(file_path.name, "completed", 100)
+                    progress_callback.update(file_name, "completed", 100)
             else:
-                result["status"] = "failed"
-                result["error"] = "이미지 변환 실패"
+                result.status = "failed"
+                result.error = "이미지 변환 실패"
                 if progress_callback:
-                    progress_callback.update(file_path.name, "failed", 0)
+                    progress_callback.update(file_name, "failed", 0)
             
         except Exception as e:
-            result["status"] = "failed"
-            result["error"] = str(e)
+            result.status = "failed"
+            result.error = str(e)
             if progress_callback:
-                progress_callback.update(file_path.name, "failed", 0)
+                progress_callback.update(file_name, "failed", 0)
             logger.error(f"파일 처리 실패 {file_path}: {str(e)}")
         
         finally:
-            result["end_time"] = datetime.now()
-            result["duration"] = (result["end_time"] - result["start_time"]).total_seconds()
-            
-            with self.lock:
-                self.results.append(result)
+            result.end_time = datetime.now()
+            result.duration = time.perf_counter() - started
         
         return result
     
@@ -254,8 +333,10 @@ class BatchProcessor:
         range_start: Optional[str] = None,
         range_end: Optional[str] = None,
         type: str = "image",
-        progress_callback: Optional[Callable] = None
-    ) -> List[Dict[str, Any]]:
+        progress_callback: Optional[Callable] = None,
+        result_callback: Optional[Callable[[FileResult], None]] = None,
+        skip_existing: bool = False
+    ) -> List[FileResult]:
         """
         배치 처리 실행
         
@@ -267,9 +348,11 @@ class BatchProcessor:
             range_start: 범위 시작
             range_end: 범위 끝
             progress_callback: 진행률 콜백 함수
+            result_callback: 파일 하나가 끝날 때마다 결과를 받는 콜백 (완료 순서대로 호출)
+            skip_existing: 출력 파일이 입력 파일보다 새로우면 변환하지 않고 건너뛸지 여부
             
         Returns:
-            처리 결과 리스트
+            처리 결과 리스트 (입력 순서, results_path 지정 시 빈 리스트)
         """
         if not file_paths:
             return []
@@ -281,80 +364,115 @@ class BatchProcessor:
         logger.info(f"배치 처리 시작: {len(file_paths)}개 파일")
         
         try:
-            await self.initialize()
+            # HTML만 생성하는 배치는 브라우저가 필요 없으므로 실행하지 않음
+            if type.lower() != "html":
+                await self.initialize()
             
-            # 세마포어로 동시 처리 수 제한
-            semaphore = asyncio.Semaphore(self.max_workers)
-            
-            async def process_with_semaphore(file_path):
-                async with semaphore:
-                    return await self.process_single_file(
-                        file_path,
-                        output_format,
-                        quality,
-                        sheet_name,
-                        range_start,
-                        range_end,
-                        type,
-                        progress_callback
-                    )
-            
-            # 모든 작업 생성
-            tasks = [
-                process_with_semaphore(file_path) 
-                for file_path in file_paths
-            ]
+            # max_workers개의 워커가 파일 목록을 순서대로 나눠 처리
+            # (파일마다 코루틴을 미리 만들지 않으므로 대기 중인 작업 수가 O(max_workers))
+            # results_path가 지정되면 결과를 파일로만 기록하고 메모리에 보관하지 않음
+            if self.results_path:
+                self._results_fp = open(self.results_path, "w", encoding="utf-8")
+            processed_results: List[Optional[FileResult]] = (
+                [] if self._results_fp else [None] * len(file_paths)
+            )
+            pending = enumerate(file_paths)
             
-            # 동시 실행
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            async def worker():
+                # 단일 이벤트 루프에서 실행되므로 공유 이터레이터를 락 없이 사용
+                for index, file_path in pending:
+                    try:
+                        result = await self.process_single_file(
+                            file_path,
+                            output_format,
+                            quality,
+                            sheet_name,
+                            range_start,
+                            range_end,
+                            type,
+                            progress_callback,
+                            skip_existing=skip_existing
+                        )
+                    except Exception as e:
+                        now = datetime.now()
+                        result = FileResult(
+                            file_path=str(file_path),
+                            file_name=file_path.name,
+                            status="failed",
+                            start_time=now,
+                            end_time=now,
+                            error=str(e)
+                        )
+                    
+                    self._record_result(result)
+                    if self._results_fp is None:
+                        processed_results[index] = result
+                    
+                    # 배치 전체를 기다리지 않고 완료된 결과를 바로 전달
+                    if result_callback:
+                        try:
+                            result_callback(result)
+                        except Exception as e:
+                            logger.warning(f"결과 콜백 실행 실패 ({file_path}): {e}")
             
-            # 예외 처리
-            processed_results = []
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    error_result = {
-                        "file_path": str(file_paths[i]),
-                        "file_name": file_paths[i].name,
-                        "status": "failed",
-                        "error": str(result),
-                        "start_time": datetime.now(),
-                        "end_time": datetime.now(),
-                        "duration": 0
-                    }
-                    processed_results.append(error_result)
-                else:
-                    processed_results.append(result)
+            worker_count = min(self.max_workers, len(file_paths))
+            if hasattr(asyncio, "TaskGroup"):
+                # Python 3.11+: 예기치 않은 예외(취소 등) 발생 시 나머지 워커도 함께 취소
+                async with asyncio.TaskGroup() as task_group:
+                    for _ in range(worker_count):
+                        task_group.create_task(worker())
+            else:
+                await asyncio.gather(*(worker() for _ in range(worker_count)))
             
+            # 결과는 파일마다 추가하지 않고 모든 워커가 끝난 뒤 한 번에 수집
+            self.results.extend(processed_results)
             return processed_results
             
         finally:
+            if self._results_fp:
+                self._results_fp.close()
+                self._results_fp = None
             await self.close()
     
+    def _record_result(self, result: FileResult):
+        """통계를 누적하고, results_path가 지정된 경우 결과를 한 줄로 기록합니다."""
+        self._status_counts[result.status] += 1
+        self._total_duration += result.duration
+        if self._results_fp:
+            # 버퍼에 한 줄 추가하는 정도라 이벤트 루프에서 바로 기록
+            self._results_fp.write(
+                json.dumps(result.to_dict(), default=str, ensure_ascii=False) + "\n"
+            )
+    
     def get_statistics(self) -> Dict[str, Any]:
         """처리 통계 반환"""
-        if not self.results:
+        total_files = sum(self._status_counts.values())
+        if not total_files:
             return {
                 "total_files": 0,
                 "completed_files": 0,
                 "failed_files": 0,
+                "skipped_files": 0,
                 "success_rate": 0,
                 "total_duration": 0,
                 "average_duration": 0
             }
         
-        completed = [r for r in self.results if r["status"] == "completed"]
-        failed = [r for r in self.results if r["status"] == "failed"]
-        
-        total_duration = sum(r.get("duration", 0) for r in self.results)
-        average_duration = total_duration / len(self.results) if self.results else 0
+        # 처리 중 누적한 집계 사용 (결과 목록을 다시 순회하지 않음)
+        completed = self._status_counts["completed"]
+        failed = self._status_counts["failed"]
+        skipped = self._status_counts["skipped"]
+        total_duration = self._total_duration
         
         return {
-            "total_files": len(self.results),
-            "completed_files": len(completed),
-            "failed_files": len(failed),
-            "success_rate": (len(completed) / len(self.results) * 100) if self.results else 0,
+            "total_files": total_files,
+            "completed_files": completed,
+            "failed_files": failed,
+            "skipped_files": skipped,
+            # 최신 결과가 있어 건너뛴 파일도 성공으로 집계
+            "success_rate": (completed + skipped) / total_files * 100,
             "total_duration": total_duration,
-            "average_duration": average_duration
+            "average_duration": total_duration / total_files
         }
 
 def find_excel_files(directory: str, recursive: bool = True) -> List[Path]:
@@ -368,16 +486,25 @@ def find_excel_files(directory: str, recursive: bool = True) -> List[Path]:
     Returns:
         Excel 파일 경로 리스트
     """
-    dir_path = Path(directory)
-    if not dir_path.exists():
+    if not os.path.isdir(directory):
         return []
     
-    pattern = "**/*" if recursive else "*"
     excel_files = []
+    pending = [directory]
     
-    for file_path in dir_path.glob(pattern):
-        if file_path.is_file() and file_path.suffix.lower() in ['.xlsx', '.xls']:
-            excel_files.append(file_path)
+    # os.scandir의 DirEntry는 readdir 결과의 파일 종류를 캐시하므로 항목마다 stat 하지 않음
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            pending.append(entry.path)
+                    elif entry.name.lower().endswith(EXCEL_EXTENSIONS) and entry.is_file():
+                        excel_files.append(Path(entry.path))
+        except OSError as e:
+            logger.warning(f"디렉토리 검색 실패 ({current}): {e}")
     
     return sorted(excel_files)
 
@@ -391,19 +518,11 @@ async def batch_convert_excel_files(
     range_start: Optional[str] = None,
     range_end: Optional[str] = None,
     recursive: bool = True,
-    type: str = "image"
+    type: str = "image",
+    skip_existing: bool = False,
+    results_path: Optional[str] = None,
+    read_only: bool = False
 ) -> Dict[str, Any]:
-    # Windows에서 asyncio 이벤트 루프 문제 해결
-    if platform.system() == 'Windows':
-        try:
-            # Windows에서 ProactorEventLoop 사용
-            if isinstance(asyncio.get_event_loop_policy(), asyncio.WindowsProactorEventLoopPolicy):
-                pass  # 이미 ProactorEventLoop 사용 중
-            else:
-                asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-            logger.info("Windows 이벤트 루프 정책 설정 완료")
-        except Exception as e:
-            logger.warning(f"Windows 이벤트 루프 정책 설정 실패: {e}")
     """
     Excel 파일 배치 변환
     
@@ -417,6 +536,9 @@ async def batch_convert_excel_files(
         range_start: 범위 시작
         range_end: 범위 끝
         recursive: 하위 디렉토리 포함 여부
+        skip_existing: 출력 파일이 입력 파일보다 새로우면 변환하지 않고 건너뛸지 여부
+        results_path: 파일별 결과를 JSON Lines로 기록할 경로 (지정 시 반환값의 results는 비어 있음)
+        read_only: 읽기 전용 모드로 파싱할지 여부 (대용량 파일용, 병합 셀/행열 크기 제외)
         
     Returns:
         처리 결과 요약
@@ -439,7 +561,10 @@ async def batch_convert_excel_files(
     logger.info(f"총 {len(all_files)}개의 Excel 파일을 찾았습니다.")
     
     # 배치 처리 실행
-    processor = BatchProcessor(max_workers=max_workers, output_dir=output_dir)
+    processor = BatchProcessor(
+        max_workers=max_workers, output_dir=output_dir, results_path=results_path,
+        read_only=read_only
+    )
     
     try:
         results = await processor.process_batch(
@@ -449,7 +574,8 @@ async def batch_convert_excel_files(
             sheet_name,
             range_start,
             range_end,
-            type
+            type,
+            skip_existing=skip_existing
         )
         
         # 통계 생성
@@ -460,7 +586,7 @@ async def batch_convert_excel_files(
         return {
             "success": True,
             "statistics": stats,
-            "results": results
+            "results": [result.to_dict() for result in results]
         }
         
     except Exception as e:
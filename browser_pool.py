@@ -0,0 +1,394 @@
+"""
+Browser Pool Module
+
+Playwright 브라우저 풀 모듈
+미리 실행해 둔 Chromium 브라우저를 재사용하고, 변환마다 BrowserContext/Page를 발급합니다.
+정상적으로 반환된 컨텍스트/페이지는 about:blank로 비운 뒤 다음 발급에 재사용합니다.
+"""
+
+import asyncio
+import hashlib
+import os
+import platform
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Any, AsyncIterator
+from playwright.async_api import async_playwright, Playwright, Browser, BrowserContext, Page
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 브라우저 하나당 최대 사용 횟수 (초과 시 새 브라우저로 교체)
+MAX_USES_PER_INSTANCE = 50
+
+# 풀 생성 시 미리 실행할 브라우저 수
+DEFAULT_MIN_SIZE = 2
+
+# 브라우저 하나당 재사용을 위해 보관할 유휴 BrowserContext/Page 수
+MAX_IDLE_CONTEXTS = 4
+
+# 기본 디바이스 배율 (2 = 가로/세로 2배 고해상도, 1 = CSS 픽셀 그대로 래스터화하여 더 빠름)
+DEFAULT_DEVICE_SCALE_FACTOR = 2
+
+# 외부 Chromium에 CDP로 접속할 때 사용하는 환경 변수 (예: http://127.0.0.1:9222)
+CDP_ENDPOINT_ENV = 'PLAYWRIGHT_CDP_ENDPOINT'
+
+# 이미지 품질 향상을 위한 CSS (내용을 로드한 뒤 page.add_style_tag로 한 번 삽입)
+QUALITY_CSS = """
+    * {
+        image-rendering: -webkit-optimize-contrast;
+        image-rendering: -webkit-crisp-edges;
+        image-rendering: -moz-crisp-edges;
+        image-rendering: crisp-edges;
+        text-rendering: optimizeLegibility;
+        -webkit-font-smoothing: antialiased;
+        -moz-osx-font-smoothing: grayscale;
+    }
+"""
+
+EXTRA_HTTP_HEADERS = {
+    'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8'
+}
+
+
+def build_launch_options(headless: bool = True) -> Dict[str, Any]:
+    """
+    Chromium 실행 옵션을 생성합니다.
+
+    Args:
+        headless (bool): 헤드리스 모드 여부
+
+    Returns:
+        Dict[str, Any]: chromium.launch()에 전달할 옵션
+    """
+    # Windows와 Linux 호환성을 위한 브라우저 옵션 (간소화)
+    browser_args = [
+        '--no-sandbox',
+        '--disable-setuid-sandbox',
+        '--disable-dev-shm-usage',
+        '--no-first-run',
+        '--disable-background-timer-throttling',
+        '--disable-backgrounding-occluded-windows',
+        '--disable-renderer-backgrounding',
+        '--disable-features=TranslateUI',
+        '--disable-ipc-flooding-protection',
+        '--disable-default-apps',
+        '--disable-extensions',
+        '--disable-plugins',
+        '--disable-sync',
+        '--disable-translate',
+        '--hide-scrollbars',
+        '--mute-audio',
+        '--no-default-browser-check',
+        '--no-pings',
+        '--disable-web-security',
+        '--allow-running-insecure-content'
+    ]
+
+    # Windows 특정 옵션 (간소화)
+    # GPU 비활성화는 Windows 안정성 문제 때문에만 사용하고, 그 외에는 GPU 프로세스 래스터화를 사용
+    if platform.system() == 'Windows':
+        browser_args.extend([
+            '--disable-gpu',
+            '--disable-gpu-sandbox',
+            '--disable-software-rasterizer',
+            '--disable-gpu-process'
+        ])
+
+    launch_options = {
+        'headless': headless,
+        'args': browser_args
+    }
+
+    # Windows에서 추가 옵션 (이미지 품질 향상)
+    if platform.system() == 'Windows':
+        launch_options.update({
+            'executable_path': None,  # 시스템 기본 경로 사용
+            'ignore_default_args': ['--disable-extensions'],
+            'chromium_sandbox': False  # 샌드박스 비활성화로 안정성 향상
+        })
+
+    return launch_options
+
+
+def build_context_options(viewport: Optional[Dict[str, int]] = None,
+                          device_scale_factor: float = DEFAULT_DEVICE_SCALE_FACTOR) -> Dict[str, Any]:
+    """
+    BrowserContext 생성 옵션을 생성합니다.
+
+    Args:
+        viewport (Dict[str, int], optional): 뷰포트 크기 (기본값: 1920x1080)
+        device_scale_factor (float): 디바이스 배율 (작고 빠른 이미지가 필요하면 1)
+
+    Returns:
+        Dict[str, Any]: browser.new_context()에 전달할 옵션
+    """
+    context_options = {
+        'viewport': viewport or {
+            'width': 1920,
+            'height': 1080
+        },
+        'device_scale_factor': device_scale_factor,
+        # 요청 헤더는 컨텍스트 생성 시 한 번만 지정 (페이지마다 설정하지 않음)
+        'extra_http_headers': EXTRA_HTTP_HEADERS,
+        'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    }
+
+    # Windows에서 추가 컨텍스트 옵션
+    if platform.system() == 'Windows':
+        context_options.update({
+            'locale': 'ko-KR',
+            'timezone_id': 'Asia/Seoul'
+        })
+
+    return context_options
+
+
+def find_installed_chromium() -> bool:
+    """
+    Playwright Chromium 브라우저가 설치되어 있는지 서브프로세스 없이 확인합니다.
+
+    Returns:
+        bool: 설치 여부
+    """
+    browsers_path = os.environ.get("PLAYWRIGHT_BROWSERS_PATH")
+    if browsers_path and browsers_path != "0":
+        candidate = Path(browsers_path)
+    elif platform.system() == 'Windows':
+        candidate = Path(os.environ.get("LOCALAPPDATA", "~")) / "ms-playwright"
+    elif platform.system() == 'Darwin':
+        candidate = Path("~/Library/Caches/ms-playwright")
+    else:
+        candidate = Path("~/.cache/ms-playwright")
+
+    candidate = candidate.expanduser()
+    return candidate.is_dir() and any(candidate.glob("chromium-*"))
+
+
+class _PooledBrowser:
+    """풀에서 관리되는 브라우저와 사용 통계"""
+
+    def __init__(self, browser: Browser):
+        self.browser = browser
+        self.use_count = 0
+        self.active = 0
+        self.retired = False
+        # 반환된 컨텍스트/페이지 (about:blank로 비운 상태)
+        self.idle: List[Tuple[BrowserContext, Page]] = []
+
+
+class BrowserPool:
+    """미리 실행된 Chromium 브라우저를 재사용하는 풀 클래스"""
+
+    def __init__(self, headless: bool = True, min_size: int = DEFAULT_MIN_SIZE,
+                 max_uses: int = MAX_USES_PER_INSTANCE, cdp_endpoint: Optional[str] = None):
+        """
+        BrowserPool 초기화
+
+        Args:
+            headless (bool): 헤드리스 모드 여부
+            min_size (int): 미리 실행할 브라우저 수
+            max_uses (int): 브라우저 하나당 최대 사용 횟수
+            cdp_endpoint (str, optional): 공유 Chromium의 CDP 주소 (지정 시 직접 실행하지 않고 접속)
+        """
+        self.headless = headless
+        self.cdp_endpoint = cdp_endpoint
+        # CDP 접속 시 여러 연결이 필요 없으므로 연결 하나만 유지
+        self.min_size = 1 if cdp_endpoint else max(min_size, 1)
+        self.max_uses = max_uses
+        self.launch_options = build_launch_options(headless)
+        self.playwright: Optional[Playwright] = None
+        self.browsers: List[_PooledBrowser] = []
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        """풀 상태 변경용 락 (이벤트 루프 안에서 지연 생성)"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def start(self):
+        """Playwright를 시작하고 브라우저를 미리 실행합니다."""
+        async with self.lock:
+            if self.playwright is None:
+                self.playwright = await async_playwright().start()
+
+            while len(self.browsers) < self.min_size:
+                self.browsers.append(await self._launch())
+
+            logger.info(f"브라우저 풀 준비 완료: {len(self.browsers)}개")
+
+    async def _launch(self) -> _PooledBrowser:
+        """새 브라우저를 실행하거나, CDP 주소가 지정된 경우 공유 브라우저에 접속합니다."""
+        if self.cdp_endpoint:
+            browser = await self.playwright.chromium.connect_over_cdp(self.cdp_endpoint)
+            logger.info(f"공유 Chromium 접속: {self.cdp_endpoint}")
+        else:
+            browser = await self.playwright.chromium.launch(**self.launch_options)
+        return _PooledBrowser(browser)
+
+    async def _checkout(self) -> _PooledBrowser:
+        """사용 횟수가 가장 적은 브라우저를 선택하고, 한도에 도달한 브라우저는 교체합니다."""
+        if not self.browsers:
+            await self.start()
+
+        async with self.lock:
+            pooled = min(self.browsers, key=lambda b: b.use_count)
+
+            if pooled.use_count >= self.max_uses or not pooled.browser.is_connected():
+                # 한도에 도달했거나 연결이 끊긴 브라우저는 같은 자리에서 교체
+                # (CDP 접속의 경우 close()는 연결만 끊고 공유 브라우저는 유지됨)
+                replacement = await self._launch()
+                self.browsers[self.browsers.index(pooled)] = replacement
+                pooled.retired = True
+                if pooled.active == 0:
+                    await self._close_browser(pooled)
+                logger.info(f"브라우저 교체 (사용 횟수: {pooled.use_count})")
+                pooled = replacement
+
+            pooled.use_count += 1
+            pooled.active += 1
+            return pooled
+
+    async def _release(self, pooled: _PooledBrowser):
+        """브라우저 사용을 마치고, 교체 대상이면 닫습니다."""
+        pooled.active -= 1
+        if pooled.retired and pooled.active == 0:
+            await self._close_browser(pooled)
+
+    async def _close_browser(self, pooled: _PooledBrowser):
+        """브라우저를 닫습니다. (유휴 컨텍스트도 함께 닫힘)"""
+        pooled.idle.clear()
+        try:
+            await pooled.browser.close()
+        except Exception as e:
+            logger.warning(f"브라우저 닫기 실패: {e}")
+
+    @asynccontextmanager
+    async def acquire_page(self, viewport: Optional[Dict[str, int]] = None) -> AsyncIterator[Page]:
+        """
+        풀의 브라우저에서 새 BrowserContext/Page를 발급합니다.
+
+        Args:
+            viewport (Dict[str, int], optional): 뷰포트 크기
+
+        Yields:
+            Page: 변환에 사용할 페이지 (정상 종료 시 비운 뒤 재사용, 오류 시 컨텍스트를 닫음)
+        """
+        pooled = await self._checkout()
+        context_options = build_context_options(viewport)
+        context = None
+        completed = False
+        try:
+            if pooled.idle:
+                # 반환된 컨텍스트/페이지 재사용 (컨텍스트 생성과 초기화 스크립트 등록 생략)
+                context, page = pooled.idle.pop()
+                await page.set_viewport_size(context_options['viewport'])
+            else:
+                context = await pooled.browser.new_context(**context_options)
+                page = await context.new_page()
+            yield page
+            completed = True
+        finally:
+            if context:
+                if completed and not pooled.retired and len(pooled.idle) < MAX_IDLE_CONTEXTS:
+                    try:
+                        # 이전 문서를 비워 메모리를 돌려준 뒤 유휴 목록에 반환
+                        await page.goto('about:blank')
+                        pooled.idle.append((context, page))
+                        context = None
+                    except Exception as e:
+                        logger.warning(f"페이지 초기화 실패, 컨텍스트를 닫습니다: {e}")
+                if context:
+                    try:
+                        await context.close()
+                    except Exception as e:
+                        logger.warning(f"컨텍스트 닫기 실패: {e}")
+            await self._release(pooled)
+
+    async def close(self):
+        """모든 브라우저와 Playwright를 종료합니다."""
+        async with self.lock:
+            for pooled in self.browsers:
+                await self._close_browser(pooled)
+            self.browsers = []
+
+            if self.playwright:
+                try:
+                    await self.playwright.stop()
+                except Exception as e:
+                    logger.warning(f"Playwright 정지 실패: {e}")
+                finally:
+                    self.playwright = None
+
+        logger.info("브라우저 풀을 종료했습니다.")
+
+
+# 전역 풀: {(headless, args_hash): BrowserPool}
+_POOLS: Dict[Tuple[bool, str], BrowserPool] = {}
+
+
+def _pool_key(headless: bool, cdp_endpoint: Optional[str] = None) -> Tuple[bool, str]:
+    """풀 식별 키를 생성합니다."""
+    if cdp_endpoint:
+        return (headless, cdp_endpoint)
+    args = build_launch_options(headless)['args']
+    args_hash = hashlib.md5(' '.join(args).encode('utf-8')).hexdigest()
+    return (headless, args_hash)
+
+
+def get_browser_pool(headless: bool = True) -> BrowserPool:
+    """
+    실행 옵션에 해당하는 전역 브라우저 풀을 반환합니다.
+
+    Args:
+        headless (bool): 헤드리스 모드 여부
+
+    Returns:
+        BrowserPool: 브라우저 풀
+    """
+    cdp_endpoint = os.environ.get(CDP_ENDPOINT_ENV) or None
+    key = _pool_key(headless, cdp_endpoint)
+    if key not in _POOLS:
+        _POOLS[key] = BrowserPool(headless=headless, cdp_endpoint=cdp_endpoint)
+    return _POOLS[key]
+
+
+async def start_browser_pool(headless: bool = True, min_size: int = DEFAULT_MIN_SIZE):
+    """
+    전역 브라우저 풀을 미리 실행합니다. (API 서버 시작 시 호출)
+
+    Args:
+        headless (bool): 헤드리스 모드 여부
+        min_size (int): 미리 실행할 브라우저 수
+    """
+    pool = get_browser_pool(headless)
+    if not pool.cdp_endpoint:
+        pool.min_size = max(min_size, 1)
+    await pool.start()
+
+
+async def close_browser_pools():
+    """모든 전역 브라우저 풀을 종료합니다. (API 서버 종료 시 호출)"""
+    pools = list(_POOLS.values())
+    _POOLS.clear()
+    for pool in pools:
+        await pool.close()
+
+
+@asynccontextmanager
+async def acquire_page(viewport: Optional[Dict[str, int]] = None,
+                       headless: bool = True) -> AsyncIterator[Page]:
+    """
+    전역 브라우저 풀에서 페이지를 발급하는 편의 함수
+
+    Args:
+        viewport (Dict[str, int], optional): 뷰포트 크기
+        headless (bool): 헤드리스 모드 여부
+
+    Yields:
+        Page: 변환에 사용할 페이지
+    """
+    async with get_browser_pool(headless).acquire_page(viewport) as page:
+        yield page
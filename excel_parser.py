@@ -5,29 +5,143 @@ Excel 파일(.xlsx, .xls)을 파싱하여 데이터와 스타일 정보를 추
 openpyxl을 사용하여 셀 데이터, 스타일, 병합 셀 정보 등을 처리합니다.
 """
 
-from typing import Dict, List, Tuple, Optional, Any
+import os
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional, Any, Iterator, Union, BinaryIO
 from openpyxl import load_workbook
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.styles import Font, PatternFill, Border, Alignment
-from openpyxl.utils import get_column_letter
+from openpyxl.utils import get_column_letter, column_index_from_string, range_boundaries
+from openpyxl.xml import LXML
 import logging
+import logging.handlers
 
 logger = logging.getLogger(__name__)
 
+# lxml이 없으면 openpyxl이 느린 xml.etree 파서를 사용하므로 처음 로드할 때 한 번만 경고
+_lxml_warned = False
+
+
+def _warn_if_no_lxml():
+    """lxml이 설치되어 있지 않으면 한 번만 경고를 남깁니다."""
+    global _lxml_warned
+    if not LXML and not _lxml_warned:
+        _lxml_warned = True
+        logger.warning("lxml이 설치되어 있지 않아 Excel XML 파싱이 느려질 수 있습니다. (pip install lxml)")
+
+
+# parse_excel_file에서 재사용할 최근 워크북 수
+WORKBOOK_CACHE_SIZE = 4
+
+# 시트 병렬 파싱에 사용할 최대 프로세스 수 (프로세스마다 워크북 전체를 다시 로드하므로 제한)
+MAX_PARSE_PROCESSES = 4
+
+# 이보다 작은 파일은 프로세스 실행/워크북 재로드 비용이 파싱보다 커서 한 프로세스에서 파싱
+PARALLEL_PARSE_MIN_SIZE = 5 * 1024 * 1024
+
+
+@dataclass(slots=True)
+class CellRecord:
+    """
+    셀 하나의 데이터와 스타일 정보
+    
+    셀마다 딕셔너리를 만드는 대신 슬롯 객체를 사용해 큰 시트의 메모리 사용을 줄입니다.
+    기존 코드와의 호환을 위해 cell['value'], cell.get('font', {}) 같은 딕셔너리식 접근을 지원합니다.
+    스타일 딕셔너리는 같은 서식의 셀끼리 공유되므로 수정하지 않아야 합니다.
+    """
+    row: int
+    col: int
+    address: str
+    value: Any
+    data_type: str
+    number_format: str
+    original_value: Any
+    is_formula: bool = False
+    is_merged: bool = False
+    merge_range: Optional[str] = None
+    font: Dict[str, Any] = field(default_factory=dict)
+    fill: Dict[str, Any] = field(default_factory=dict)
+    border: Dict[str, Any] = field(default_factory=dict)
+    alignment: Dict[str, Any] = field(default_factory=dict)
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __setitem__(self, key: str, value: Any):
+        setattr(self, key, value)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환합니다. (JSON 출력용)"""
+        return asdict(self)
+
+
+@lru_cache(maxsize=4096)
+def _format_color(rgb, theme, indexed, color_type) -> Optional[str]:
+    """
+    색상 속성 조합을 문자열로 변환합니다. (같은 색상은 한 번만 계산)
+    
+    Args:
+        rgb: RGB 값
+        theme: 테마 색상 번호
+        indexed: 인덱스 색상 번호
+        color_type: 색상 타입
+        
+    Returns:
+        Optional[str]: 색상 값 (판별할 수 없으면 None)
+    """
+    if rgb:
+        # RGB 값이 있으면 반환 (예: "FF0000")
+        return str(rgb)
+    if theme is not None:
+        return f"theme_{theme}"
+    if indexed is not None:
+        return f"indexed_{indexed}"
+    if color_type == 'rgb':
+        # RGB 타입인 경우 기본 색상 반환
+        return "000000"
+    return None
+
 
 class ExcelParser:
     """Excel 파일을 파싱하여 데이터와 스타일 정보를 추출하는 클래스"""
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, workbook=None, fast_mode: bool = False,
+                 read_only: bool = False):
         """
         ExcelParser 초기화
         
         Args:
             file_path (str): Excel 파일 경로
+            workbook (optional): 이미 로드된 openpyxl 워크북 (여러 시트에서 공유할 때 사용)
+            fast_mode (bool): 스타일/병합 셀/행열 크기 없이 값만 읽기 전용 모드로 빠르게 추출
+            read_only (bool): 읽기 전용 모드로 값과 기본 스타일만 추출 (병합 셀/행열 크기 제외)
         """
         self.file_path = file_path
-        self.workbook = None
+        self.workbook = workbook
         self.worksheet = None
+        # 선택된 시트의 사용 범위 캐시 (시작 행, 끝 행, 시작 열, 끝 열)
+        self._bounds: Optional[Tuple[int, int, int, int]] = None
+        self.fast_mode = fast_mode
+        # fast_mode는 읽기 전용 모드에서 스타일까지 생략하는 경우
+        self.read_only = read_only or fast_mode
+        # 외부에서 받은 워크북은 이 파서가 닫지 않음
+        self._owns_workbook = workbook is None
+        # 수식 계산값 조회용 data_only 워크북 (처음 필요할 때 한 번만 로드)
+        self._values_workbook = None
+        self._formula_values: Dict[str, Dict[Tuple[int, int], Any]] = {}
+        # 스타일 배열별 추출 결과 캐시 (같은 서식의 셀은 한 번만 계산)
+        self._style_cache: Dict[Tuple[int, ...], Dict[str, Any]] = {}
         
     def load_workbook(self) -> bool:
         """
@@ -36,9 +150,20 @@ class ExcelParser:
         Returns:
             bool: 로드 성공 여부
         """
+        if self.workbook is not None:
+            return True
+        
+        _warn_if_no_lxml()
+            
         try:
-            self.workbook = load_workbook(self.file_path, data_only=False)
-            logger.info(f"Excel 파일 로드 성공: {self.file_path}")
+            if self.read_only:
+                # 읽기 전용 스트리밍 파서 사용, 계산된 값만 로드
+                self.workbook = load_workbook(
+                    self.file_path, read_only=True, data_only=True, keep_links=False
+                )
+            else:
+                self.workbook = load_workbook(self.file_path, data_only=False, keep_links=False)
+            logger.debug(f"Excel 파일 로드 성공: {self.file_path}")
             return True
         except FileNotFoundError:
             logger.error(f"Excel 파일을 찾을 수 없습니다: {self.file_path}")
@@ -80,8 +205,9 @@ class ExcelParser:
             else:
                 # 기본값: 첫 번째 시트
                 self.worksheet = self.workbook.active
+            self._bounds = None
                 
-            logger.info(f"시트 선택: {self.worksheet.title}")
+            logger.debug(f"시트 선택: {self.worksheet.title}")
             return True
         except Exception as e:
             logger.error(f"시트 선택 실패: {str(e)}")
@@ -96,72 +222,162 @@ class ExcelParser:
         """
         if not self.worksheet:
             return ('A1', 'A1')
-            
-        return (self.worksheet.min_row, self.worksheet.max_row,
-                self.worksheet.min_column, self.worksheet.max_column)
+        
+        min_row, max_row, min_col, max_col = self._get_bounds()
+        return (f"{get_column_letter(min_col)}{min_row}", f"{get_column_letter(max_col)}{max_row}")
     
-    def extract_cell_data(self, row: int, col: int) -> Dict[str, Any]:
+    def extract_cell_data(self, row: int, col: int, include_style: bool = True) -> CellRecord:
         """
         특정 셀의 데이터와 스타일 정보를 추출합니다.
         
         Args:
             row (int): 행 번호
             col (int): 열 번호
+            include_style (bool): 스타일 정보 포함 여부
             
         Returns:
-            Dict[str, Any]: 셀 데이터와 스타일 정보
+            CellRecord: 셀 데이터와 스타일 정보
         """
         if not self.worksheet:
             return {}
+        
+        if self.read_only:
+            # 읽기 전용 워크시트도 단일 셀은 iter_rows로 읽음
+            cell = next(self.worksheet.iter_rows(min_row=row, max_row=row, min_col=col, max_col=col))[0]
+            return self._read_only_cell_to_record(cell, row, col, include_style)
             
-        cell = self.worksheet.cell(row=row, column=col)
+        return self._cell_to_record(self.worksheet.cell(row=row, column=col), row, col, include_style)
+    
+    def _cell_to_record(self, cell, row: int, col: int, include_style: bool = True,
+                        address: Optional[str] = None) -> CellRecord:
+        """
+        셀 객체에서 데이터와 스타일 정보를 추출합니다.
+        
+        Args:
+            cell: openpyxl Cell 객체
+            row (int): 행 번호
+            col (int): 열 번호
+            include_style (bool): 스타일 정보 포함 여부
+            address (str, optional): 셀 주소 (호출자가 미리 계산한 경우)
+            
+        Returns:
+            CellRecord: 셀 데이터와 스타일 정보
+        """
+        if address is None:
+            address = cell.coordinate
         
         # 셀 값 처리 - 수식이면 계산된 값 사용
-        cell_value = cell.value
+        original_value = cell.value
+        cell_value = original_value
+        is_formula = cell.data_type == 'f'
         
         # 수식 처리
-        if cell_value and str(cell_value).startswith('='):
+        if is_formula:
             try:
-                # 수식의 계산된 값 가져오기
-                calculated_value = cell.value
-                # data_only=True로 워크북을 다시 로드하여 계산된 값 추출
-                temp_workbook = load_workbook(self.file_path, data_only=True)
-                temp_worksheet = temp_workbook[self.worksheet.title]
-                temp_cell = temp_worksheet.cell(row=row, column=col)
-                calculated_value = temp_cell.value
-                temp_workbook.close()
+                # 한 번 로드해 둔 data_only 값에서 계산된 값 조회
+                calculated_value = self._get_formula_values().get((row, col))
                 
                 # 계산된 값이 있으면 사용, 없으면 원본 수식 사용
                 if calculated_value is not None:
                     cell_value = calculated_value
             except Exception as e:
-                logger.warning(f"수식 계산 실패 ({cell.coordinate}): {str(e)}")
+                logger.debug(f"수식 계산 실패 ({address}): {str(e)}")
                 # 수식 계산 실패 시 원본 값 사용
                 pass
         
-        # 기본 데이터
-        cell_data = {
-            'row': row,
-            'col': col,
-            'address': cell.coordinate,
-            'value': cell_value,
-            'data_type': type(cell_value).__name__,
-            'number_format': cell.number_format,
-            'is_merged': False,
-            'merge_range': None,
-            'original_value': cell.value,  # 원본 값 보존
-            'is_formula': str(cell.value).startswith('=') if cell.value else False
-        }
+        cell_data = CellRecord(
+            row=row,
+            col=col,
+            address=address,
+            value=cell_value,
+            data_type=type(cell_value).__name__,
+            number_format=cell.number_format,
+            original_value=original_value,  # 원본 값 보존
+            is_formula=is_formula
+        )
         
         # 스타일 정보 추출
-        cell_data.update(self._extract_cell_style(cell))
-        
+        if include_style:
+            self._apply_cell_style(cell_data, cell)
         return cell_data
     
+    def _apply_cell_style(self, cell_data: CellRecord, cell):
+        """
+        셀 스타일 정보를 셀 레코드에 채웁니다.
+        
+        Args:
+            cell_data (CellRecord): 셀 레코드
+            cell: openpyxl Cell 객체
+        """
+        style_data = self._extract_cell_style(cell)
+        cell_data.font = style_data['font']
+        cell_data.fill = style_data['fill']
+        cell_data.border = style_data['border']
+        cell_data.alignment = style_data['alignment']
+    
+    def _get_formula_values(self) -> Dict[Tuple[int, int], Any]:
+        """
+        현재 시트의 수식 계산값을 반환합니다.
+        
+        data_only 워크북은 파서당 한 번만 읽기 전용으로 로드하고,
+        시트별 값은 처음 조회할 때 한 번에 읽어 캐시합니다.
+        
+        Returns:
+            Dict[Tuple[int, int], Any]: {(행, 열): 계산된 값}
+        """
+        title = self.worksheet.title
+        if title in self._formula_values:
+            return self._formula_values[title]
+        
+        if self._values_workbook is None:
+            if hasattr(self.file_path, 'seek'):
+                # 파일 객체는 처음부터 다시 읽음
+                self.file_path.seek(0)
+            self._values_workbook = load_workbook(
+                self.file_path, read_only=True, data_only=True, keep_links=False
+            )
+        
+        values = {}
+        rows = self._values_workbook[title].iter_rows(min_row=1, min_col=1, values_only=True)
+        for row, row_values in enumerate(rows, start=1):
+            for col, value in enumerate(row_values, start=1):
+                if value is not None:
+                    values[(row, col)] = value
+        
+        self._formula_values[title] = values
+        return values
+    
     def _extract_cell_style(self, cell) -> Dict[str, Any]:
         """
         셀의 스타일 정보를 추출합니다.
         
+        대부분의 셀은 몇 가지 서식을 공유하므로 스타일 배열(폰트/채우기/테두리/정렬 ID)이
+        같은 셀은 캐시된 결과를 재사용합니다. 반환된 딕셔너리는 수정하지 않아야 합니다.
+        
+        Args:
+            cell: openpyxl Cell 객체
+            
+        Returns:
+            Dict[str, Any]: 스타일 정보
+        """
+        style_array = getattr(cell, '_style', None)
+        if style_array is None:
+            # 읽기 전용 셀은 style_array 속성으로 제공
+            style_array = getattr(cell, 'style_array', None)
+        if style_array is None:
+            return self._build_cell_style(cell)
+        
+        style_key = tuple(style_array)
+        style_data = self._style_cache.get(style_key)
+        if style_data is None:
+            style_data = self._build_cell_style(cell)
+            self._style_cache[style_key] = style_data
+        return style_data
+    
+    def _build_cell_style(self, cell) -> Dict[str, Any]:
+        """
+        셀의 스타일 정보를 새로 계산합니다.
+        
         Args:
             cell: openpyxl Cell 객체
             
@@ -231,27 +447,22 @@ class ExcelParser:
         if not color:
             return None
         
-        try:
-            if hasattr(color, 'rgb') and color.rgb:
-                # RGB 값이 있으면 반환 (예: "FF0000")
-                return str(color.rgb)
-            elif hasattr(color, 'theme') and color.theme is not None:
-                return f"theme_{color.theme}"
-            elif hasattr(color, 'indexed') and color.indexed is not None:
-                return f"indexed_{color.indexed}"
-            elif hasattr(color, 'type') and color.type == 'rgb':
-                # RGB 타입인 경우 기본 색상 반환
-                return "000000"
-            elif hasattr(color, '__str__'):
-                # 문자열로 변환 가능한 경우
-                color_str = str(color)
-                if color_str and color_str != 'None':
-                    return color_str
-            
-            return None
-        except Exception:
-            # 예외 발생 시 None 반환
-            return None
+        # openpyxl Color의 속성은 모두 문자열/정수라 캐시 키로 안전하게 사용 가능
+        color_str = _format_color(
+            getattr(color, 'rgb', None),
+            getattr(color, 'theme', None),
+            getattr(color, 'indexed', None),
+            getattr(color, 'type', None)
+        )
+        if color_str is not None:
+            return color_str
+        
+        # 문자열로 변환 가능한 경우
+        color_str = str(color)
+        if color_str and color_str != 'None':
+            return color_str
+        
+        return None
     
     def _extract_border_side(self, border_side) -> Dict[str, Any]:
         """
@@ -280,6 +491,10 @@ class ExcelParser:
         """
         if not self.worksheet:
             return []
+        
+        # 읽기 전용 워크시트는 병합 셀 정보를 제공하지 않음
+        if not hasattr(self.worksheet, 'merged_cells'):
+            return []
             
         merged_cells = []
         for merged_range in self.worksheet.merged_cells.ranges:
@@ -312,7 +527,16 @@ class ExcelParser:
         """
         if not self.worksheet:
             return {}
-            
+        
+        # 읽기 전용 워크시트는 행/열 크기 정보를 제공하지 않음
+        if not hasattr(self.worksheet, 'row_dimensions'):
+            return {
+                'row_heights': {},
+                'column_widths': {},
+                'default_row_height': None,
+                'default_column_width': None
+            }
+        
         dimensions = {
             'row_heights': {},
             'column_widths': {},
@@ -320,17 +544,15 @@ class ExcelParser:
             'default_column_width': self.worksheet.sheet_format.defaultColWidth
         }
         
-        # 행 높이
-        for row in range(1, self.worksheet.max_row + 1):
-            height = self.worksheet.row_dimensions[row].height
-            if height:
-                dimensions['row_heights'][row] = height
+        # 행 높이 (max_row는 실제 내용과 어긋날 수 있으므로 정의된 행만 순회)
+        for row, row_dimension in self.worksheet.row_dimensions.items():
+            if row_dimension.height:
+                dimensions['row_heights'][row] = row_dimension.height
         
-        # 열 너비
-        for col in range(1, self.worksheet.max_column + 1):
-            width = self.worksheet.column_dimensions[get_column_letter(col)].width
-            if width:
-                dimensions['column_widths'][col] = width
+        # 열 너비 (정의된 열만 순회)
+        for col_letter, col_dimension in self.worksheet.column_dimensions.items():
+            if col_dimension.width:
+                dimensions['column_widths'][column_index_from_string(col_letter)] = col_dimension.width
         
         return dimensions
     
@@ -348,17 +570,14 @@ class ExcelParser:
         if not self.worksheet:
             return {}
         
-        # 범위 결정
-        if range_start and range_end:
-            # 사용자 지정 범위
-            start_cell = self.worksheet[range_start]
-            end_cell = self.worksheet[range_end]
-            min_row, max_row = start_cell.row, end_cell.row
-            min_col, max_col = start_cell.column, end_cell.column
-        else:
-            # 전체 사용 범위
-            min_row, max_row = self.worksheet.min_row, self.worksheet.max_row
-            min_col, max_col = self.worksheet.min_column, self.worksheet.max_column
+        start_time = time.perf_counter()
+        min_row, max_row, min_col, max_col = self._resolve_range(range_start, range_end)
+        
+        # 읽기 전용 모드에서는 병합 셀/행열 크기 정보가 없음
+        merged_cells = self.extract_merged_cells()
+        dimensions = self.extract_dimensions()
+        
+        cells = list(self._iter_rows(min_row, max_row, min_col, max_col, merged_cells))
         
         sheet_data = {
             'sheet_name': self.worksheet.title,
@@ -371,36 +590,151 @@ class ExcelParser:
                 'start_col': min_col,
                 'end_col': max_col
             },
-            'cells': [],
-            'merged_cells': self.extract_merged_cells(),
-            'row_heights': self.extract_dimensions()['row_heights'],
-            'column_widths': self.extract_dimensions()['column_widths']
+            'cells': cells,
+            'merged_cells': merged_cells,
+            'row_heights': dimensions.get('row_heights', {}),
+            'column_widths': dimensions.get('column_widths', {})
         }
         
-        # 셀 데이터 추출
-        for row in range(min_row, max_row + 1):
+        # 파일/시트 단위 로그는 디버그로 두고 파싱 결과만 한 줄로 기록
+        if logger.isEnabledFor(logging.INFO):
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            logger.info(
+                f"시트 파싱 완료: {self.file_path} [시트={sheet_data['sheet_name']}, "
+                f"범위={sheet_data['range']}, 셀={len(cells) * (max_col - min_col + 1)}, "
+                f"{elapsed_ms:.2f}ms]"
+            )
+        
+        return sheet_data
+    
+    def _resolve_range(self, range_start: Optional[str] = None,
+                       range_end: Optional[str] = None) -> Tuple[int, int, int, int]:
+        """
+        추출할 범위를 행/열 번호로 변환합니다.
+        
+        Args:
+            range_start (str, optional): 시작 범위 (예: 'A1')
+            range_end (str, optional): 끝 범위 (예: 'D10')
+            
+        Returns:
+            Tuple[int, int, int, int]: (시작 행, 끝 행, 시작 열, 끝 열)
+        """
+        if range_start and range_end:
+            # 사용자 지정 범위
+            min_col, min_row, max_col, max_row = range_boundaries(f"{range_start}:{range_end}")
+            return min_row, max_row, min_col, max_col
+        
+        # 전체 사용 범위
+        return self._get_bounds()
+    
+    def _get_bounds(self) -> Tuple[int, int, int, int]:
+        """
+        현재 시트의 사용 범위를 반환합니다.
+        
+        일반 워크시트의 min_row/max_row 등은 접근할 때마다 전체 셀을 훑으므로
+        시트를 선택한 뒤 처음 한 번만 계산해 둡니다.
+        
+        Returns:
+            Tuple[int, int, int, int]: (시작 행, 끝 행, 시작 열, 끝 열)
+        """
+        if self._bounds is not None:
+            return self._bounds
+        
+        if self.read_only and self.worksheet.max_row is None:
+            # 크기 정보가 없는 파일은 전체를 읽어 계산
+            self.worksheet.calculate_dimension(force=True)
+        
+        self._bounds = (self.worksheet.min_row, self.worksheet.max_row,
+                        self.worksheet.min_column, self.worksheet.max_column)
+        return self._bounds
+    
+    def _iter_rows(self, min_row: int, max_row: int, min_col: int, max_col: int,
+                   merged_cells: List[Dict[str, Any]]) -> Iterator[List[CellRecord]]:
+        """
+        범위 안의 셀을 행 단위로 순회하며 셀 데이터를 생성합니다.
+        
+        Args:
+            min_row (int): 시작 행
+            max_row (int): 끝 행
+            min_col (int): 시작 열
+            max_col (int): 끝 열
+            merged_cells (List[Dict[str, Any]]): 병합 셀 정보 리스트
+            
+        Yields:
+            List[CellRecord]: 한 행의 셀 데이터 리스트
+        """
+        # 범위 안의 병합 셀 위치를 미리 계산 {(행, 열): 병합 범위}
+        merge_lookup = {}
+        for merged_cell in merged_cells:
+            for row in range(max(merged_cell['start_row'], min_row), min(merged_cell['end_row'], max_row) + 1):
+                for col in range(max(merged_cell['start_col'], min_col), min(merged_cell['end_col'], max_col) + 1):
+                    merge_lookup.setdefault((row, col), merged_cell['range'])
+        
+        has_merges = bool(merge_lookup)
+        
+        # 열 문자는 행마다 다시 계산하지 않도록 한 번만 구함
+        column_letters = [get_column_letter(col) for col in range(min_col, max_col + 1)]
+        
+        # 셀마다 worksheet.cell()을 호출하지 않고 행 단위로 순회
+        # (읽기 전용 워크시트는 임의 셀 접근이 특히 느림)
+        cell_to_record = self._read_only_cell_to_record if self.read_only else self._cell_to_record
+        rows = self.worksheet.iter_rows(
+            min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col
+        )
+        for row, row_cells in enumerate(rows, start=min_row):
             row_data = []
-            for col in range(min_col, max_col + 1):
-                cell_data = self.extract_cell_data(row, col)
+            for col, (column_letter, cell) in enumerate(zip(column_letters, row_cells), start=min_col):
+                cell_data = cell_to_record(cell, row, col, True, f"{column_letter}{row}")
                 
-                # 병합 셀 정보 추가
-                for merged_cell in sheet_data['merged_cells']:
-                    if (merged_cell['start_row'] <= row <= merged_cell['end_row'] and
-                        merged_cell['start_col'] <= col <= merged_cell['end_col']):
-                        cell_data['is_merged'] = True
-                        cell_data['merge_range'] = merged_cell['range']
-                        break
+                # 병합 셀 정보 추가 (병합 셀이 없는 시트는 조회 키도 만들지 않음)
+                if has_merges:
+                    merge_range = merge_lookup.get((row, col))
+                    if merge_range:
+                        cell_data.is_merged = True
+                        cell_data.merge_range = merge_range
                 
                 row_data.append(cell_data)
-            sheet_data['cells'].append(row_data)
+            yield row_data
+    
+    def _read_only_cell_to_record(self, cell, row: int, col: int, include_style: bool = True,
+                                  address: Optional[str] = None) -> CellRecord:
+        """
+        읽기 전용 셀에서 값과 기본 스타일을 추출합니다.
         
-        return sheet_data
+        fast_mode에서는 스타일도 생략하고 값만 추출합니다.
+        
+        Args:
+            cell: openpyxl ReadOnlyCell 또는 EmptyCell 객체
+            row (int): 행 번호
+            col (int): 열 번호
+            include_style (bool): 스타일 정보 포함 여부
+            address (str, optional): 셀 주소 (호출자가 미리 계산한 경우)
+            
+        Returns:
+            CellRecord: 셀 데이터와 스타일 정보
+        """
+        cell_value = cell.value
+        cell_data = CellRecord(
+            row=row,
+            col=col,
+            address=address or f"{get_column_letter(col)}{row}",
+            value=cell_value,
+            data_type=type(cell_value).__name__,
+            number_format=getattr(cell, 'number_format', None) or 'General',
+            original_value=cell_value
+        )
+        if include_style and not self.fast_mode:
+            self._apply_cell_style(cell_data, cell)
+        return cell_data
     
     def close(self):
         """워크북을 닫습니다."""
-        if self.workbook:
+        if self._values_workbook is not None:
+            self._values_workbook.close()
+            self._values_workbook = None
+        if self.workbook and self._owns_workbook:
             self.workbook.close()
-            logger.info("Excel 워크북을 닫았습니다.")
+            logger.debug("Excel 워크북을 닫았습니다.")
     
     def parse_sheet(self, sheet_name: Optional[str] = None, sheet_index: Optional[int] = None,
                    range_start: Optional[str] = None, range_end: Optional[str] = None) -> Dict[str, Any]:
@@ -425,21 +759,89 @@ class ExcelParser:
         return self.extract_sheet_data(range_start, range_end)
 
 
-def parse_excel_file(file_path: str, sheet_name: Optional[str] = None, 
-                    range_start: Optional[str] = None, range_end: Optional[str] = None) -> Dict[str, Any]:
+@lru_cache(maxsize=WORKBOOK_CACHE_SIZE)
+def _load_parser_cached(file_path: str, mtime_ns: int, size: int) -> Tuple[ExcelParser, threading.Lock]:
+    """(경로, 수정 시간, 크기)를 키로 전체 로드한 워크북의 파서와 그 파서 전용 락을 캐시합니다."""
+    parser = ExcelParser(file_path)
+    if not parser.load_workbook():
+        raise Exception("Excel 파일을 로드할 수 없습니다.")
+    return parser, threading.Lock()
+
+
+def load_cached_parser(file_path: str) -> Tuple[ExcelParser, threading.Lock]:
     """
-    Excel 파일을 파싱하는 편의 함수
+    최근에 로드한 워크북의 파서를 재사용하여 Excel 파일을 로드합니다.
+    
+    같은 파일을 시트별로 여러 번 파싱할 때 XML 파싱을 한 번만 수행하고,
+    수식 계산값용 data_only 워크북도 파일당 한 번만 로드합니다.
+    파일이 수정되면 수정 시간/크기가 달라지므로 다시 로드합니다.
+    반환된 파서는 여러 스레드에서 공유되므로 함께 반환된 락을 잡은 동안에만 사용하고,
+    닫지 않아야 합니다.
     
     Args:
         file_path (str): Excel 파일 경로
+        
+    Returns:
+        Tuple[ExcelParser, threading.Lock]: (공유 파서, 파서 접근용 락)
+    """
+    stat = os.stat(file_path)
+    return _load_parser_cached(os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+def read_sheet_names(file_path: str) -> List[str]:
+    """
+    셀을 읽지 않는 읽기 전용 로드로 시트 이름 목록만 가져옵니다.
+    
+    Args:
+        file_path (str): Excel 파일 경로
+        
+    Returns:
+        List[str]: 시트 이름 목록
+    """
+    workbook = load_workbook(file_path, read_only=True, keep_links=False)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+def parse_excel_file(file_path: Union[str, BinaryIO], sheet_name: Optional[str] = None, 
+                    range_start: Optional[str] = None, range_end: Optional[str] = None,
+                    read_only: bool = False) -> Dict[str, Any]:
+    """
+    Excel 파일을 파싱하는 편의 함수
+    
+    파일 경로로 호출하면 최근 로드한 워크북과 수식 계산값을 재사용하고,
+    io.BytesIO 같은 파일 객체를 전달하면 디스크를 거치지 않고 바로 파싱합니다.
+    read_only=True이면 캐시된 전체 워크북 대신 읽기 전용 스트리밍 파서로 로드합니다.
+    
+    Args:
+        file_path (str | BinaryIO): Excel 파일 경로 또는 파일 객체
         sheet_name (str, optional): 시트 이름
         range_start (str, optional): 시작 범위
         range_end (str, optional): 끝 범위
+        read_only (bool): 읽기 전용 모드로 파싱 (메모리 사용 감소, 병합 셀/행열 크기 제외)
         
     Returns:
         Dict[str, Any]: 파싱된 데이터
     """
-    parser = ExcelParser(file_path)
+    if not read_only and isinstance(file_path, (str, os.PathLike)):
+        try:
+            parser, parser_lock = load_cached_parser(file_path)
+        except FileNotFoundError:
+            logger.error(f"Excel 파일을 찾을 수 없습니다: {file_path}")
+            return {}
+        except Exception as e:
+            logger.error(f"Excel 파일 로드 실패: {str(e)}")
+            return {}
+        
+        # 캐시된 파서는 여러 스레드가 공유하므로 파싱하는 동안 락을 잡고, 닫지 않음
+        with parser_lock:
+            if not parser.select_sheet(sheet_name):
+                return {}
+            return parser.extract_sheet_data(range_start, range_end)
+    
+    parser = ExcelParser(file_path, read_only=read_only)
     
     try:
         if not parser.load_workbook():
@@ -452,3 +854,91 @@ def parse_excel_file(file_path: str, sheet_name: Optional[str] = None,
     
     finally:
         parser.close()
+
+
+class _ForwardLogHandler(logging.Handler):
+    """작업 프로세스에서 받은 로그 레코드를 현재 프로세스의 같은 이름 로거로 전달하는 핸들러"""
+    
+    def emit(self, record: logging.LogRecord):
+        logging.getLogger(record.name).handle(record)
+
+
+def _init_parse_worker(log_queue, log_level: int):
+    """
+    parse_all_sheets 작업 프로세스를 초기화합니다.
+    
+    작업 프로세스의 로그는 모두 큐에 넣어 부모 프로세스의 핸들러로 출력되도록 합니다.
+    
+    Args:
+        log_queue: 부모 프로세스가 읽는 multiprocessing 큐
+        log_level (int): 부모 프로세스의 루트 로거 레벨
+    """
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(log_level)
+
+
+def _parse_sheet_worker(file_path: str, sheet_name: str, range_start: Optional[str],
+                        range_end: Optional[str], read_only: bool) -> Dict[str, Any]:
+    """parse_all_sheets의 프로세스 작업 함수 (피클 가능하도록 모듈 수준에 정의)"""
+    # 같은 프로세스가 여러 시트를 맡으면 (전체 로드 시) 워크북 캐시로 한 번만 로드
+    return parse_excel_file(file_path, sheet_name, range_start, range_end, read_only=read_only)
+
+
+def parse_all_sheets(file_path: str, range_start: Optional[str] = None,
+                     range_end: Optional[str] = None, max_workers: Optional[int] = None,
+                     read_only: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    모든 시트를 여러 프로세스에서 병렬로 파싱합니다.
+    
+    시트 파싱은 CPU 작업이라 스레드로는 GIL 때문에 병렬화되지 않으므로 프로세스를 사용합니다.
+    각 프로세스가 워크북을 따로 로드하므로 PARALLEL_PARSE_MIN_SIZE보다 작은 파일이나
+    시트가 하나인 파일은 현재 프로세스에서 처리하고, 프로세스 수는 MAX_PARSE_PROCESSES로 제한합니다.
+    (여러 파일을 이미 병렬로 처리 중인 호출자는 max_workers=1을 전달해야 합니다)
+    
+    Args:
+        file_path (str): Excel 파일 경로
+        range_start (str, optional): 시작 범위
+        range_end (str, optional): 끝 범위
+        max_workers (int, optional): 최대 프로세스 수 (기본값: CPU 수, 최대 MAX_PARSE_PROCESSES)
+        read_only (bool): 읽기 전용 모드로 파싱 (메모리 사용 감소, 병합 셀/행열 크기 제외)
+        
+    Returns:
+        Dict[str, Dict[str, Any]]: {시트 이름: 시트 데이터}
+    """
+    try:
+        # 시트 이름은 읽기 전용 로드로만 확인 (전체 로드는 실제로 파싱하는 쪽에서 한 번만)
+        sheet_names = read_sheet_names(file_path)
+        file_size = os.path.getsize(file_path)
+    except Exception as e:
+        logger.error(f"Excel 파일 로드 실패: {str(e)}")
+        return {}
+    
+    workers = min(max_workers or os.cpu_count() or 1, MAX_PARSE_PROCESSES, len(sheet_names))
+    if workers <= 1 or file_size < PARALLEL_PARSE_MIN_SIZE:
+        return {
+            name: _parse_sheet_worker(file_path, name, range_start, range_end, read_only)
+            for name in sheet_names
+        }
+    
+    logger.info(f"{len(sheet_names)}개 시트를 {workers}개 프로세스로 파싱합니다.")
+    count = len(sheet_names)
+    # 실행 중인 스레드(로그 리스너 등)가 있는 프로세스를 fork하지 않도록 spawn으로 작업 프로세스를 시작하고,
+    # 작업 프로세스의 로그는 multiprocessing 큐로 받아 이 프로세스의 로거로 다시 전달
+    mp_context = multiprocessing.get_context('spawn')
+    log_queue = mp_context.Queue()
+    log_listener = logging.handlers.QueueListener(log_queue, _ForwardLogHandler())
+    log_listener.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=mp_context,
+            initializer=_init_parse_worker, initargs=(log_queue, logging.getLogger().level)
+        ) as executor:
+            results = executor.map(
+                _parse_sheet_worker,
+                [file_path] * count, sheet_names,
+                [range_start] * count, [range_end] * count, [read_only] * count
+            )
+            return dict(zip(sheet_names, results))
+    finally:
+        log_listener.stop()
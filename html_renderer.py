@@ -5,13 +5,238 @@ Excel 데이터를 HTML 테이블로 변환하는 모듈
 jinja2 템플릿 엔진을 사용하여 Excel의 스타일을 CSS로 매핑합니다.
 """
 
-from typing import Dict, List, Any, Optional
-from jinja2 import Environment, FileSystemLoader, Template
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple, Iterator, Callable
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, Template
 import os
+import tempfile
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 셀 HTML 형식: (클래스, style 속성, colspan/rowspan 속성, 값)
+TD_FORMAT = '<td class="%s"%s%s>%s</td>'
+
+# 셀 문자열 값의 HTML 이스케이프 표 (str.translate 한 번으로 처리)
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#39;",
+})
+
+# _generate_css_styles에서 셀 서식 규칙 앞에 붙는 기본 테이블 스타일
+_BASE_CSS = """
+        .excel-table {
+            border-collapse: collapse;
+            font-family: 'Calibri', 'Arial', sans-serif;
+            font-size: 16px;
+            width: auto;
+            table-layout: auto;
+        }
+        
+        .excel-table td, .excel-table th {
+            border: 1px solid #d0d0d0;
+            padding: 2px 4px;
+            vertical-align: top;
+            white-space: normal;
+            word-wrap: break-word;
+            word-break: break-word;
+            min-width: 50px;
+            max-width: 400px;
+            height: auto;
+            min-height: 20px;
+        }
+        """
+
+@lru_cache(maxsize=1024)
+def _format_css_color(color_str: str) -> str:
+    """
+    색상 문자열을 CSS 색상으로 변환합니다. (같은 색상은 한 번만 계산)
+
+    Args:
+        color_str (str): 색상 문자열 (예: 'FFFF0000', 'FF0000', 'theme_1')
+
+    Returns:
+        str: CSS 색상 값
+    """
+    # ARGB 형식 (예: FFFF0000)
+    if color_str[:2] == "FF":
+        return "#" + color_str[2:]
+    # RGB 형식 (예: FF0000)
+    if len(color_str) == 6 and color_str.isalnum():
+        return "#" + color_str
+    # 테마/인덱스 색상, RGB 객체 등은 기본 색상으로 대체
+    return "#000000"
+
+
+@lru_cache(maxsize=4096)
+def _col_letter_to_num(col_letter: str) -> int:
+    """열 주소를 숫자로 변환 (A=1, B=2, ..., Z=26, AA=27, ...)"""
+    col_num = 0
+    for char in col_letter:
+        col_num = col_num * 26 + (ord(char) - ord("A") + 1)
+    return col_num
+
+
+@lru_cache(maxsize=4096)
+def _parse_merge_range(merged_range: str) -> Tuple[str, int, int]:
+    """
+    병합 범위 문자열을 해석합니다. (같은 범위는 한 번만 해석)
+
+    Args:
+        merged_range (str): 병합 범위 (예: 'A1:C3')
+
+    Returns:
+        Tuple[str, int, int]: (시작 셀 주소, 끝 행 번호, 끝 열 번호)
+
+    Raises:
+        ValueError: 범위 형식이 잘못된 경우
+    """
+    start_cell, end_cell = merged_range.split(":")
+
+    # 끝 셀 주소 파싱 (간단한 방법)
+    end_col_letter = "".join(filter(str.isalpha, end_cell))
+    end_row_num = int("".join(filter(str.isdigit, end_cell)))
+
+    return start_cell, end_row_num, _col_letter_to_num(end_col_letter)
+
+
+def _merge_span_attrs(cell: Dict[str, Any]) -> Optional[str]:
+    """
+    병합 셀의 colspan/rowspan 속성을 생성합니다.
+
+    Args:
+        cell (Dict[str, Any]): 셀 데이터
+
+    Returns:
+        Optional[str]: 병합 시작 셀이면 span 속성, 병합에 가려지는 셀이면 None,
+            일반 셀(범위 정보가 없거나 해석에 실패한 경우 포함)이면 빈 문자열
+    """
+    merged_range = cell.get("merge_range", "") if cell.get("is_merged") else ""
+    if not merged_range or ":" not in merged_range:
+        return ""
+
+    try:
+        # 병합 범위 문자열은 범위마다 한 번만 해석 (캐시)
+        start_cell, end_row_num, end_col_num = _parse_merge_range(merged_range)
+        if cell["address"] != start_cell:
+            return None
+
+        colspan = end_col_num - cell["col"] + 1
+        rowspan = end_row_num - cell["row"] + 1
+        return f' colspan="{colspan}" rowspan="{rowspan}"'
+    except Exception:
+        return ""
+
+
+# 문자 종류 태그 (_calculate_line_width에서 str.translate 결과를 str.count로 집계)
+_KOREAN_TAG, _ENGLISH_TAG, _NUMBER_TAG, _SPACE_TAG = "\x01", "\x02", "\x03", "\x04"
+_CHAR_CATEGORY_TABLE: Optional[Dict[int, str]] = None
+
+
+def _char_category_table() -> Dict[int, str]:
+    """
+    문자 종류별 태그로 바꾸는 str.translate 테이블을 반환합니다. (처음 호출 시 한 번만 생성)
+
+    Returns:
+        Dict[int, str]: {코드 포인트: 태그 문자}
+    """
+    global _CHAR_CATEGORY_TABLE
+    if _CHAR_CATEGORY_TABLE is None:
+        table = {}
+        # 입력에 태그 문자 자체가 있으면 기타 문자로 취급
+        for tag in (_KOREAN_TAG, _ENGLISH_TAG, _NUMBER_TAG, _SPACE_TAG):
+            table[ord(tag)] = "\x05"
+        for code in range(0x110000):
+            char = chr(code)
+            if char.isdigit():
+                table[code] = _NUMBER_TAG
+            elif char.isspace():
+                table[code] = _SPACE_TAG
+        for code in range(ord("A"), ord("Z") + 1):
+            table[code] = _ENGLISH_TAG
+            table[code + 32] = _ENGLISH_TAG
+        for start, end in (("\u3131", "\u318E"), ("\uAC00", "\uD7A3")):
+            for code in range(ord(start), ord(end) + 1):
+                table[code] = _KOREAN_TAG
+        _CHAR_CATEGORY_TABLE = table
+    return _CHAR_CATEGORY_TABLE
+
+
+@lru_cache(maxsize=4096)
+def _calculate_line_width(line: str) -> int:
+    """한 줄의 텍스트 너비를 계산 (같은 문자열은 한 번만 계산)"""
+    if not line:
+        return 80
+
+    text_length = len(line)
+    # 문자마다 파이썬 코드로 분류하지 않고 C 수준의 translate/count로 한 번에 집계
+    tagged = line.translate(_char_category_table())
+    korean_chars = tagged.count(_KOREAN_TAG)
+    english_chars = tagged.count(_ENGLISH_TAG)
+    number_chars = tagged.count(_NUMBER_TAG)
+    space_chars = tagged.count(_SPACE_TAG)
+    special_chars = text_length - korean_chars - english_chars - number_chars - space_chars
+
+    estimated_width = (
+        korean_chars * 12 +
+        english_chars * 8 +
+        number_chars * 8 +
+        space_chars * 4 +
+        special_chars * 6
+    )
+    estimated_width += 20  # padding
+
+    # 최소 너비 120px (세로 배치 텍스트 보정도 이 값과 같으므로 별도 처리 불필요)
+    return max(estimated_width, 120)
+
+
+@lru_cache(maxsize=4096)
+def _estimate_text_width(text: str) -> int:
+    """문자열 길이를 픽셀 단위로 추정 (같은 문자열은 한 번만 계산)"""
+    if not text:
+        return 80
+
+    # 개행이 있는 경우 가장 긴 줄만을 기준으로 계산
+    if "\n" in text:
+        lines = text.split("\n")
+        max_line_width = 0
+
+        for line in lines:
+            line = line.strip()  # 앞뒤 공백 제거
+            if not line:  # 빈 줄은 건너뛰기
+                continue
+
+            # 각 줄의 너비 계산
+            line_width = _calculate_line_width(line)
+            max_line_width = max(max_line_width, line_width)
+
+        return max(max_line_width, 80)
+    else:
+        # 개행이 없는 경우 기존 방식으로 계산
+        return _calculate_line_width(text)
+
+
+@lru_cache(maxsize=128)
+def _compile_number_format(number_format: str) -> Callable[[Any], str]:
+    """
+    숫자 서식에 맞는 변환 함수를 반환합니다. (같은 서식은 한 번만 해석)
+
+    Args:
+        number_format (str): Excel 숫자 서식 (예: '0.00', '0%')
+
+    Returns:
+        Callable[[Any], str]: 숫자를 문자열로 변환하는 함수
+    """
+    # 간단한 포맷 처리 (실제로는 더 복잡한 로직 필요)
+    if "0.00" in number_format:
+        return "{:.2f}".format
+    if "0%" in number_format:
+        return "{:.0%}".format
+    return str
+
 
 class HTMLRenderer:
     """Excel 데이터를 HTML로 변환하는 클래스"""
@@ -24,13 +249,26 @@ class HTMLRenderer:
             template_dir (str): 템플릿 디렉토리 경로
         """
         self.template_dir = template_dir
+
+        # 컴파일된 템플릿 바이트코드를 디스크에 보관하여 프로세스 재시작 시 재컴파일 방지
+        cache_dir = os.path.join(tempfile.gettempdir(), "jinja2_excel_cache")
+        os.makedirs(cache_dir, exist_ok=True)
+
         self.env = Environment(
             loader=FileSystemLoader(template_dir),
             autoescape=True,
             trim_blocks=True,
             lstrip_blocks=True,
+            bytecode_cache=FileSystemBytecodeCache(cache_dir, "excel_%s.cache"),
         )
 
+        # 시트 템플릿은 한 번만 조회하여 재사용 (렌더링마다 로더 조회/수정 시간 확인 생략)
+        try:
+            self._sheet_template: Optional[Template] = self.env.get_template("sheet.html")
+        except Exception as e:
+            logger.warning(f"시트 템플릿 로드 실패: {str(e)}")
+            self._sheet_template = None
+
     def render_sheet(self, sheet_data: Dict[str, Any]) -> str:
         """
         시트 데이터를 HTML로 렌더링합니다.
@@ -42,16 +280,19 @@ class HTMLRenderer:
             str: 렌더링된 HTML 문자열
         """
         try:
-            template = self.env.get_template("sheet.html")
+            template = self._sheet_template
+            if template is None:
+                # 초기화 시 로드에 실패했다면 여기서 다시 시도하여 오류를 그대로 처리
+                template = self._sheet_template = self.env.get_template("sheet.html")
 
             # CSS 스타일 생성
-            css_styles = self._generate_css_styles(sheet_data)
+            css_styles, cell_classes = self._generate_css_styles(sheet_data)
 
             # 렌더링 컨텍스트 준비
             context = {
                 "sheet_data": sheet_data,
                 "css_styles": css_styles,
-                "table_html": self._generate_table_html(sheet_data),
+                "table_html": "".join(self._iter_table_html(sheet_data, cell_classes)),
             }
 
             return template.render(**context)
@@ -60,114 +301,104 @@ class HTMLRenderer:
             logger.error(f"HTML 렌더링 실패: {str(e)}")
             return self._generate_fallback_html(sheet_data)
 
-    def _generate_css_styles(self, sheet_data: Dict[str, Any]) -> str:
+    def _generate_css_styles(self, sheet_data: Dict[str, Any]) -> Tuple[str, List[List[Optional[str]]]]:
         """
         CSS 스타일을 생성합니다.
 
+        셀마다 규칙을 만들지 않고 서로 다른 서식마다 .s{번호} 클래스 규칙을 하나씩 만듭니다.
+
         Args:
             sheet_data (Dict[str, Any]): 시트 데이터
 
         Returns:
-            str: CSS 스타일 문자열
+            Tuple[str, List[List[Optional[str]]]]: (CSS 스타일 문자열, 셀별 클래스 이름)
         """
-        css_rules = []
+        # 기본 테이블 스타일 (고정 문자열)
+        css_rules = [_BASE_CSS]
 
-        # 기본 테이블 스타일
-        css_rules.append(
-            """
-        .excel-table {
-            border-collapse: collapse;
-            font-family: 'Calibri', 'Arial', sans-serif;
-            font-size: 16px;
-            width: auto;
-            table-layout: auto;
-        }
-        
-        .excel-table td, .excel-table th {
-            border: 1px solid #d0d0d0;
-            padding: 2px 4px;
-            vertical-align: top;
-            white-space: normal;
-            word-wrap: break-word;
-            word-break: break-word;
-            min-width: 50px;
-            max-width: 400px;
-            height: auto;
-            min-height: 20px;
-        }
-        """
-        )
+        # 같은 서식의 셀은 하나의 클래스를 공유하도록 스타일별로 CSS 규칙을 한 번만 생성
+        style_classes: Dict[tuple, str] = {}
+        # 파서가 같은 서식의 셀에 스타일 딕셔너리를 공유하므로 객체 id로 선언 목록을 재사용
+        declarations_by_id: Dict[tuple, tuple] = {}
+        cell_classes: List[List[Optional[str]]] = []
 
-        # 셀별 스타일 생성
-        for row_idx, row in enumerate(sheet_data.get("cells", [])):
-            for col_idx, cell in enumerate(row):
+        for row in sheet_data.get("cells", []):
+            row_classes: List[Optional[str]] = []
+            for cell in row:
                 if not cell:
+                    row_classes.append(None)
                     continue
 
-                cell_selector = f".cell-{row_idx}-{col_idx}"
-                cell_styles = []
-
-                # 폰트 스타일
                 font = cell.get("font", {})
-                if font.get("bold"):
-                    cell_styles.append("font-weight: bold;")
-                if font.get("italic"):
-                    cell_styles.append("font-style: italic;")
-                if font.get("underline"):
-                    cell_styles.append("text-decoration: underline;")
-                if font.get("size"):
-                    cell_styles.append(f"font-size: {font['size']}px;")
-                if font.get("name"):
-                    cell_styles.append(f"font-family: '{font['name']}', sans-serif;")
-                if font.get("color") and font["color"] is not None:
-                    cell_styles.append(f"color: {self._format_color(font['color'])};")
-
-                # 배경색
                 fill = cell.get("fill", {})
-                if fill.get("color") and fill["color"] is not None:
-                    cell_styles.append(
-                        f"background-color: {self._format_color(fill['color'])};"
-                    )
-
-                # 정렬
                 alignment = cell.get("alignment", {})
-                if alignment.get("horizontal"):
-                    cell_styles.append(f"text-align: {alignment['horizontal']};")
-                if alignment.get("vertical"):
-                    cell_styles.append(f"vertical-align: {alignment['vertical']};")
-                if alignment.get("wrap_text"):
-                    cell_styles.append("white-space: normal; word-wrap: break-word;")
-                else:
-                    # 기본적으로 텍스트 줄바꿈 허용
-                    cell_styles.append("white-space: normal; word-wrap: break-word;")
-
-                # 테두리
                 border = cell.get("border", {})
-                border_styles = self._generate_border_css(border)
-                if border_styles:
-                    cell_styles.extend(border_styles)
-
-                # 스타일이 있으면 CSS 규칙 추가
-                if cell_styles:
-                    css_rules.append(f"{cell_selector} {{ {' '.join(cell_styles)} }}")
-
-        # 병합 셀 스타일
-        for merged_cell in sheet_data.get("merged_cells", []):
-            start_row = merged_cell["start_row"] - sheet_data["dimensions"]["start_row"]
-            start_col = merged_cell["start_col"] - sheet_data["dimensions"]["start_col"]
-            end_row = merged_cell["end_row"] - sheet_data["dimensions"]["start_row"]
-            end_col = merged_cell["end_col"] - sheet_data["dimensions"]["start_col"]
-
-            css_rules.append(
-                f"""
-            .cell-{start_row}-{start_col} {{
-                grid-column: {start_col + 1} / {end_col + 2};
-                grid-row: {start_row + 1} / {end_row + 2};
-            }}
-            """
+
+                style_id = (id(font), id(fill), id(alignment), id(border))
+                declarations = declarations_by_id.get(style_id)
+                if declarations is None:
+                    declarations = self._generate_cell_declarations(font, fill, alignment, border)
+                    declarations_by_id[style_id] = declarations
+
+                cell_class = style_classes.get(declarations)
+                if cell_class is None:
+                    cell_class = f"s{len(style_classes)}"
+                    style_classes[declarations] = cell_class
+                    css_rules.append(f".{cell_class} {{ {' '.join(declarations)} }}")
+                row_classes.append(cell_class)
+            cell_classes.append(row_classes)
+
+        # 병합 셀은 테이블의 colspan/rowspan으로 처리하므로 별도 CSS 규칙이 필요 없음
+        return "\n".join(css_rules), cell_classes
+
+    def _generate_cell_declarations(self, font: Dict[str, Any], fill: Dict[str, Any],
+                                    alignment: Dict[str, Any], border: Dict[str, Any]) -> tuple:
+        """
+        셀 하나의 CSS 선언 목록을 생성합니다.
+
+        Args:
+            font (Dict[str, Any]): 폰트 정보
+            fill (Dict[str, Any]): 배경 정보
+            alignment (Dict[str, Any]): 정렬 정보
+            border (Dict[str, Any]): 테두리 정보
+
+        Returns:
+            tuple: CSS 선언 튜플 (스타일 클래스 키로도 사용)
+        """
+        cell_styles = []
+
+        # 폰트 스타일
+        if font.get("bold"):
+            cell_styles.append("font-weight: bold;")
+        if font.get("italic"):
+            cell_styles.append("font-style: italic;")
+        if font.get("underline"):
+            cell_styles.append("text-decoration: underline;")
+        if font.get("size"):
+            cell_styles.append(f"font-size: {font['size']}px;")
+        if font.get("name"):
+            cell_styles.append(f"font-family: '{font['name']}', sans-serif;")
+        if font.get("color") and font["color"] is not None:
+            cell_styles.append(f"color: {self._format_color(font['color'])};")
+
+        # 배경색
+        if fill.get("color") and fill["color"] is not None:
+            cell_styles.append(
+                f"background-color: {self._format_color(fill['color'])};"
             )
 
-        return "\n".join(css_rules)
+        # 정렬
+        if alignment.get("horizontal"):
+            cell_styles.append(f"text-align: {alignment['horizontal']};")
+        if alignment.get("vertical"):
+            cell_styles.append(f"vertical-align: {alignment['vertical']};")
+        # 기본적으로 텍스트 줄바꿈 허용 (wrap_text 여부와 관계없이 동일)
+        cell_styles.append("white-space: normal; word-wrap: break-word;")
+
+        # 테두리
+        cell_styles.extend(self._generate_border_css(border))
+
+        return tuple(cell_styles)
 
     def _generate_border_css(self, border: Dict[str, Any]) -> List[str]:
         """
@@ -214,482 +445,105 @@ class HTMLRenderer:
         if not color:
             return "#000000"
 
-        try:
-            # 문자열로 변환
-            color_str = str(color)
-
-            # RGB 형식 (예: FF0000)
-            if color_str.startswith("FF"):
-                return f"#{color_str[2:]}"
-            elif len(color_str) == 6 and color_str.isalnum():
-                return f"#{color_str}"
-            elif color_str.startswith("theme_"):
-                # 테마 색상은 기본 색상으로 대체
-                return "#000000"
-            elif color_str.startswith("indexed_"):
-                # 인덱스 색상은 기본 색상으로 대체
-                return "#000000"
-            elif color_str.startswith("RGB"):
-                # RGB 객체인 경우 기본 색상으로 대체
-                return "#000000"
-
-            return "#000000"
-        except Exception:
-            # 예외 발생 시 기본 색상 반환
-            return "#000000"
-
+        # 문자열로 변환 후 같은 색상은 캐시된 결과 사용
+        return _format_css_color(str(color))
 
     def _estimate_text_width(self, text: str) -> int:
         """문자열 길이를 픽셀 단위로 추정"""
-        if not text:
-            return 80
-
-        # 개행이 있는 경우 가장 긴 줄만을 기준으로 계산
-        if "\n" in text:
-            lines = text.split("\n")
-            max_line_width = 0
-            
-            for line in lines:
-                line = line.strip()  # 앞뒤 공백 제거
-                if not line:  # 빈 줄은 건너뛰기
-                    continue
-                    
-                # 각 줄의 너비 계산
-                line_width = self._calculate_line_width(line)
-                max_line_width = max(max_line_width, line_width)
-            
-            return max(max_line_width, 80)
-        else:
-            # 개행이 없는 경우 기존 방식으로 계산
-            return self._calculate_line_width(text)
-    
+        return _estimate_text_width(text)
+
     def _calculate_line_width(self, line: str) -> int:
         """한 줄의 텍스트 너비를 계산"""
-        if not line:
-            return 80
-            
-        text_length = len(line)
-        korean_chars = sum(1 for c in line if '\u3131' <= c <= '\u318E' or '\uAC00' <= c <= '\uD7A3')
-        english_chars = sum(1 for c in line if c.isascii() and c.isalpha())
-        number_chars = sum(1 for c in line if c.isdigit())
-        space_chars = sum(1 for c in line if c.isspace())
-        special_chars = text_length - korean_chars - english_chars - number_chars - space_chars
-
-        estimated_width = (
-            korean_chars * 12 +
-            english_chars * 8 +
-            number_chars * 8 +
-            space_chars * 4 +
-            special_chars * 6
-        )
-        estimated_width += 20  # padding
-
-        # 세로 배치 텍스트(한 글자씩 줄바꿈) 최소 보정
-        if text_length > 5 and all(len(w) == 1 for w in line):
-            estimated_width = max(estimated_width, 120)
-
-        return max(estimated_width, 120)
-        
-
-    def _compute_column_widths(self, sheet_data: Dict[str, Any]) -> Dict[int, int]:
-        """모든 셀을 스캔해서 열별 최대 폭 계산"""
-        column_widths = {}
-
-        for row in sheet_data.get("cells", []):
-            for col_idx, cell in enumerate(row):
-                if not cell:
-                    continue
-                text = str(cell.get("value", "") or "")
-                width = self._estimate_text_width(text)
-
-                if col_idx not in column_widths:
-                    column_widths[col_idx] = width
-                else:
-                    column_widths[col_idx] = max(column_widths[col_idx], width)
-
-        # 최소 120px 이상 보장
-        for k in column_widths:
-            column_widths[k] = max(column_widths[k], 120)
-
-        return column_widths
-
+        return _calculate_line_width(line)
 
-    def _generate_table_html(self, sheet_data: Dict[str, Any]) -> str:
+    def _iter_table_html(self, sheet_data: Dict[str, Any],
+                         cell_classes: Optional[List[List[Optional[str]]]] = None) -> Iterator[str]:
         """
-        테이블 HTML을 생성합니다.
+        테이블 HTML을 조각 단위로 생성합니다.
+
+        전체 문자열을 만들지 않으므로 호출자가 "".join으로 합치거나 파일에 바로 기록할 수 있습니다.
 
         Args:
             sheet_data (Dict[str, Any]): 시트 데이터
+            cell_classes (List[List[Optional[str]]], optional): _generate_css_styles에서 만든 셀별 클래스 이름
 
-        Returns:
-            str: 테이블 HTML 문자열
+        Yields:
+            str: 테이블 HTML 조각
         """
-        html_parts = ['<table class="excel-table">']
-
-        # 행 높이와 열 너비 설정
+        cells = sheet_data.get("cells", [])
         row_heights = sheet_data.get("row_heights", {})
-        column_widths = self._compute_column_widths(sheet_data)
+        start_row = sheet_data["dimensions"]["start_row"]
 
-        for row_idx, row in enumerate(sheet_data.get("cells", [])):
-            # 행 높이 설정
-            row_height = row_heights.get(
-                row_idx + sheet_data["dimensions"]["start_row"], None
+        yield '<table class="excel-table">'
+
+        # 열 너비는 셀마다 지정하지 않고 <colgroup>으로 열마다 한 번만 지정
+        # (<colgroup>은 <tr>보다 앞에 와야 하므로 일반 셀의 너비를 먼저 집계)
+        column_widths: List[int] = []
+        for row in cells:
+            for col_idx, cell in enumerate(row):
+                if not cell or _merge_span_attrs(cell) != "":
+                    continue
+                width = self._cell_min_width(cell)
+                if col_idx >= len(column_widths):
+                    column_widths.extend([0] * (col_idx + 1 - len(column_widths)))
+                if width > column_widths[col_idx]:
+                    column_widths[col_idx] = width
+
+        if column_widths:
+            # 자동 테이블 레이아웃에서 <col>의 width는 열의 최소 너비로 동작
+            cols = "".join(
+                f'<col style="width: {width}px;">' if width else "<col>"
+                for width in column_widths
             )
-            row_style = f' style="height: {row_height}px;"' if row_height else ""
+            yield f"<colgroup>{cols}</colgroup>"
 
-            html_parts.append(f"<tr{row_style}>")
+        for row_idx, row in enumerate(cells):
+            # 행 높이 설정
+            row_height = row_heights.get(row_idx + start_row, None)
+            row_parts = [f'<tr style="height: {row_height}px;">' if row_height else "<tr>"]
 
             for col_idx, cell in enumerate(row):
                 if not cell:
                     continue
 
-                # 셀 클래스
-                cell_class = f"cell-{row_idx}-{col_idx}"
-
-                # 병합 셀 처리
-                if cell.get("is_merged"):
+                span_attrs = _merge_span_attrs(cell)
+                if span_attrs is None:
                     # 병합된 셀 중 첫 번째 셀만 내용 표시
-                    merged_range = cell.get("merge_range", "")
-                    if merged_range and ":" in merged_range:
-                        try:
-                            start_cell, end_cell = merged_range.split(":")
-                            if cell["address"] == start_cell:
-                                # 병합 범위 계산
-                                start_row = (
-                                    cell["row"] - sheet_data["dimensions"]["start_row"]
-                                )
-                                start_col = (
-                                    cell["col"] - sheet_data["dimensions"]["start_col"]
-                                )
-
-                                # 끝 셀 주소 파싱 (간단한 방법)
-                                end_col_letter = "".join(filter(str.isalpha, end_cell))
-                                end_row_num = int(
-                                    "".join(filter(str.isdigit, end_cell))
-                                )
-                                end_row = (
-                                    end_row_num - sheet_data["dimensions"]["start_row"]
-                                )
-
-                                # 열 주소를 숫자로 변환 (A=1, B=2, ..., Z=26, AA=27, ...)
-                                end_col = 0
-                                for i, char in enumerate(end_col_letter):
-                                    end_col += (ord(char) - ord("A") + 1) * (
-                                        26 ** (len(end_col_letter) - i - 1)
-                                    )
-                                end_col = (
-                                    end_col - sheet_data["dimensions"]["start_col"]
-                                )
-
-                                colspan = end_col - start_col + 1
-                                rowspan = end_row - start_row + 1
-
-                                # 병합된 셀의 너비 계산 (병합된 셀의 내용에 맞춤)
-                                cell_value = cell.get('value', '')
-                                if cell_value is not None:
-                                    text = str(cell_value)
-                                    estimated_width = self._estimate_text_width(text)
-                                    # 병합된 셀은 내용에 맞는 적절한 너비 설정
-                                    merged_cell_width = max(estimated_width, 120)
-                                    cell_style = f' style="min-width: {merged_cell_width}px; max-width: {merged_cell_width * 2}px;"'
-                                else:
-                                    cell_style = ' style="min-width: 120px;"'
-
-                                html_parts.append(
-                                    f'<td class="{cell_class}"{cell_style} '
-                                    f'colspan="{colspan}" rowspan="{rowspan}">'
-                                    f"{self._format_cell_value(cell)}</td>"
-                                )
-                            else:
-                                # 병합된 셀은 건너뛰기
-                                continue
-                        except Exception as e:
-                            # 병합 셀 처리 실패 시 일반 셀로 처리
-                            cell_value = cell.get('value', '')
-                            if cell_value is not None:
-                                text = str(cell_value)
-                                estimated_width = self._estimate_text_width(text)
-                                cell_style = f' style="min-width: {estimated_width}px; max-width: {estimated_width * 2}px;"'
-                            else:
-                                cell_style = ' style="min-width: 120px;"'
-                            
-                            html_parts.append(
-                                f'<td class="{cell_class}"{cell_style}>'
-                                f"{self._format_cell_value(cell)}</td>"
-                            )
-                    else:
-                        # 병합 셀 정보가 없는 경우 일반 셀로 처리
-                        cell_value = cell.get('value', '')
-                        if cell_value is not None:
-                            text = str(cell_value)
-                            estimated_width = self._estimate_text_width(text)
-                            cell_style = f' style="min-width: {estimated_width}px; max-width: {estimated_width * 2}px;"'
-                        else:
-                            cell_style = ' style="min-width: 120px;"'
-                        
-                        html_parts.append(
-                            f'<td class="{cell_class}"{cell_style}>'
-                            f"{self._format_cell_value(cell)}</td>"
-                        )
+                    continue
+
+                if span_attrs:
+                    # 병합된 셀은 여러 열에 걸치므로 셀에 직접 너비 지정 (최소 120px)
+                    width = max(self._cell_min_width(cell), 120)
+                    cell_style = f' style="min-width: {width}px; max-width: {width * 2}px;"'
                 else:
-                    # 일반 셀 처리 - 각 셀의 데이터 길이에 맞는 독립적인 너비 설정
-                    cell_value = cell.get('value', '')
-                    if cell_value is not None:
-                        text = str(cell_value)
-                        estimated_width = self._estimate_text_width(text)
-                        cell_style = f' style="min-width: {estimated_width}px; max-width: {estimated_width * 2}px;"'
-                    else:
-                        cell_style = ' style="min-width: 120px;"'
-                    
-                    html_parts.append(
-                        f'<td class="{cell_class}"{cell_style}>'
-                        f"{self._format_cell_value(cell)}</td>"
-                    )
-
-            html_parts.append("</tr>")
-
-        html_parts.append("</table>")
-        table_html = "\n".join(html_parts)
-
-        return table_html
-
-    def _save_html_file(self, table_html: str, sheet_data: Dict[str, Any]):
-        """
-        생성된 HTML을 파일로 저장합니다.
-        
-        Args:
-            table_html (str): 테이블 HTML 문자열
-            sheet_data (Dict[str, Any]): 시트 데이터
-        """
-        try:
-            import os
-            from pathlib import Path
-            from datetime import datetime
-            
-            # outputs 디렉토리 생성
-            outputs_dir = Path("outputs")
-            outputs_dir.mkdir(exist_ok=True)
-            
-            # 파일명 생성 (시트명과 타임스탬프 포함)
-            sheet_name = sheet_data.get("sheet_name", "unknown")
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{sheet_name}_{timestamp}.html"
-            file_path = outputs_dir / filename
-            
-            # 테이블 너비 계산
-            total_width = self._calculate_table_width(sheet_data)
-            
-            # 완전한 HTML 문서 생성
-            full_html = f"""<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Excel Sheet - {sheet_name}</title>
-    <style>
-        body {{
-            font-family: 'Calibri', 'Arial', sans-serif;
-            margin: 20px;
-            background-color: #f5f5f5;
-            width: auto;
-            min-width: auto;
-            max-width: none;
-            overflow-x: auto;
-        }}
-        .excel-table {{
-            border-collapse: collapse;
-            font-family: 'Calibri', 'Arial', sans-serif;
-            font-size: 16px;
-            width: auto;
-            table-layout: auto;
-            background-color: #ffffff;
-        }}
-        
-        .excel-table td, .excel-table th {{
-            border: 1px solid #d0d0d0;
-            padding: 8px 10px;
-            vertical-align: top;
-            white-space: pre-wrap;
-            word-wrap: break-word;
-            word-break: break-all;
-            overflow-wrap: break-word;
-            min-width: 80px;
-            max-width: none;
-            min-height: 30px;
-            height: auto;
-            box-sizing: border-box;
-            font-size: 16px;
-            line-height: 1.4;
-            text-overflow: ellipsis;
-            overflow: visible;
-        }}
-        
-        .excel-table th {{
-            background-color: #f8f9fa;
-            font-weight: bold;
-            text-align: center;
-        }}
-        
-        .excel-table tr:nth-child(even) {{
-            background-color: #fafafa;
-        }}
-        
-        .excel-table tr:hover {{
-            background-color: #f0f8ff;
-        }}
-        
-        /* 긴 텍스트 셀 스타일 */
-        .excel-table .long-text {{
-            max-height: none;
-            overflow: visible;
-            white-space: pre-wrap;
-            word-wrap: break-word;
-            word-break: break-all;
-            overflow-wrap: break-word;
-            min-height: 50px;
-            height: auto;
-        }}
-        
-        .excel-table .text-cell {{
-            text-align: left;
-            white-space: pre-wrap;
-            word-wrap: break-word;
-            word-break: break-all;
-            overflow-wrap: break-word;
-            min-height: 45px;
-            height: auto;
-            overflow: visible;
-        }}
-        
-        /* 긴 텍스트 내용 스타일 */
-        .long-text-content {{
-            display: inline-block;
-            word-wrap: break-word;
-            word-break: break-word;
-            overflow-wrap: break-word;
-            white-space: pre-wrap;
-            max-width: 100%;
-        }}
-        
-        /* 수식 셀 스타일 */
-        .excel-table .formula-cell {{
-            font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-            font-size: 14px;
-            background-color: #f8f9fa;
-            border-left: 3px solid #007acc;
-        }}
-        
-        /* 스크롤바 스타일 */
-        .excel-table td::-webkit-scrollbar,
-        .excel-table th::-webkit-scrollbar {{
-            width: 6px;
-            height: 6px;
-        }}
-        
-        .excel-table td::-webkit-scrollbar-track,
-        .excel-table th::-webkit-scrollbar-track {{
-            background: #f1f1f1;
-            border-radius: 3px;
-        }}
-        
-        .excel-table td::-webkit-scrollbar-thumb,
-        .excel-table th::-webkit-scrollbar-thumb {{
-            background: #c1c1c1;
-            border-radius: 3px;
-        }}
-        
-        .excel-table td::-webkit-scrollbar-thumb:hover,
-        .excel-table th::-webkit-scrollbar-thumb:hover {{
-            background: #a8a8a8;
-        }}
-        
-        /* 고해상도 디스플레이 대응 */
-        @media (-webkit-min-device-pixel-ratio: 2), (min-resolution: 192dpi) {{
-            .excel-table td, .excel-table th {{
-                padding: 8px 10px;
-                min-height: 35px;
-            }}
-        }}
-        
-        /* 인쇄 스타일 */
-        @media print {{
-            body {{
-                background-color: white;
-                margin: 0;
-                width: auto;
-                min-width: auto;
-                max-width: none;
-            }}
-            .excel-table {{
-                page-break-inside: auto;
-                width: auto;
-            }}
-            .excel-table tr {{
-                page-break-inside: avoid;
-                page-break-after: auto;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        {table_html}
-    </div>
-</body>
-</html>"""
-
-            # 파일 저장
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(full_html)
-
-            logger.info(f"HTML 파일 저장 완료: {file_path}")
+                    cell_style = ""
 
-        except Exception as e:
-            logger.warning(f"HTML 파일 저장 실패: {str(e)}")
-            # HTML 파일 저장 실패는 전체 변환에 영향을 주지 않도록 경고만 출력
-    
-    def _calculate_table_width(self, sheet_data: Dict[str, Any]) -> int:
+                # 셀 클래스 (같은 서식의 셀은 같은 클래스를 공유)
+                cell_class = cell_classes[row_idx][col_idx] if cell_classes else ""
+                row_parts.append(
+                    TD_FORMAT % (cell_class, cell_style, span_attrs, self._format_cell_value(cell))
+                )
+
+            row_parts.append("</tr>")
+            # 행 단위로 내보내 조각 수를 줄임
+            yield "".join(row_parts)
+
+        yield "</table>"
+
+    def _cell_min_width(self, cell: Dict[str, Any]) -> int:
         """
-        테이블의 총 너비를 계산합니다.
-        
+        셀 데이터 길이에 맞는 최소 너비를 계산합니다.
+
         Args:
-            sheet_data (Dict[str, Any]): 시트 데이터
-            
+            cell (Dict[str, Any]): 셀 데이터
+
         Returns:
-            int: 테이블 총 너비 (픽셀)
+            int: 최소 너비 (픽셀, 빈 값은 120)
         """
-        try:
-            total_width = 0
-            column_widths = sheet_data.get("column_widths", {})
-            dimensions = sheet_data.get("dimensions", {})
-            
-            # 각 열의 너비를 합산
-            for col_idx in range(dimensions.get("columns", 0)):
-                col_num = col_idx + dimensions.get("start_col", 1)
-                col_width = column_widths.get(col_num, 100)  # 기본 너비 100px
-                
-                # 열 너비가 픽셀 단위가 아닌 경우 변환
-                if col_width and isinstance(col_width, (int, float)):
-                    # Excel 열 너비를 픽셀로 변환 (대략적인 변환)
-                    pixel_width = int(col_width * 7)  # Excel 열 너비 1 = 약 7픽셀
-                    pixel_width = max(pixel_width, 80)  # 최소 너비 80px
-                    total_width += pixel_width
-                else:
-                    total_width += 100  # 기본 너비
-            
-            # 테이블이 비어있는 경우 기본 너비 설정
-            if total_width == 0:
-                total_width = 800
-            
-            # 여백과 패딩 추가
-            total_width += 40  # 좌우 여백
-            
-            logger.info(f"테이블 총 너비 계산: {total_width}px")
-            return total_width
-            
-        except Exception as e:
-            logger.warning(f"테이블 너비 계산 실패: {str(e)}, 기본값 800px 사용")
-            return 800
+        cell_value = cell.get("value", "")
+        if cell_value is None:
+            return 120
+        return self._estimate_text_width(str(cell_value))
 
     def _format_cell_value(self, cell: Dict[str, Any]) -> str:
         """
@@ -710,16 +564,14 @@ class HTMLRenderer:
             number_format = cell.get("number_format", "")
             if number_format:
                 try:
-                    # 간단한 포맷 처리 (실제로는 더 복잡한 로직 필요)
-                    if "0.00" in number_format:
-                        return f"{value:.2f}"
-                    elif "0%" in number_format:
-                        return f"{value:.0%}"
+                    # 서식 문자열은 종류마다 한 번만 해석 (캐시)
+                    return _compile_number_format(number_format)(value)
                 except:
                     pass
             return str(value)
         else:
-            return str(value)
+            # 표 HTML은 템플릿에서 safe로 삽입되므로 문자열 값은 여기서 이스케이프
+            return str(value).translate(_HTML_ESCAPE)
 
     def _generate_fallback_html(self, sheet_data: Dict[str, Any]) -> str:
         """
@@ -747,22 +599,31 @@ class HTMLRenderer:
             <h2>Excel Sheet: {sheet_data.get('sheet_name', 'Unknown')}</h2>
             <p>Error occurred during rendering. Showing basic table.</p>
             <table>
-                {self._generate_table_html(sheet_data)}
+                {"".join(self._iter_table_html(sheet_data))}
             </table>
         </body>
         </html>
         """
 
 
-def render_excel_to_html(sheet_data: Dict[str, Any]) -> str:
+@lru_cache(maxsize=8)
+def _get_shared_renderer(template_dir: str) -> HTMLRenderer:
+    """템플릿 디렉토리별 HTMLRenderer를 한 번만 생성하여 재사용합니다. (렌더링 상태를 보관하지 않아 스레드 간 공유 가능)"""
+    return HTMLRenderer(template_dir)
+
+
+def render_excel_to_html(sheet_data: Dict[str, Any], template_dir: str = "templates") -> str:
     """
     Excel 데이터를 HTML로 변환하는 편의 함수
 
+    호출마다 Jinja2 Environment를 만들고 템플릿을 다시 로드하지 않도록
+    템플릿 디렉토리별로 공유 렌더러를 사용합니다.
+
     Args:
         sheet_data (Dict[str, Any]): ExcelParser에서 추출한 시트 데이터
+        template_dir (str): 템플릿 디렉토리 경로
 
     Returns:
         str: 렌더링된 HTML 문자열
     """
-    renderer = HTMLRenderer()
-    return renderer.render_sheet(sheet_data)
+    return _get_shared_renderer(template_dir).render_sheet(sheet_data)
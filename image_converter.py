@@ -6,28 +6,283 @@ Playwright를 사용하여 HTML을 렌더링하고 스크린샷을 캡처합니
 """
 
 import asyncio
+import atexit
 import io
 import os
-import tempfile
-from typing import Optional, Tuple, Dict, Any
-from playwright.sync_api import sync_playwright, Browser, Page
+import threading
+from concurrent.futures import Executor
+from typing import Optional, Tuple, Dict, Any, List
+from playwright.sync_api import sync_playwright, Browser, Page, TimeoutError as PlaywrightTimeoutError
 from PIL import Image
 import logging
 
+from browser_pool import (
+    acquire_page, build_launch_options, build_context_options,
+    QUALITY_CSS, DEFAULT_DEVICE_SCALE_FACTOR
+)
+from render_cache import RenderCache, make_cache_key
+
 logger = logging.getLogger(__name__)
 
+# 스크린샷 작업을 처리하는 워커 수 (동시에 열리는 BrowserContext 수)
+SCREENSHOT_WORKERS = 4
+
+# 워커 하나가 같은 컨텍스트에서 연속으로 처리할 최대 작업 수
+SCREENSHOT_BATCH_SIZE = 8
+
+# 작업 사이에 되돌릴 기본 뷰포트 (이전 작업의 크기가 다음 측정에 영향을 주지 않도록)
+DEFAULT_VIEWPORT = {'width': 1920, 'height': 1080}
+
+# PNG 파일 시그니처
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# 페이지 내용의 실제 크기를 측정하는 스크립트
+_CONTENT_SIZE_SCRIPT = """
+() => {
+    const body = document.body;
+    const html = document.documentElement;
+    
+    return {
+        width: Math.max(
+            body.scrollWidth,
+            body.offsetWidth,
+            html.clientWidth,
+            html.scrollWidth,
+            html.offsetWidth
+        ),
+        height: Math.max(
+            body.scrollHeight,
+            body.offsetHeight,
+            html.clientHeight,
+            html.scrollHeight,
+            html.offsetHeight
+        )
+    };
+}
+"""
+
+# 폰트 로드가 끝나고 레이아웃/페인트가 반영될 때까지(두 프레임) 기다리는 스크립트
+_RENDER_READY_SCRIPT = """
+async () => {
+    await document.fonts.ready;
+    await new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+}
+"""
+
+
+def _png_may_have_alpha(data: bytes) -> bool:
+    """
+    PNG 헤더만 읽어 투명도가 있을 수 있는지 확인합니다. (이미지 디코딩 없음)
+    
+    Args:
+        data (bytes): 이미지 바이트 데이터
+        
+    Returns:
+        bool: 알파 채널 또는 tRNS 청크가 있거나 PNG가 아니면 True
+    """
+    if len(data) < 33 or data[:8] != _PNG_SIGNATURE or data[12:16] != b'IHDR':
+        return True
+    
+    # IHDR 색상 형식: 4 = 회색조+알파, 6 = RGBA
+    if data[25] in (4, 6):
+        return True
+    
+    # 팔레트/회색조/RGB 이미지도 IDAT 앞의 tRNS 청크로 투명색을 지정할 수 있음
+    idat = data.find(b'IDAT')
+    return b'tRNS' in (data[:idat] if idat != -1 else data)
+
+
+def _validate_output_options(output_path: str, image_format: str, quality: int) -> bool:
+    """
+    변환 함수들이 공통으로 사용하는 출력 옵션을 검증합니다.
+    
+    Args:
+        output_path (str): 출력 이미지 경로
+        image_format (str): 이미지 형식
+        quality (int): 이미지 품질
+        
+    Returns:
+        bool: 유효 여부 (유효하지 않으면 오류를 기록)
+    """
+    if not output_path or output_path.strip() == '':
+        logger.error("출력 경로가 비어있습니다.")
+        return False
+    
+    # 이미지 형식 검증
+    if image_format.lower() not in ['png', 'jpeg', 'jpg']:
+        logger.error(f"지원하지 않는 이미지 형식: {image_format}")
+        return False
+    
+    # 품질 값 검증
+    if not isinstance(quality, int) or quality < 1 or quality > 100:
+        logger.error(f"유효하지 않은 품질 값: {quality} (1-100 범위여야 함)")
+        return False
+    return True
+
+
+def _compute_page_size(content_size: Dict[str, int], width: Optional[int] = None,
+                       height: Optional[int] = None) -> Tuple[int, int]:
+    """
+    측정된 내용 크기로부터 최종 페이지 크기를 계산합니다.
+    
+    Args:
+        content_size (Dict[str, int]): 측정된 내용 크기
+        width (int, optional): 강제 너비
+        height (int, optional): 강제 높이
+        
+    Returns:
+        Tuple[int, int]: (final_width, final_height)
+    """
+    # 사용자 지정 크기 또는 측정된 크기 사용
+    final_width = width or content_size['width']
+    final_height = height or content_size['height']
+    
+    # 여백 추가 (Windows 호환성을 위해 조정 - 간소화)
+    margin = 40  # 여백을 더 줄여서 균등하게
+    final_width += margin * 2
+    final_height += margin * 2
+    
+    # 최소 크기 보장 (Windows 호환성을 위해 조정 - 간소화)
+    final_width = max(final_width, 800)  # 최소 너비 조정
+    final_height = max(final_height, 600)  # 최소 높이 조정
+    
+    return final_width, final_height
+
+
+# 페이지 높이 기준별 글자 크기 CSS: (기준 높이, 글자 크기, CSS), 높은 기준부터 검사
+_FONT_SCALE_STYLES = (
+    # 20000px 이상: 가장 큰 글자 크기
+    (20000, 28, """
+            .excel-table {
+                font-size: 68px !important;
+                line-height: 1.6 !important;
+            }
+            .excel-table td, .excel-table th {
+                font-size: 28px !important;
+                line-height: 1.6 !important;
+                padding: 12px 14px !important;
+                min-height: 45px !important;
+            }
+            .excel-table .long-text {
+                font-size: 26px !important;
+                line-height: 1.5 !important;
+            }
+            .excel-table .text-cell {
+                font-size: 27px !important;
+                line-height: 1.5 !important;
+            }
+            .excel-table .formula-cell {
+                font-size: 25px !important;
+                line-height: 1.5 !important;
+            }
+        """),
+    # 15000px 이상: 큰 글자 크기
+    (15000, 24, """
+            .excel-table {
+                font-size: 24px !important;
+                line-height: 1.55 !important;
+            }
+            .excel-table td, .excel-table th {
+                font-size: 24px !important;
+                line-height: 1.55 !important;
+                padding: 10px 12px !important;
+                min-height: 40px !important;
+            }
+            .excel-table .long-text {
+                font-size: 22px !important;
+                line-height: 1.45 !important;
+            }
+            .excel-table .text-cell {
+                font-size: 23px !important;
+                line-height: 1.45 !important;
+            }
+            .excel-table .formula-cell {
+                font-size: 21px !important;
+                line-height: 1.45 !important;
+            }
+        """),
+    # 10000px 이상: 중간 글자 크기
+    (10000, 22, """
+            .excel-table {
+                font-size: 22px !important;
+                line-height: 1.5 !important;
+            }
+            .excel-table td, .excel-table th {
+                font-size: 22px !important;
+                line-height: 1.5 !important;
+                padding: 9px 11px !important;
+                min-height: 38px !important;
+            }
+            .excel-table .long-text {
+                font-size: 20px !important;
+                line-height: 1.4 !important;
+            }
+            .excel-table .text-cell {
+                font-size: 21px !important;
+                line-height: 1.4 !important;
+            }
+            .excel-table .formula-cell {
+                font-size: 19px !important;
+                line-height: 1.4 !important;
+            }
+        """),
+    # 5000px 이상: 기본 큰 글자 크기
+    (5000, 20, """
+            .excel-table {
+                font-size: 20px !important;
+                line-height: 1.5 !important;
+            }
+            .excel-table td, .excel-table th {
+                font-size: 20px !important;
+                line-height: 1.5 !important;
+                padding: 8px 10px !important;
+                min-height: 35px !important;
+            }
+            .excel-table .long-text {
+                font-size: 18px !important;
+                line-height: 1.4 !important;
+            }
+            .excel-table .text-cell {
+                font-size: 19px !important;
+                line-height: 1.4 !important;
+            }
+            .excel-table .formula-cell {
+                font-size: 18px !important;
+                line-height: 1.4 !important;
+            }
+        """),
+)
+
+
+def _get_font_scale_style(final_height: int) -> Optional[Tuple[int, int, str]]:
+    """
+    페이지 높이에 따른 단계별 글자 크기 CSS를 반환합니다.
+    
+    Args:
+        final_height (int): 최종 페이지 높이
+        
+    Returns:
+        Optional[Tuple[int, int, str]]: (기준 높이, 글자 크기, CSS) 또는 조정이 필요 없으면 None
+    """
+    for font_scale in _FONT_SCALE_STYLES:
+        if final_height >= font_scale[0]:
+            return font_scale
+    return None
+
 
 class ImageConverter:
     """HTML을 이미지로 변환하는 클래스"""
     
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, device_scale_factor: float = DEFAULT_DEVICE_SCALE_FACTOR):
         """
         ImageConverter 초기화
         
         Args:
             headless (bool): 헤드리스 모드 여부
+            device_scale_factor (float): 디바이스 배율 (작고 빠른 이미지가 필요하면 1)
         """
         self.headless = headless
+        self.device_scale_factor = device_scale_factor
         self.browser = None
         self.page = None
         self.playwright = None
@@ -36,7 +291,7 @@ class ImageConverter:
         """Playwright 브라우저를 초기화합니다."""
         try:
             # 이미 초기화되어 있으면 스킵
-            if self.page and self.browser and self.playwright:
+            if self.page and self.browser and self.playwright and self.browser.is_connected():
                 logger.info("Playwright 브라우저가 이미 초기화되어 있습니다.")
                 return
             
@@ -52,108 +307,21 @@ class ImageConverter:
                 os.environ['PYTHONUNBUFFERED'] = '1'
                 os.environ['PYTHONIOENCODING'] = 'utf-8'
                 
-            self.playwright = sync_playwright().start()
-            
-            # Windows와 Linux 호환성을 위한 브라우저 옵션 (간소화)
-            browser_args = [
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-dev-shm-usage',
-                '--no-first-run',
-                '--disable-gpu',
-                '--disable-background-timer-throttling',
-                '--disable-backgrounding-occluded-windows',
-                '--disable-renderer-backgrounding',
-                '--disable-features=TranslateUI',
-                '--disable-ipc-flooding-protection',
-                '--disable-default-apps',
-                '--disable-extensions',
-                '--disable-plugins',
-                '--disable-sync',
-                '--disable-translate',
-                '--hide-scrollbars',
-                '--mute-audio',
-                '--no-default-browser-check',
-                '--no-pings',
-                '--disable-web-security',
-                '--allow-running-insecure-content'
-            ]
-            
-            # Windows 특정 옵션 (간소화)
-            if platform.system() == 'Windows':
-                browser_args.extend([
-                    '--disable-gpu-sandbox',
-                    '--disable-software-rasterizer',
-                    '--disable-gpu-process'
-                ])
+            if self.playwright is None:
+                self.playwright = sync_playwright().start()
             
-            # Windows와 Linux 호환성을 위한 브라우저 실행 옵션
-            browser_options = {
-                'headless': self.headless,
-                'args': browser_args
-            }
-            
-            # Windows에서 추가 옵션 (이미지 품질 향상)
-            if platform.system() == 'Windows':
-                browser_options.update({
-                    'executable_path': None,  # 시스템 기본 경로 사용
-                    'ignore_default_args': ['--disable-extensions'],
-                    'chromium_sandbox': False  # 샌드박스 비활성화로 안정성 향상
-                })
-            
-            # 브라우저 실행
-            self.browser = self.playwright.chromium.launch(**browser_options)
+            # 브라우저 실행 (브라우저 풀과 동일한 실행 옵션 사용, 실행 중인 브라우저는 재사용)
+            if self.browser is None or not self.browser.is_connected():
+                self.browser = self.playwright.chromium.launch(**build_launch_options(self.headless))
             
             # 컨텍스트 생성 (이미지 품질 향상)
-            context_options = {
-                'viewport': {
-                    'width': 1920,
-                    'height': 1080
-                },
-                'device_scale_factor': 2,  # 고해상도 렌더링
-                'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
-            
-            # Windows에서 추가 컨텍스트 옵션
-            if platform.system() == 'Windows':
-                context_options.update({
-                    'locale': 'ko-KR',
-                    'timezone_id': 'Asia/Seoul'
-                })
-            
-            context = self.browser.new_context(**context_options)
+            context = self.browser.new_context(
+                **build_context_options(device_scale_factor=self.device_scale_factor)
+            )
             
             # 페이지 생성
             self.page = context.new_page()
             
-            # 페이지 설정 (이미지 품질 향상)
-            self.page.set_extra_http_headers({
-                'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8'
-            })
-            
-            # 이미지 품질 향상을 위한 추가 설정
-            self.page.add_init_script("""
-                // 폰트 렌더링 품질 향상
-                document.documentElement.style.webkitFontSmoothing = 'antialiased';
-                document.documentElement.style.mozOsxFontSmoothing = 'grayscale';
-                document.documentElement.style.textRendering = 'optimizeLegibility';
-                
-                // 이미지 렌더링 품질 향상
-                const style = document.createElement('style');
-                style.textContent = `
-                    * {
-                        image-rendering: -webkit-optimize-contrast;
-                        image-rendering: -webkit-crisp-edges;
-                        image-rendering: -moz-crisp-edges;
-                        image-rendering: crisp-edges;
-                        text-rendering: optimizeLegibility;
-                        -webkit-font-smoothing: antialiased;
-                        -moz-osx-font-smoothing: grayscale;
-                    }
-                `;
-                document.head.appendChild(style);
-            """)
-            
             logger.info("Playwright 브라우저 초기화 완료")
             
         except Exception as e:
@@ -162,6 +330,14 @@ class ImageConverter:
             self._cleanup_resources()
             raise
     
+    def _prepare_page(self):
+        """페이지를 준비합니다. (처음이면 브라우저를 초기화하고, 재사용 시 뷰포트를 기본값으로 복원)"""
+        if not self.page or not self.browser or not self.browser.is_connected():
+            self.initialize()
+        else:
+            # 이전 작업에서 늘린 뷰포트가 다음 측정에 영향을 주지 않도록 복원
+            self.page.set_viewport_size(DEFAULT_VIEWPORT)
+    
     def convert_html_to_image(self, html_content: str, output_path: str,
                             image_format: str = 'png', quality: int = 95,
                             width: Optional[int] = None, height: Optional[int] = None) -> bool:
@@ -185,91 +361,64 @@ class ImageConverter:
                 logger.error("HTML 내용이 비어있습니다.")
                 return False
             
-            if not output_path or output_path.strip() == '':
-                logger.error("출력 경로가 비어있습니다.")
+            # 출력 경로/이미지 형식/품질 값 검증
+            if not _validate_output_options(output_path, image_format, quality):
                 return False
             
-            # 이미지 형식 검증
-            if image_format.lower() not in ['png', 'jpeg', 'jpg']:
-                logger.error(f"지원하지 않는 이미지 형식: {image_format}")
-                return False
+            # 브라우저가 초기화되지 않았으면 초기화
+            self._prepare_page()
             
-            # 품질 값 검증
-            if not isinstance(quality, int) or quality < 1 or quality > 100:
-                logger.error(f"유효하지 않은 품질 값: {quality} (1-100 범위여야 함)")
-                return False
+            # HTML을 임시 파일 없이 페이지에 직접 로드
+            try:
+                self.page.set_content(html_content, wait_until='domcontentloaded', timeout=30000)
+            except Exception as e:
+                logger.warning(f"domcontentloaded 대기 실패, 기본 대기로 대체: {e}")
+                self.page.set_content(html_content, timeout=30000)
             
-            # 브라우저가 초기화되지 않았으면 초기화
-            if not self.page or not self.browser:
-                self.initialize()
+            # 이미지 품질 향상 CSS 삽입
+            self.page.add_style_tag(content=QUALITY_CSS)
             
-            # 임시 HTML 파일 생성
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as f:
-                f.write(html_content)
-                temp_html_path = f.name
+            # 페이지 크기 조정
+            self._adjust_page_size(width, height)
             
-            try:
-                # HTML 파일 로드 (Windows 호환성 개선 - 간소화)
+            # 고정 시간 대기 대신 폰트 로드와 크기 조정 후의 레이아웃/페인트 완료를 대기
+            self.page.evaluate(_RENDER_READY_SCRIPT)
+            
+            # 스크린샷 캡처 (이미지 품질 향상)
+            screenshot_type = 'jpeg' if image_format.lower() in ('jpeg', 'jpg') else 'png'
+            screenshot_options = {
+                'type': screenshot_type,
+                'full_page': True,
+                'omit_background': False,  # 배경 포함으로 선명도 향상
+                'timeout': 30000,
+                'scale': 'css',  # CSS 스케일 사용으로 선명도 향상
+                # 배경을 포함한 캡처는 후처리가 필요 없으므로 Chromium 결과를 바로 파일로 저장
+                # (바이트 버퍼 보관, 디코딩/재인코딩 생략)
+                'path': self._prepare_output_path(output_path)
+            }
+            
+            # JPEG인 경우에만 quality 옵션 추가
+            if screenshot_type == 'jpeg':
+                screenshot_options['quality'] = quality
+            
+            # 스크린샷 시간 초과 시에만 재시도 (Windows 안정성)
+            max_retries = 3
+            for attempt in range(max_retries):
                 try:
-                    self.page.goto(f'file://{temp_html_path}', wait_until='domcontentloaded', timeout=30000)
-                except Exception as e:
-                    logger.warning(f"domcontentloaded 대기 실패, 기본 대기로 대체: {e}")
-                    self.page.goto(f'file://{temp_html_path}', timeout=30000)
-                
-                # 페이지 로드 후 잠시 대기 (Windows 안정성)
-                import time
-                time.sleep(0.5)
-                
-                # 페이지 크기 조정
-                self._adjust_page_size(width, height)
-                
-                # 스크린샷 캡처 (이미지 품질 향상)
-                screenshot_options = {
-                    'type': image_format,
-                    'full_page': True,
-                    'omit_background': False,  # 배경 포함으로 선명도 향상
-                    'timeout': 30000,
-                    'scale': 'css',  # CSS 스케일 사용으로 선명도 향상
-                    'quality': 100 if image_format == 'jpeg' else None  # 최고 품질
-                }
-                
-                # JPEG인 경우에만 quality 옵션 추가
-                if image_format == 'jpeg':
-                    screenshot_options['quality'] = quality
-                
-                # Windows에서 추가 안정성을 위한 재시도 로직 (이미지 품질 향상)
-                max_retries = 3
-                for attempt in range(max_retries):
-                    try:
-                        # 페이지가 완전히 로드될 때까지 대기
-                        self.page.wait_for_load_state('networkidle', timeout=10000)
-                        
-                        # 추가 렌더링 대기 (이미지 품질 향상)
-                        import time
-                        time.sleep(1.0)
-                        
-                        screenshot_bytes = self.page.screenshot(**screenshot_options)
-                        break
-                    except Exception as e:
-                        if attempt == max_retries - 1:
-                            raise e
-                        logger.warning(f"스크린샷 캡처 재시도 {attempt + 1}/{max_retries}: {e}")
-                        time.sleep(1.0)
-                
-                # 이미지 후처리 및 저장
-                self._process_and_save_image(screenshot_bytes, output_path, image_format, quality)
-                
-                logger.info(f"이미지 변환 완료: {output_path}")
-                return True
-                
-            finally:
-                # 임시 파일 삭제
-                os.unlink(temp_html_path)
-                
+                    self.page.screenshot(**screenshot_options)
+                    break
+                except PlaywrightTimeoutError as e:
+                    if attempt == max_retries - 1:
+                        raise e
+                    logger.warning(f"스크린샷 캡처 재시도 {attempt + 1}/{max_retries}: {e}")
+            
+            logger.info(f"이미지 변환 완료: {output_path}")
+            return True
+            
         except Exception as e:
             logger.error(f"이미지 변환 실패: {str(e)}")
-            # 변환 실패 시 리소스 정리
-            self._cleanup_resources()
+            # 변환 실패 시 페이지의 컨텍스트만 교체 (브라우저는 유지)
+            self._recycle_page()
             return False
     
     def _adjust_page_size(self, width: Optional[int] = None, height: Optional[int] = None):
@@ -282,192 +431,27 @@ class ImageConverter:
         """
         try:
             # 페이지 내용의 실제 크기 측정 (Windows 호환성 개선 - 간소화)
-            try:
-                content_size = self.page.evaluate("""
-                () => {
-                    const body = document.body;
-                    const html = document.documentElement;
-                    
-                    return {
-                        width: Math.max(
-                            body.scrollWidth,
-                            body.offsetWidth,
-                            html.clientWidth,
-                            html.scrollWidth,
-                            html.offsetWidth
-                        ),
-                        height: Math.max(
-                            body.scrollHeight,
-                            body.offsetHeight,
-                            html.clientHeight,
-                            html.scrollHeight,
-                            html.offsetHeight
-                        )
-                    };
-                }
-                """)
-            except Exception as e:
-                logger.warning(f"페이지 크기 측정 실패, 기본값 사용: {e}")
-                content_size = {'width': 800, 'height': 600}
+            if width and height:
+                # 너비/높이를 모두 지정하면 측정값을 사용하지 않으므로 측정 생략
+                content_size = {}
+            else:
+                try:
+                    content_size = self.page.evaluate(_CONTENT_SIZE_SCRIPT)
+                except Exception as e:
+                    logger.warning(f"페이지 크기 측정 실패, 기본값 사용: {e}")
+                    content_size = {'width': 800, 'height': 600}
 
-            logger.info(f"페이지 크기 측정: {content_size}")
+                logger.info(f"페이지 크기 측정: {content_size}")
             
-            # 사용자 지정 크기 또는 측정된 크기 사용
-            final_width = width or content_size['width']
-            final_height = height or content_size['height']
-            
-            # 여백 추가 (Windows 호환성을 위해 조정 - 간소화)
-            margin = 40  # 여백을 더 줄여서 균등하게
-            final_width += margin * 2
-            final_height += margin * 2
-            
-            # 최소 크기 보장 (Windows 호환성을 위해 조정 - 간소화)
-            final_width = max(final_width, 800)  # 최소 너비 조정
-            final_height = max(final_height, 600)  # 최소 높이 조정
+            final_width, final_height = _compute_page_size(content_size, width, height)
             
             # 높이에 따른 단계별 글자 크기 조정
-            if final_height >= 20000:
-                # 20000px 이상: 가장 큰 글자 크기
-                try:
-                    self.page.evaluate("""
-                    () => {
-                        const style = document.createElement('style');
-                        style.textContent = `
-                            .excel-table {
-                                font-size: 68px !important;
-                                line-height: 1.6 !important;
-                            }
-                            .excel-table td, .excel-table th {
-                                font-size: 28px !important;
-                                line-height: 1.6 !important;
-                                padding: 12px 14px !important;
-                                min-height: 45px !important;
-                            }
-                            .excel-table .long-text {
-                                font-size: 26px !important;
-                                line-height: 1.5 !important;
-                            }
-                            .excel-table .text-cell {
-                                font-size: 27px !important;
-                                line-height: 1.5 !important;
-                            }
-                            .excel-table .formula-cell {
-                                font-size: 25px !important;
-                                line-height: 1.5 !important;
-                            }
-                        `;
-                        document.head.appendChild(style);
-                    }
-                    """)
-                    logger.info(f"높이가 {final_height}px로 20000 이상이므로 글자 크기를 28px로 조정")
-                except Exception as e:
-                    logger.warning(f"글자 크기 조정 실패: {e}")
-            elif final_height >= 15000:
-                # 15000px 이상: 큰 글자 크기
+            font_scale = _get_font_scale_style(final_height)
+            if font_scale:
+                threshold, font_size, css = font_scale
                 try:
-                    self.page.evaluate("""
-                    () => {
-                        const style = document.createElement('style');
-                        style.textContent = `
-                            .excel-table {
-                                font-size: 24px !important;
-                                line-height: 1.55 !important;
-                            }
-                            .excel-table td, .excel-table th {
-                                font-size: 24px !important;
-                                line-height: 1.55 !important;
-                                padding: 10px 12px !important;
-                                min-height: 40px !important;
-                            }
-                            .excel-table .long-text {
-                                font-size: 22px !important;
-                                line-height: 1.45 !important;
-                            }
-                            .excel-table .text-cell {
-                                font-size: 23px !important;
-                                line-height: 1.45 !important;
-                            }
-                            .excel-table .formula-cell {
-                                font-size: 21px !important;
-                                line-height: 1.45 !important;
-                            }
-                        `;
-                        document.head.appendChild(style);
-                    }
-                    """)
-                    logger.info(f"높이가 {final_height}px로 15000 이상이므로 글자 크기를 24px로 조정")
-                except Exception as e:
-                    logger.warning(f"글자 크기 조정 실패: {e}")
-            elif final_height >= 10000:
-                # 10000px 이상: 중간 글자 크기
-                try:
-                    self.page.evaluate("""
-                    () => {
-                        const style = document.createElement('style');
-                        style.textContent = `
-                            .excel-table {
-                                font-size: 22px !important;
-                                line-height: 1.5 !important;
-                            }
-                            .excel-table td, .excel-table th {
-                                font-size: 22px !important;
-                                line-height: 1.5 !important;
-                                padding: 9px 11px !important;
-                                min-height: 38px !important;
-                            }
-                            .excel-table .long-text {
-                                font-size: 20px !important;
-                                line-height: 1.4 !important;
-                            }
-                            .excel-table .text-cell {
-                                font-size: 21px !important;
-                                line-height: 1.4 !important;
-                            }
-                            .excel-table .formula-cell {
-                                font-size: 19px !important;
-                                line-height: 1.4 !important;
-                            }
-                        `;
-                        document.head.appendChild(style);
-                    }
-                    """)
-                    logger.info(f"높이가 {final_height}px로 10000 이상이므로 글자 크기를 22px로 조정")
-                except Exception as e:
-                    logger.warning(f"글자 크기 조정 실패: {e}")
-            elif final_height >= 5000:
-                # 5000px 이상: 기본 큰 글자 크기
-                try:
-                    self.page.evaluate("""
-                    () => {
-                        const style = document.createElement('style');
-                        style.textContent = `
-                            .excel-table {
-                                font-size: 20px !important;
-                                line-height: 1.5 !important;
-                            }
-                            .excel-table td, .excel-table th {
-                                font-size: 20px !important;
-                                line-height: 1.5 !important;
-                                padding: 8px 10px !important;
-                                min-height: 35px !important;
-                            }
-                            .excel-table .long-text {
-                                font-size: 18px !important;
-                                line-height: 1.4 !important;
-                            }
-                            .excel-table .text-cell {
-                                font-size: 19px !important;
-                                line-height: 1.4 !important;
-                            }
-                            .excel-table .formula-cell {
-                                font-size: 18px !important;
-                                line-height: 1.4 !important;
-                            }
-                        `;
-                        document.head.appendChild(style);
-                    }
-                    """)
-                    logger.info(f"높이가 {final_height}px로 5000 이상이므로 글자 크기를 20px로 조정")
+                    self.page.add_style_tag(content=css)
+                    logger.info(f"높이가 {final_height}px로 {threshold} 이상이므로 글자 크기를 {font_size}px로 조정")
                 except Exception as e:
                     logger.warning(f"글자 크기 조정 실패: {e}")
             
@@ -490,8 +474,50 @@ class ImageConverter:
         except Exception as e:
             logger.error(f"페이지 크기 조정 실패: {str(e)}")
     
-    def _process_and_save_image(self, screenshot_bytes: bytes, output_path: str,
-                              image_format: str, quality: int):
+    @staticmethod
+    def _prepare_output_path(output_path: str) -> str:
+        """
+        출력 경로를 검증하고 절대 경로로 정규화한 뒤 출력 디렉토리를 생성합니다.
+        
+        Args:
+            output_path (str): 출력 경로
+            
+        Returns:
+            str: 정규화된 절대 경로
+            
+        Raises:
+            ValueError: 경로가 유효하지 않거나 디렉토리를 만들 수 없는 경우
+        """
+        # 경로 검증 및 정규화
+        if not output_path or output_path.strip() == '':
+            raise ValueError("출력 경로가 비어있습니다.")
+        
+        # 경로를 절대 경로로 정규화
+        output_path = os.path.abspath(output_path.strip())
+        
+        # 디렉토리 경로 추출 및 검증
+        output_dir = os.path.dirname(output_path)
+        if not output_dir:
+            raise ValueError(f"유효하지 않은 출력 경로: {output_path}")
+        
+        # 디렉토리가 존재하지 않으면 생성
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+            logger.info(f"출력 디렉토리 생성/확인: {output_dir}")
+        except Exception as e:
+            logger.error(f"출력 디렉토리 생성 실패: {output_dir}, 오류: {str(e)}")
+            raise ValueError(f"출력 디렉토리를 생성할 수 없습니다: {output_dir}")
+        
+        # 파일명 검증
+        filename = os.path.basename(output_path)
+        if not filename or filename.strip() == '':
+            raise ValueError(f"유효하지 않은 파일명: {output_path}")
+        
+        return output_path
+    
+    @staticmethod
+    def _process_and_save_image(screenshot_bytes: bytes, output_path: str,
+                                image_format: str, quality: int, opaque: bool = False):
         """
         스크린샷을 후처리하고 저장합니다.
         
@@ -500,32 +526,33 @@ class ImageConverter:
             output_path (str): 출력 경로
             image_format (str): 이미지 형식
             quality (int): 이미지 품질
+            opaque (bool): 배경을 포함해 캡처한 스크린샷인지 여부 (omit_background=False)
+                (False여도 PNG 헤더에 투명도가 없으면 그대로 저장)
         """
         try:
-            # 경로 검증 및 정규화
-            if not output_path or output_path.strip() == '':
-                raise ValueError("출력 경로가 비어있습니다.")
-            
-            # 경로를 절대 경로로 정규화
-            output_path = os.path.abspath(output_path.strip())
+            # 경로 검증 및 출력 디렉토리 준비
+            output_path = ImageConverter._prepare_output_path(output_path)
             
-            # 디렉토리 경로 추출 및 검증
-            output_dir = os.path.dirname(output_path)
-            if not output_dir:
-                raise ValueError(f"유효하지 않은 출력 경로: {output_path}")
-            
-            # 디렉토리가 존재하지 않으면 생성
-            try:
-                os.makedirs(output_dir, exist_ok=True)
-                logger.info(f"출력 디렉토리 생성/확인: {output_dir}")
-            except Exception as e:
-                logger.error(f"출력 디렉토리 생성 실패: {output_dir}, 오류: {str(e)}")
-                raise ValueError(f"출력 디렉토리를 생성할 수 없습니다: {output_dir}")
+            if image_format.lower() == 'png':
+                save_as_is = opaque or not _png_may_have_alpha(screenshot_bytes)
+            else:
+                # 배경을 포함해 요청 품질로 캡처한 JPEG는 이미 최종 결과물
+                save_as_is = opaque and screenshot_bytes[:2] == b'\xff\xd8'
             
-            # 파일명 검증
-            filename = os.path.basename(output_path)
-            if not filename or filename.strip() == '':
-                raise ValueError(f"유효하지 않은 파일명: {output_path}")
+            if save_as_is:
+                # 흰 배경 합성이 필요 없으므로 디코딩/재인코딩 없이 그대로 저장
+                try:
+                    with open(output_path, 'wb') as f:
+                        f.write(screenshot_bytes)
+                except PermissionError as e:
+                    logger.error(f"파일 저장 권한 오류: {output_path}, 오류: {str(e)}")
+                    raise ValueError(f"파일 저장 권한이 없습니다: {output_path}")
+                except OSError as e:
+                    logger.error(f"파일 시스템 오류: {output_path}, 오류: {str(e)}")
+                    raise ValueError(f"파일 시스템 오류: {str(e)}")
+                
+                logger.info(f"이미지 저장 완료: {output_path}")
+                return
             
             # PIL Image로 변환
             image = Image.open(io.BytesIO(screenshot_bytes))
@@ -533,26 +560,29 @@ class ImageConverter:
             # 이미지 품질 향상을 위한 후처리
             if image.mode in ('RGBA', 'LA', 'P'):
                 # 투명도가 있는 이미지는 RGB로 변환
-                background = Image.new('RGB', image.size, (255, 255, 255))
                 if image.mode == 'P':
                     image = image.convert('RGBA')
-                background.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
-                image = background
+                if image.mode == 'RGBA' and image.getchannel('A').getextrema()[0] == 255:
+                    # 모든 픽셀이 불투명하면 흰 배경 합성 없이 알파 채널만 제거
+                    image = image.convert('RGB')
+                else:
+                    background = Image.new('RGB', image.size, (255, 255, 255))
+                    background.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
+                    image = background
             
             # 이미지 저장 (최고품질 설정)
             try:
                 if image_format.lower() == 'jpeg':
-                    # JPEG 저장 (최고품질)
+                    # JPEG 저장 (화질은 quality로 조절, 인코딩은 단일 패스로 빠르게)
                     image.save(output_path, 'JPEG', 
                               quality=quality, 
-                              optimize=True, 
-                              progressive=True,  # 프로그레시브 JPEG
-                              subsampling=0)  # 서브샘플링 비활성화 (최고품질)
+                              optimize=False,  # 허프만 테이블 최적화용 두 번째 패스 생략
+                              progressive=False, 
+                              subsampling=2)  # 4:2:0 크로마 서브샘플링
                 else:
-                    # PNG 저장 (최고품질)
+                    # PNG 저장 (무손실이므로 압축 레벨은 화질과 무관, 낮은 레벨로 빠르게 저장)
                     image.save(output_path, 'PNG', 
-                              optimize=True, 
-                              compress_level=0)  # 압축 레벨 0 (최고품질)
+                              compress_level=1)
                 
                 logger.info(f"이미지 저장 완료: {output_path}")
                 
@@ -593,30 +623,20 @@ class ImageConverter:
                 logger.error("HTML 파일 경로가 비어있습니다.")
                 return False
             
-            if not output_path or output_path.strip() == '':
-                logger.error("출력 경로가 비어있습니다.")
-                return False
-            
             # HTML 파일 존재 여부 확인
             if not os.path.exists(html_file_path):
                 logger.error(f"HTML 파일이 존재하지 않습니다: {html_file_path}")
                 return False
             
-            # 이미지 형식 검증
-            if image_format.lower() not in ['png', 'jpeg', 'jpg']:
-                logger.error(f"지원하지 않는 이미지 형식: {image_format}")
+            # 출력 경로/이미지 형식/품질 값 검증
+            if not _validate_output_options(output_path, image_format, quality):
                 return False
             
-            # 품질 값 검증
-            if not isinstance(quality, int) or quality < 1 or quality > 100:
-                logger.error(f"유효하지 않은 품질 값: {quality} (1-100 범위여야 함)")
-                return False
-            
-            if not self.page:
-                self.initialize()
+            self._prepare_page()
             
             # HTML 파일 로드
-            self.page.goto(f'file://{os.path.abspath(html_file_path)}', wait_until='networkidle')
+            self.page.goto(f'file://{os.path.abspath(html_file_path)}', wait_until='load')
+            self.page.add_style_tag(content=QUALITY_CSS)
             
             # 페이지 크기 조정
             self._adjust_page_size(width, height)
@@ -650,52 +670,39 @@ class ImageConverter:
             Tuple[int, int]: (width, height)
         """
         try:
-            if not self.page:
-                self.initialize()
+            self._prepare_page()
             
-            # 임시 HTML 파일 생성
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as f:
-                f.write(html_content)
-                temp_html_path = f.name
+            # HTML을 임시 파일 없이 페이지에 직접 로드
+            self.page.set_content(html_content, wait_until='load')
+            self.page.add_style_tag(content=QUALITY_CSS)
+            
+            # 페이지 크기 측정
+            dimensions = self.page.evaluate(_CONTENT_SIZE_SCRIPT)
+            
+            return dimensions['width'], dimensions['height']
             
-            try:
-                # HTML 파일 로드
-                self.page.goto(f'file://{temp_html_path}', wait_until='networkidle')
-                
-                # 페이지 크기 측정
-                dimensions = self.page.evaluate("""
-                    () => {
-                        const body = document.body;
-                        const html = document.documentElement;
-                        return {
-                            width: Math.max(
-                                body.scrollWidth,
-                                body.offsetWidth,
-                                html.clientWidth,
-                                html.scrollWidth,
-                                html.offsetWidth
-                            ),
-                            height: Math.max(
-                                body.scrollHeight,
-                                body.offsetHeight,
-                                html.clientHeight,
-                                html.scrollHeight,
-                                html.offsetHeight
-                            )
-                        };
-                    }
-                """)
-                
-                return dimensions['width'], dimensions['height']
-                
-            finally:
-                # 임시 파일 삭제
-                os.unlink(temp_html_path)
-                
         except Exception as e:
             logger.error(f"페이지 차원 측정 실패: {str(e)}")
             return 800, 600  # 기본값
     
+    def _recycle_page(self):
+        """
+        실패한 작업의 컨텍스트/페이지를 닫습니다. 다음 작업에서 새 컨텍스트를 만듭니다.
+        
+        브라우저 연결이 끊긴 경우에만 브라우저와 Playwright까지 모두 정리합니다.
+        """
+        if self.browser is None or not self.browser.is_connected():
+            self._cleanup_resources()
+            return
+        
+        if self.page:
+            try:
+                self.page.context.close()
+            except Exception as e:
+                logger.warning(f"컨텍스트 닫기 실패: {e}")
+            finally:
+                self.page = None
+    
     def _cleanup_resources(self):
         """리소스를 정리합니다."""
         try:
@@ -738,10 +745,14 @@ class ImageConverter:
 # 비동기 래퍼 함수들 (API 서버용)
 async def convert_html_to_image_async(html_content: str, output_path: str,
                                     image_format: str = 'png', quality: int = 95,
-                                    width: Optional[int] = None, height: Optional[int] = None) -> bool:
+                                    width: Optional[int] = None, height: Optional[int] = None,
+                                    cache: Optional[RenderCache] = None,
+                                    executor: Optional[Executor] = None) -> bool:
     """
     HTML을 이미지로 변환하는 비동기 함수 (API 서버용)
     
+    스크린샷은 ScreenshotBatcher 큐를 거쳐 전역 브라우저 풀에서 처리됩니다.
+    
     Args:
         html_content (str): HTML 내용
         output_path (str): 출력 이미지 경로
@@ -749,39 +760,268 @@ async def convert_html_to_image_async(html_content: str, output_path: str,
         quality (int): 이미지 품질
         width (int, optional): 강제 너비
         height (int, optional): 강제 높이
+        cache (RenderCache, optional): 지정 시 같은 HTML/출력 옵션의 이미지를 재사용하는 캐시
+        executor (Executor, optional): 이미지 후처리를 실행할 스레드 풀 (미지정 시 이벤트 루프 기본 실행기)
         
     Returns:
         bool: 변환 성공 여부
     """
-    def _convert():
-        converter = None
-        try:
-            converter = ImageConverter()
-            return converter.convert_html_to_image(
-                html_content, output_path, image_format, quality, width, height
-            )
-        except Exception as e:
-            logger.error(f"동기 변환 실패: {e}")
-            return False
-        finally:
-            if converter:
-                try:
-                    converter.close()
-                except Exception as e:
-                    logger.warning(f"동기 변환 후 정리 실패: {e}")
-    
     try:
-        # ThreadPoolExecutor를 사용하여 동기 함수를 비동기로 실행
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _convert)
+        # 입력 매개변수 검증
+        if not html_content or html_content.strip() == '':
+            logger.error("HTML 내용이 비어있습니다.")
+            return False
+        
+        # 출력 경로/이미지 형식/품질 값 검증
+        if not _validate_output_options(output_path, image_format, quality):
+            return False
+        
+        # HTML 내용 해시로 캐시 조회 (적중 시 렌더링/스크린샷 생략)
+        image_key = None
+        if cache is not None:
+            image_key = make_cache_key(
+                "html-image", html_content, image_format.lower(), quality, width, height
+            )
+            if await asyncio.to_thread(cache.copy_to, image_key, image_format.lower(), output_path):
+                logger.info(f"이미지 캐시 사용: {output_path}")
+                return True
+        
+        # 스크린샷 큐에 제출 (워커가 대기 중인 작업을 묶어 같은 컨텍스트에서 처리)
+        screenshot_type = 'jpeg' if image_format.lower() in ('jpeg', 'jpg') else 'png'
+        screenshot_bytes = await _SCREENSHOT_BATCHER.submit(
+            html_content, width, height, screenshot_type, quality
+        )
+        
+        # 이미지 후처리 및 저장 (배경 포함 캡처, PIL 작업은 스레드에서 실행)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            executor, ImageConverter._process_and_save_image,
+            screenshot_bytes, output_path, image_format, quality, True
+        )
+        
+        if image_key:
+            try:
+                await asyncio.to_thread(cache.put_file, image_key, image_format.lower(), output_path)
+            except Exception as e:
+                # 캐시 저장 실패는 변환 결과에 영향을 주지 않음
+                logger.warning(f"이미지 캐시 저장 실패: {e}")
+        
+        logger.info(f"이미지 변환 완료: {output_path}")
+        return True
     except Exception as e:
         logger.error(f"비동기 변환 실행 실패: {e}")
         return False
 
 
+async def _adjust_page_size_async(page, width: Optional[int] = None, height: Optional[int] = None):
+    """
+    풀에서 발급받은 페이지의 크기를 조정합니다. (ImageConverter._adjust_page_size의 비동기 버전)
+    
+    Args:
+        page: Playwright 비동기 Page 객체
+        width (int, optional): 강제 너비
+        height (int, optional): 강제 높이
+    """
+    try:
+        if width and height:
+            # 너비/높이를 모두 지정하면 측정값을 사용하지 않으므로 측정 생략
+            content_size = {}
+        else:
+            try:
+                content_size = await page.evaluate(_CONTENT_SIZE_SCRIPT)
+            except Exception as e:
+                logger.warning(f"페이지 크기 측정 실패, 기본값 사용: {e}")
+                content_size = {'width': 800, 'height': 600}
+        
+        final_width, final_height = _compute_page_size(content_size, width, height)
+        
+        # 높이에 따른 단계별 글자 크기 조정
+        font_scale = _get_font_scale_style(final_height)
+        if font_scale:
+            threshold, font_size, css = font_scale
+            try:
+                await page.add_style_tag(content=css)
+                logger.info(f"높이가 {final_height}px로 {threshold} 이상이므로 글자 크기를 {font_size}px로 조정")
+            except Exception as e:
+                logger.warning(f"글자 크기 조정 실패: {e}")
+        
+        await page.set_viewport_size({"width": final_width, "height": final_height})
+        logger.info(f"페이지 크기 조정: {final_width}x{final_height}")
+        
+    except Exception as e:
+        logger.error(f"페이지 크기 조정 실패: {str(e)}")
+
+
+class _ScreenshotJob:
+    """스크린샷 큐에 제출되는 작업"""
+
+    def __init__(self, html_content: str, width: Optional[int], height: Optional[int],
+                 screenshot_type: str, quality: int, future: asyncio.Future):
+        self.html_content = html_content
+        self.width = width
+        self.height = height
+        self.screenshot_type = screenshot_type
+        self.quality = quality
+        self.future = future
+
+
+class ScreenshotBatcher:
+    """
+    스크린샷 작업을 큐로 모아 처리하는 클래스
+    
+    고정된 수의 워커가 큐에서 작업을 꺼내고, 대기 중인 작업이 더 있으면 최대
+    batch_size개까지 함께 꺼내 하나의 BrowserContext/Page에서 연속으로 렌더링합니다.
+    """
+
+    def __init__(self, workers: int = SCREENSHOT_WORKERS, batch_size: int = SCREENSHOT_BATCH_SIZE):
+        """
+        ScreenshotBatcher 초기화
+        
+        Args:
+            workers (int): 워커 수
+            batch_size (int): 한 컨텍스트에서 연속 처리할 최대 작업 수
+        """
+        self.workers = max(workers, 1)
+        self.batch_size = max(batch_size, 1)
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_workers(self):
+        """현재 이벤트 루프에서 큐와 워커를 준비합니다. (처음 제출 시 지연 시작)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._tasks:
+            return
+
+        # 다른 이벤트 루프에서 만든 큐/워커는 사용할 수 없으므로 새로 생성
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._tasks = [
+            loop.create_task(self._worker()) for _ in range(self.workers)
+        ]
+        logger.info(f"스크린샷 워커 시작: {self.workers}개 (배치 크기: {self.batch_size})")
+
+    async def submit(self, html_content: str, width: Optional[int], height: Optional[int],
+                     screenshot_type: str = 'png', quality: int = 95) -> bytes:
+        """
+        스크린샷 작업을 제출하고 결과를 기다립니다.
+        
+        Args:
+            html_content (str): HTML 내용
+            width (int, optional): 강제 너비
+            height (int, optional): 강제 높이
+            screenshot_type (str): 'png' 또는 'jpeg'
+            quality (int): JPEG 품질
+            
+        Returns:
+            bytes: 스크린샷 이미지 데이터
+        """
+        self._ensure_workers()
+        future = self._loop.create_future()
+        await self._queue.put(
+            _ScreenshotJob(html_content, width, height, screenshot_type, quality, future)
+        )
+        return await future
+
+    async def _worker(self):
+        """큐에서 작업을 꺼내 배치 단위로 처리하는 워커 루프"""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                await self._render_batch(batch)
+            except asyncio.CancelledError:
+                for job in batch:
+                    if not job.future.done():
+                        job.future.cancel()
+                raise
+            except Exception as e:
+                # 페이지 발급 실패 등: 남은 작업에 오류 전달
+                for job in batch:
+                    if not job.future.done():
+                        job.future.set_exception(e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _render_batch(self, batch: List[_ScreenshotJob]):
+        """
+        하나의 BrowserContext/Page에서 여러 작업을 연속으로 렌더링합니다.
+        
+        Args:
+            batch (List[_ScreenshotJob]): 처리할 작업 목록
+        """
+        async with acquire_page() as page:
+            first = True
+            for job in batch:
+                if job.future.done():
+                    # 요청 측에서 이미 취소된 작업
+                    continue
+                try:
+                    if not first:
+                        await page.set_viewport_size(DEFAULT_VIEWPORT)
+                    first = False
+
+                    await page.set_content(job.html_content, wait_until='domcontentloaded', timeout=30000)
+                    await page.add_style_tag(content=QUALITY_CSS)
+                    
+                    # 페이지 크기 조정
+                    await _adjust_page_size_async(page, job.width, job.height)
+                    
+                    # 폰트 로드와 크기 조정 후의 레이아웃/페인트 완료를 대기
+                    await page.evaluate(_RENDER_READY_SCRIPT)
+                    
+                    screenshot_bytes = await page.screenshot(
+                        type=job.screenshot_type,
+                        full_page=True,
+                        omit_background=False,
+                        timeout=30000,
+                        scale='css',
+                        quality=job.quality if job.screenshot_type == 'jpeg' else None
+                    )
+                except Exception as e:
+                    if not job.future.done():
+                        job.future.set_exception(e)
+                    continue
+
+                if not job.future.done():
+                    job.future.set_result(screenshot_bytes)
+
+        if len(batch) > 1:
+            logger.info(f"스크린샷 배치 처리 완료: {len(batch)}개")
+
+    async def close(self):
+        """워커를 종료합니다. (대기 중인 작업은 취소됨)"""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._queue is not None:
+            while not self._queue.empty():
+                job = self._queue.get_nowait()
+                if not job.future.done():
+                    job.future.cancel()
+        self._queue = None
+        self._loop = None
+
+
+# 전역 스크린샷 배처
+_SCREENSHOT_BATCHER = ScreenshotBatcher()
+
+
+async def close_screenshot_batcher():
+    """전역 스크린샷 워커를 종료합니다. (API 서버 종료 시 호출)"""
+    await _SCREENSHOT_BATCHER.close()
+
+
 async def convert_html_file_to_image_async(html_file_path: str, output_path: str,
                                          image_format: str = 'png', quality: int = 95,
-                                         width: Optional[int] = None, height: Optional[int] = None) -> bool:
+                                         width: Optional[int] = None, height: Optional[int] = None,
+                                         executor: Optional[Executor] = None) -> bool:
     """
     HTML 파일을 이미지로 변환하는 비동기 함수 (API 서버용)
     
@@ -792,36 +1032,120 @@ async def convert_html_file_to_image_async(html_file_path: str, output_path: str
         quality (int): 이미지 품질
         width (int, optional): 강제 너비
         height (int, optional): 강제 높이
+        executor (Executor, optional): 이미지 후처리를 실행할 스레드 풀 (미지정 시 이벤트 루프 기본 실행기)
         
     Returns:
         bool: 변환 성공 여부
     """
-    def _convert():
-        converter = None
-        try:
-            converter = ImageConverter()
-            return converter.convert_html_file_to_image(
-                html_file_path, output_path, image_format, quality, width, height
-            )
-        except Exception as e:
-            logger.error(f"동기 파일 변환 실패: {e}")
-            return False
-        finally:
-            if converter:
-                try:
-                    converter.close()
-                except Exception as e:
-                    logger.warning(f"동기 파일 변환 후 정리 실패: {e}")
-    
     try:
-        # ThreadPoolExecutor를 사용하여 동기 함수를 비동기로 실행
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _convert)
+        # 입력 매개변수 검증
+        if not html_file_path or html_file_path.strip() == '':
+            logger.error("HTML 파일 경로가 비어있습니다.")
+            return False
+        
+        # HTML 파일 존재 여부 확인
+        if not os.path.exists(html_file_path):
+            logger.error(f"HTML 파일이 존재하지 않습니다: {html_file_path}")
+            return False
+        
+        # 출력 경로/이미지 형식/품질 값 검증
+        if not _validate_output_options(output_path, image_format, quality):
+            return False
+        
+        # 변환마다 브라우저를 실행하지 않고 전역 브라우저 풀의 컨텍스트/페이지 사용
+        # (상대 경로 리소스를 위해 파일 URL로 로드)
+        screenshot_type = 'jpeg' if image_format.lower() in ('jpeg', 'jpg') else 'png'
+        async with acquire_page() as page:
+            await page.goto(f'file://{os.path.abspath(html_file_path)}', wait_until='load')
+            await page.add_style_tag(content=QUALITY_CSS)
+            
+            # 페이지 크기 조정
+            await _adjust_page_size_async(page, width, height)
+            
+            # 폰트 로드와 크기 조정 후의 레이아웃/페인트 완료를 대기
+            await page.evaluate(_RENDER_READY_SCRIPT)
+            
+            screenshot_bytes = await page.screenshot(
+                type=screenshot_type,
+                quality=quality if screenshot_type == 'jpeg' else None,
+                full_page=True,
+                omit_background=True
+            )
+        
+        # 이미지 후처리 및 저장 (PIL 작업은 스레드에서 실행)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            executor, ImageConverter._process_and_save_image,
+            screenshot_bytes, output_path, image_format, quality
+        )
+        
+        logger.info(f"HTML 파일 이미지 변환 완료: {output_path}")
+        return True
     except Exception as e:
         logger.error(f"비동기 파일 변환 실행 실패: {e}")
         return False
 
 
+# 동기 변환용 공유 ImageConverter (Playwright 동기 API는 스레드 간 공유할 수 없으므로 스레드마다 하나)
+# {소유 스레드 ID: 변환기} - 브라우저는 변환기를 만든 스레드에서만 닫을 수 있음
+_thread_local = threading.local()
+_SHARED_CONVERTERS: Dict[int, ImageConverter] = {}
+_SHARED_CONVERTERS_LOCK = threading.Lock()
+
+
+def _get_shared_converter() -> ImageConverter:
+    """
+    현재 스레드에서 재사용할 ImageConverter를 반환합니다.
+    
+    변환마다 Chromium을 새로 실행하지 않고, 한 번 실행한 브라우저를 스레드가
+    close_thread_converter()를 호출할 때까지 (또는 프로세스 종료 시까지) 재사용합니다.
+    
+    Returns:
+        ImageConverter: 스레드별 공유 변환기
+    """
+    converter = getattr(_thread_local, 'converter', None)
+    if converter is None:
+        converter = ImageConverter()
+        _thread_local.converter = converter
+        with _SHARED_CONVERTERS_LOCK:
+            _SHARED_CONVERTERS[threading.get_ident()] = converter
+    return converter
+
+
+def close_thread_converter():
+    """
+    현재 스레드의 공유 ImageConverter 브라우저를 닫습니다.
+    
+    스레드 풀을 종료하기 전에 각 작업 스레드에서 호출해야 합니다.
+    (종료된 스레드의 브라우저는 다른 스레드에서 닫을 수 없음)
+    """
+    converter = getattr(_thread_local, 'converter', None)
+    if converter is None:
+        return
+    del _thread_local.converter
+    with _SHARED_CONVERTERS_LOCK:
+        _SHARED_CONVERTERS.pop(threading.get_ident(), None)
+    converter.close()
+
+
+def close_shared_converters():
+    """
+    현재 스레드가 소유한 공유 ImageConverter의 브라우저를 닫습니다. (프로세스 종료 시 자동 호출)
+    
+    다른 스레드가 만든 변환기는 닫지 않고 목록에서만 제거합니다.
+    (Playwright 동기 API는 생성한 스레드 밖에서 호출할 수 없음)
+    """
+    close_thread_converter()
+    with _SHARED_CONVERTERS_LOCK:
+        leaked = len(_SHARED_CONVERTERS)
+        _SHARED_CONVERTERS.clear()
+    if leaked:
+        logger.warning(f"다른 스레드에서 닫히지 않은 공유 변환기 {leaked}개를 정리하지 못했습니다")
+
+
+atexit.register(close_shared_converters)
+
+
 # 동기 래퍼 함수들 (CLI 모드용 - 기존 호환성 유지)
 def convert_html_to_image_sync(html_content: str, output_path: str,
                               image_format: str = 'png', quality: int = 95,
@@ -840,21 +1164,13 @@ def convert_html_to_image_sync(html_content: str, output_path: str,
     Returns:
         bool: 변환 성공 여부
     """
-    converter = None
     try:
-        converter = ImageConverter()
-        return converter.convert_html_to_image(
+        return _get_shared_converter().convert_html_to_image(
             html_content, output_path, image_format, quality, width, height
         )
     except Exception as e:
         logger.error(f"동기 변환 실패: {e}")
         return False
-    finally:
-        if converter:
-            try:
-                converter.close()
-            except Exception as e:
-                logger.warning(f"동기 변환 후 정리 실패: {e}")
 
 
 def convert_html_file_to_image_sync(html_file_path: str, output_path: str,
@@ -874,18 +1190,10 @@ def convert_html_file_to_image_sync(html_file_path: str, output_path: str,
     Returns:
         bool: 변환 성공 여부
     """
-    converter = None
     try:
-        converter = ImageConverter()
-        return converter.convert_html_file_to_image(
+        return _get_shared_converter().convert_html_file_to_image(
             html_file_path, output_path, image_format, quality, width, height
         )
     except Exception as e:
         logger.error(f"동기 파일 변환 실패: {e}")
-        return False
-    finally:
-        if converter:
-            try:
-                converter.close()
-            except Exception as e:
-                logger.warning(f"동기 파일 변환 후 정리 실패: {e}")
\ No newline at end of file
+        return False
\ No newline at end of file
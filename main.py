@@ -7,70 +7,68 @@ Excel 파일을 이미지로 변환하는 메인 애플리케이션
 
 import os
 import sys
+import atexit
+import queue
 import argparse
 import logging
+import logging.handlers
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 from pathlib import Path
 
 # 프로젝트 모듈 import
-from excel_parser import ExcelParser, parse_excel_file
+from excel_parser import parse_excel_file, parse_all_sheets, read_sheet_names
 from html_renderer import HTMLRenderer, render_excel_to_html
-from image_converter import ImageConverter, convert_html_to_image_sync
-from batch_processor import batch_convert_excel_files, find_excel_files
+from image_converter import ImageConverter, convert_html_to_image_sync, close_thread_converter
+from browser_pool import find_installed_chromium
+from batch_processor import (
+    batch_convert_excel_files, find_excel_files, configure_event_loop_policy, EXCEL_EXTENSIONS
+)
+
+configure_event_loop_policy()
 
 # 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('excel2image.log', encoding='utf-8')
-    ]
-)
+# 콘솔/파일 출력은 별도 스레드의 QueueListener가 처리하고,
+# 작업 코드에서는 큐에 넣기만 하여 로그 I/O가 변환 작업을 막지 않도록 함
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler('excel2image.log', encoding='utf-8')
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# 메시지 인자만 병합하고 최종 형식은 리스너 쪽 핸들러에서 적용
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
+# 배치 종료 시 작업 스레드별 브라우저 정리를 기다리는 최대 시간 (초)
+CONVERTER_CLOSE_TIMEOUT = 30
+
 
 def check_and_install_playwright_browsers():
     """Playwright 브라우저가 설치되어 있는지 확인하고, 없으면 설치합니다."""
     try:
-        # Windows에서 asyncio 이벤트 루프 문제 해결
-        import platform
-        if platform.system() == 'Windows':
-            import asyncio
-            try:
-                # Windows에서 ProactorEventLoop 사용
-                if isinstance(asyncio.get_event_loop_policy(), asyncio.WindowsProactorEventLoopPolicy):
-                    pass  # 이미 ProactorEventLoop 사용 중
-                else:
-                    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-                logger.info("Windows 이벤트 루프 정책 설정 완료")
-            except Exception as e:
-                logger.warning(f"Windows 이벤트 루프 정책 설정 실패: {e}")
-        
-        # playwright 브라우저 설치 확인
-        result = subprocess.run(
-            ['playwright', '--version'], 
-            capture_output=True, 
-            text=True, 
-            timeout=10
-        )
-        
-        if result.returncode != 0:
-            logger.info("Playwright 브라우저를 설치합니다...")
-            subprocess.run(['playwright', 'install', 'chromium'], check=True)
-            logger.info("Playwright 브라우저 설치 완료")
-        else:
+        # 브라우저 설치 디렉토리만 확인 (실행할 때마다 playwright 서브프로세스를 띄우지 않음)
+        if find_installed_chromium():
             logger.info("Playwright 브라우저가 이미 설치되어 있습니다.")
-            
-    except subprocess.TimeoutExpired:
-        logger.warning("Playwright 버전 확인 시간 초과, 브라우저 설치를 시도합니다...")
-        try:
-            subprocess.run(['playwright', 'install', 'chromium'], check=True)
-            logger.info("Playwright 브라우저 설치 완료")
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Playwright 브라우저 설치 실패: {e}")
-            raise
+            return
+        
+        logger.info("Playwright 브라우저를 설치합니다...")
+        subprocess.run(['playwright', 'install', 'chromium'], check=True)
+        logger.info("Playwright 브라우저 설치 완료")
+    except subprocess.CalledProcessError as e:
+        logger.error(f"Playwright 브라우저 설치 실패: {e}")
+        raise
     except FileNotFoundError:
         logger.error("Playwright가 설치되어 있지 않습니다. 'pip install playwright'를 실행하세요.")
         raise
@@ -103,6 +101,8 @@ class ExcelToImageConverter:
             'headless': True,
             'width': None,
             'height': None,
+            'read_only': False,  # 읽기 전용 모드 파싱 (병합 셀/행열 크기 제외)
+            'parse_workers': None,  # 시트 병렬 파싱 프로세스 수 (None이면 자동, 1이면 현재 프로세스)
             'max_workers': 3  # 배치 처리용
         }
         
@@ -110,6 +110,9 @@ class ExcelToImageConverter:
         self.default_config.update(self.config)
         self.config = self.default_config
         
+        # 출력 디렉토리는 처음 출력 경로를 만들 때 한 번만 생성
+        self._output_dir_ready = False
+        
     def convert_excel_to_image(self, 
                               excel_file: str,
                               output_file: Optional[str] = None,
@@ -150,7 +153,8 @@ class ExcelToImageConverter:
             return False
     
     def _parse_excel(self, excel_file: str, sheet_name: Optional[str], 
-                    range_start: Optional[str], range_end: Optional[str]) -> Dict[str, Any]:
+                    range_start: Optional[str], range_end: Optional[str],
+                    read_only: bool = False) -> Dict[str, Any]:
         """
         Excel 파일을 파싱합니다.
         
@@ -159,12 +163,13 @@ class ExcelToImageConverter:
             sheet_name (str, optional): 시트 이름
             range_start (str, optional): 시작 범위
             range_end (str, optional): 끝 범위
+            read_only (bool): 읽기 전용 모드로 파싱 (대용량 파일용, 병합 셀/행열 크기 제외)
             
         Returns:
             Dict[str, Any]: 파싱된 시트 데이터
         """
         try:
-            return parse_excel_file(excel_file, sheet_name, range_start, range_end)
+            return parse_excel_file(excel_file, sheet_name, range_start, range_end, read_only=read_only)
         except Exception as e:
             logger.error(f"Excel 파싱 오류: {str(e)}")
             return {}
@@ -181,7 +186,7 @@ class ExcelToImageConverter:
             str: 렌더링된 HTML
         """
         try:
-            return render_excel_to_html(sheet_data)
+            return render_excel_to_html(sheet_data, template_dir or 'templates')
         except Exception as e:
             logger.error(f"HTML 렌더링 오류: {str(e)}")
             return ""
@@ -242,13 +247,15 @@ class ExcelToImageConverter:
             if not str(output_dir) or str(output_dir).strip() == '':
                 raise ValueError("출력 디렉토리 경로가 비어있습니다.")
             
-            # 디렉토리 생성
-            try:
-                output_dir.mkdir(exist_ok=True)
-                logger.info(f"출력 디렉토리 확인/생성: {output_dir}")
-            except Exception as e:
-                logger.error(f"출력 디렉토리 생성 실패: {output_dir}, 오류: {str(e)}")
-                raise ValueError(f"출력 디렉토리를 생성할 수 없습니다: {output_dir}")
+            # 디렉토리 생성 (파일/시트마다 mkdir 하지 않도록 처음 한 번만)
+            if not self._output_dir_ready:
+                try:
+                    output_dir.mkdir(parents=True, exist_ok=True)
+                    logger.info(f"출력 디렉토리 확인/생성: {output_dir}")
+                except Exception as e:
+                    logger.error(f"출력 디렉토리 생성 실패: {output_dir}, 오류: {str(e)}")
+                    raise ValueError(f"출력 디렉토리를 생성할 수 없습니다: {output_dir}")
+                self._output_dir_ready = True
             
             # 최종 출력 경로 생성 및 검증
             output_path = output_dir / output_name
@@ -281,57 +288,93 @@ class ExcelToImageConverter:
             bool: 변환 성공 여부
         """
         try:
-            # Excel 파일에서 모든 시트 이름 가져오기
-            parser = ExcelParser(excel_file)
-            if not parser.load_workbook():
-                logger.error("Excel 파일을 로드할 수 없습니다.")
+            # Excel 파일에서 모든 시트 이름 가져오기 (셀을 읽지 않는 읽기 전용 로드)
+            try:
+                sheet_names = read_sheet_names(excel_file)
+            except Exception as e:
+                logger.error(f"Excel 파일을 로드할 수 없습니다: {str(e)}")
                 return False
             
-            sheet_names = parser.get_sheet_names()
-            parser.close()
-            
             if not sheet_names:
                 logger.error("Excel 파일에 시트가 없습니다.")
                 return False
             
             logger.info(f"총 {len(sheet_names)}개 시트를 변환합니다: {', '.join(sheet_names)}")
             
+            # CPU 작업인 시트 파싱은 (큰 파일이면) 여러 프로세스에서 미리 병렬로 처리
+            # (이미지 변환은 기존처럼 공유 브라우저로 순서대로 처리)
+            parsed_sheets: Dict[str, Dict[str, Any]] = {}
+            if len(sheet_names) > 1:
+                try:
+                    parsed_sheets = parse_all_sheets(
+                        excel_file, range_start, range_end,
+                        max_workers=config.get('parse_workers'),
+                        read_only=config.get('read_only', False)
+                    )
+                except Exception as e:
+                    # 병렬 파싱 실패 시 시트별로 다시 파싱
+                    logger.warning(f"시트 병렬 파싱 실패, 순차 파싱으로 진행합니다: {str(e)}")
+            
+            # 다음 시트의 HTML 렌더링만 전용 스레드에서 앞서 진행하여 현재 시트의 이미지 변환과 겹치게 함
+            # (Playwright 동기 API는 브라우저 응답을 기다리는 동안 GIL을 놓음)
+            # 한 시트만 미리 렌더링하고 파싱 결과는 넘기는 즉시 버려 렌더링된 HTML이 쌓이지 않도록 함
+            render_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sheet-render')
+            template_dir = config.get('template_dir')
+            
+            def submit_render(index: int):
+                if index >= len(sheet_names):
+                    return None
+                data = parsed_sheets.pop(sheet_names[index], None)
+                if not data:
+                    return None
+                return render_pool.submit(self._render_html, data, template_dir)
+            
+            next_render = submit_render(0)
+            
             success_count = 0
             total_count = len(sheet_names)
             
-            for sheet_name in sheet_names:
-                try:
-                    logger.info(f"시트 변환 중: {sheet_name}")
-                    
-                    # 각 시트별 출력 파일명 생성
-                    output_type = config.get('type', 'image')
-                    
-                    if output_file:
-                        # 출력 파일명이 지정된 경우 시트명을 추가
-                        base_name = os.path.splitext(output_file)[0]
-                        if output_type.lower() == 'html':
-                            ext = '.html'
-                        else:
-                            ext = os.path.splitext(output_file)[1]
-                        sheet_output_file = f"{base_name}_{sheet_name}{ext}"
-                    else:
-                        # 출력 파일명이 지정되지 않은 경우 기본 파일명에 시트명 추가
-                        if output_type.lower() == 'html':
-                            sheet_output_file = self._generate_output_path(excel_file, sheet_name, 'html')
+            try:
+                for index, sheet_name in enumerate(sheet_names):
+                    rendered, next_render = next_render, None
+                    try:
+                        next_render = submit_render(index + 1)
+                        logger.info(f"시트 변환 중: {sheet_name}")
+                        
+                        # 각 시트별 출력 파일명 생성
+                        output_type = config.get('type', 'image')
+                        
+                        if output_file:
+                            # 출력 파일명이 지정된 경우 시트명을 추가
+                            base_name = os.path.splitext(output_file)[0]
+                            if output_type.lower() == 'html':
+                                ext = '.html'
+                            else:
+                                ext = os.path.splitext(output_file)[1]
+                            sheet_output_file = f"{base_name}_{sheet_name}{ext}"
                         else:
-                            sheet_output_file = self._generate_output_path(excel_file, sheet_name, config['output_format'])
-                    
-                    # 단일 시트 변환
-                    success = self._convert_single_sheet(excel_file, sheet_output_file, sheet_name, range_start, range_end, config)
-                    
-                    if success:
-                        success_count += 1
-                        logger.info(f"시트 '{sheet_name}' 변환 완료: {sheet_output_file}")
-                    else:
-                        logger.error(f"시트 '{sheet_name}' 변환 실패")
+                            # 출력 파일명이 지정되지 않은 경우 기본 파일명에 시트명 추가
+                            if output_type.lower() == 'html':
+                                sheet_output_file = self._generate_output_path(excel_file, sheet_name, 'html')
+                            else:
+                                sheet_output_file = self._generate_output_path(excel_file, sheet_name, config['output_format'])
                         
-                except Exception as e:
-                    logger.error(f"시트 '{sheet_name}' 변환 중 오류: {str(e)}")
+                        # 단일 시트 변환
+                        success = self._convert_single_sheet(
+                            excel_file, sheet_output_file, sheet_name, range_start, range_end, config,
+                            html_content=rendered.result() if rendered else None
+                        )
+                        
+                        if success:
+                            success_count += 1
+                            logger.info(f"시트 '{sheet_name}' 변환 완료: {sheet_output_file}")
+                        else:
+                            logger.error(f"시트 '{sheet_name}' 변환 실패")
+                            
+                    except Exception as e:
+                        logger.error(f"시트 '{sheet_name}' 변환 중 오류: {str(e)}")
+            finally:
+                render_pool.shutdown(wait=False, cancel_futures=True)
             
             logger.info(f"전체 시트 변환 완료: {success_count}/{total_count} 성공")
             return success_count > 0
@@ -342,7 +385,8 @@ class ExcelToImageConverter:
     
     def _convert_single_sheet(self, excel_file: str, output_file: str, sheet_name: str,
                              range_start: Optional[str], range_end: Optional[str], 
-                             config: Dict[str, Any]) -> bool:
+                             config: Dict[str, Any],
+                             html_content: Optional[str] = None) -> bool:
         """
         단일 시트를 이미지로 변환합니다.
         
@@ -353,21 +397,26 @@ class ExcelToImageConverter:
             range_start (str, optional): 시작 범위
             range_end (str, optional): 끝 범위
             config (Dict[str, Any]): 설정
+            html_content (str, optional): 미리 렌더링된 HTML (지정 시 파싱/렌더링 생략)
             
         Returns:
             bool: 변환 성공 여부
         """
         try:
-            # 1단계: Excel 파싱
-            logger.info(f"1단계: Excel 파일 파싱 중... (시트: {sheet_name})")
-            sheet_data = self._parse_excel(excel_file, sheet_name, range_start, range_end)
-            if not sheet_data:
-                logger.error("Excel 파싱 실패")
-                return False
-            
-            # 2단계: HTML 변환
-            logger.info("2단계: HTML 변환 중...")
-            html_content = self._render_html(sheet_data, config.get('template_dir'))
+            if not html_content:
+                # 1단계: Excel 파싱
+                logger.info(f"1단계: Excel 파일 파싱 중... (시트: {sheet_name})")
+                sheet_data = self._parse_excel(
+                    excel_file, sheet_name, range_start, range_end,
+                    read_only=config.get('read_only', False)
+                )
+                if not sheet_data:
+                    logger.error("Excel 파싱 실패")
+                    return False
+                
+                # 2단계: HTML 변환
+                logger.info("2단계: HTML 변환 중...")
+                html_content = self._render_html(sheet_data, config.get('template_dir'))
             if not html_content:
                 logger.error("HTML 변환 실패")
                 return False
@@ -379,10 +428,9 @@ class ExcelToImageConverter:
                 # HTML만 생성
                 logger.info("3단계: HTML 파일 저장 중...")
                 try:
-                    # HTML 파일로 저장
-                    html_output_file = output_file.replace(f".{config['output_format']}", ".html")
-                    with open(html_output_file, "w", encoding="utf-8") as f:
-                        f.write(html_content)
+                    # HTML 파일로 저장 (한 번에 인코딩하여 바이너리로 기록, 텍스트 래퍼 버퍼링 생략)
+                    html_output_file = Path(output_file).with_suffix(".html")
+                    html_output_file.write_bytes(html_content.encode("utf-8"))
                     logger.info(f"HTML 파일 생성 완료: {html_output_file}")
                     return True
                 except Exception as e:
@@ -423,24 +471,54 @@ class ExcelToImageConverter:
             Dict[str, bool]: 파일별 변환 결과
         """
         results = {}
+        total = len(excel_files)
         
-        logger.info(f"배치 변환 시작: {len(excel_files)}개 파일")
+        logger.info(f"배치 변환 시작: {total}개 파일")
         
-        for i, excel_file in enumerate(excel_files, 1):
-            logger.info(f"처리 중 ({i}/{len(excel_files)}): {excel_file}")
+        def convert(index: int, excel_file: str) -> bool:
+            logger.info(f"처리 중 ({index}/{total}): {excel_file}")
             
             try:
                 success = self.convert_excel_to_image(excel_file, **kwargs)
-                results[excel_file] = success
                 
                 if success:
                     logger.info(f"✓ 성공: {excel_file}")
                 else:
                     logger.error(f"✗ 실패: {excel_file}")
+                return success
                     
             except Exception as e:
                 logger.error(f"✗ 오류: {excel_file} - {str(e)}")
-                results[excel_file] = False
+                return False
+        
+        # 파일별 변환을 max_workers개 스레드에서 병렬 처리
+        # (동기 변환기는 스레드마다 브라우저 하나를 재사용하므로 브라우저 수도 max_workers로 제한됨)
+        workers = max(1, min(self.config.get('max_workers', 3), total))
+        if workers > 1:
+            # 파일을 이미 병렬로 처리하므로 파일마다 시트 파싱 프로세스를 늘리지 않음
+            kwargs.setdefault('parse_workers', 1)
+        pool_threads = set()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='excel-batch',
+                                initializer=lambda: pool_threads.add(threading.get_ident())) as pool:
+            outcomes = pool.map(convert, range(1, total + 1), excel_files)
+            for excel_file, success in zip(excel_files, outcomes):
+                results[excel_file] = success
+            
+            # 스레드별 브라우저는 그 스레드에서만 닫을 수 있으므로 풀 종료 전에 스레드마다 정리 작업을 하나씩 실행
+            # (배리어에서 서로 기다리므로 한 스레드가 정리 작업을 두 번 가져가지 않음)
+            barrier = threading.Barrier(len(pool_threads))
+            
+            def close_converter():
+                try:
+                    close_thread_converter()
+                finally:
+                    try:
+                        barrier.wait(timeout=CONVERTER_CLOSE_TIMEOUT)
+                    except threading.BrokenBarrierError:
+                        logger.warning("일부 작업 스레드의 브라우저를 닫지 못했습니다")
+            
+            for _ in range(len(pool_threads)):
+                pool.submit(close_converter)
         
         # 결과 요약
         success_count = sum(1 for success in results.values() if success)
@@ -481,6 +559,8 @@ def main():
     parser.add_argument('-s', '--sheet', help='시트 이름')
     parser.add_argument('-i', '--sheet-index', type=int, help='시트 인덱스 (0부터 시작)')
     parser.add_argument('-r', '--range', help='셀 범위 (예: A1:D10)')
+    parser.add_argument('--read-only', action='store_true',
+                       help='대용량 파일용 읽기 전용 파싱 (메모리 절약, 병합 셀/행열 크기 제외)')
     
     # 이미지 옵션
     parser.add_argument('--width', type=int, help='강제 이미지 너비')
@@ -489,6 +569,9 @@ def main():
     # 배치 처리
     parser.add_argument('--batch', action='store_true', help='배치 처리 모드')
     parser.add_argument('--recursive', action='store_true', help='하위 디렉토리 포함')
+    parser.add_argument('--skip-existing', action='store_true',
+                       help='출력 파일이 입력 파일보다 새로우면 건너뜀 (배치 모드, 같은 변환 옵션으로 다시 실행할 때만 사용)')
+    parser.add_argument('--results-file', help='파일별 결과를 JSON Lines로 기록할 경로 (배치 모드)')
     
     # 기타 옵션
     parser.add_argument('--headless', action='store_true', default=True, 
@@ -525,7 +608,8 @@ def main():
         'headless': args.headless,
         'width': args.width,
         'height': args.height,
-        'type': args.type
+        'type': args.type,
+        'read_only': args.read_only
     }
     
     # Playwright 브라우저 설치 확인
@@ -543,8 +627,15 @@ def main():
         if args.batch or '*' in args.input or '?' in args.input:
             # 배치 처리 (최적화된 버전)
             import glob
-            excel_files = glob.glob(args.input, recursive=args.recursive)
-            excel_files = [f for f in excel_files if f.endswith(('.xlsx', '.xls'))]
+            if os.path.isdir(args.input):
+                # 디렉토리는 os.scandir로 한 번만 순회하며 Excel 파일만 수집
+                excel_files = [str(path) for path in find_excel_files(args.input, recursive=args.recursive)]
+            else:
+                # 패턴 매칭 결과를 중간 목록 없이 순회하며 확장자로 거름
+                excel_files = [
+                    f for f in glob.iglob(args.input, recursive=args.recursive)
+                    if f.lower().endswith(EXCEL_EXTENSIONS)
+                ]
             
             if not excel_files:
                 logger.error("변환할 Excel 파일을 찾을 수 없습니다.")
@@ -564,7 +655,10 @@ def main():
                 range_start=range_start,
                 range_end=range_end,
                 recursive=args.recursive,
-                type=args.type
+                type=args.type,
+                skip_existing=args.skip_existing,
+                results_path=args.results_file,
+                read_only=args.read_only
             ))
             
             if result.get('success'):
@@ -573,12 +667,16 @@ def main():
                 print(f"총 파일: {stats['total_files']}개")
                 print(f"성공: {stats['completed_files']}개")
                 print(f"실패: {stats['failed_files']}개")
+                print(f"건너뜀: {stats['skipped_files']}개")
                 print(f"성공률: {stats['success_rate']:.1f}%")
                 print(f"총 소요시간: {stats['total_duration']:.1f}초")
                 print(f"평균 처리시간: {stats['average_duration']:.1f}초")
                 
                 if stats['failed_files'] > 0:
                     print("\n실패한 파일:")
+                    if args.results_file:
+                        # 결과를 파일로만 기록한 경우 반환된 결과 목록은 비어 있음
+                        print(f"  (파일별 결과는 {args.results_file} 참고)")
                     for file_result in result['results']:
                         if file_result['status'] == 'failed':
                             print(f"  - {file_result['file_name']}: {file_result['error']}")
@@ -0,0 +1,212 @@
+"""
+Render Cache Module
+
+변환 결과 캐시 모듈
+(파일 해시, 시트, 범위)로 식별되는 렌더링된 HTML과 최종 이미지를 디스크에 보관하여
+동일한 입력에 대한 파싱/렌더링/스크린샷을 건너뜁니다.
+"""
+
+import os
+import shutil
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 기본 캐시 용량 (1GB)
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    캐시 키를 생성합니다.
+
+    Args:
+        *parts: 키를 구성하는 값들 (None 포함 가능)
+
+    Returns:
+        str: SHA-256 해시 문자열
+    """
+    joined = "|".join("" if part is None else str(part) for part in parts)
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """
+    mtime 기준 LRU로 용량을 제한하는 디스크 캐시 클래스
+
+    캐시 전체 크기는 시작할 때 한 번만 디렉토리를 읽어 구하고 이후 저장할 때마다 누적하므로,
+    디렉토리 전체를 훑는 정리 작업은 용량을 넘었을 때만 실행됩니다.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        RenderCache 초기화
+
+        Args:
+            cache_dir (Path): 캐시 디렉토리
+            max_bytes (int): 최대 캐시 용량 (바이트)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # 현재 캐시 크기 (바이트, 여러 스레드의 저장에서 갱신되므로 락으로 보호)
+        self._lock = threading.Lock()
+        self._total_bytes = sum(size for _, size, _ in self._scan())
+
+    def _path(self, key: str, ext: str) -> Path:
+        return self.cache_dir / f"{key}.{ext}"
+
+    def _touch(self, path: Path):
+        """최근 사용 시간을 갱신합니다. (LRU 기준)"""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def get_text(self, key: str, ext: str = "html") -> Optional[str]:
+        """
+        캐시된 텍스트를 조회합니다.
+
+        Args:
+            key (str): 캐시 키
+            ext (str): 확장자
+
+        Returns:
+            Optional[str]: 캐시된 내용 (없으면 None)
+        """
+        path = self._path(key, ext)
+        try:
+            content = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        self._touch(path)
+        return content
+
+    def put_text(self, key: str, content: str, ext: str = "html"):
+        """
+        텍스트를 원자적으로 캐시에 저장합니다.
+
+        Args:
+            key (str): 캐시 키
+            content (str): 저장할 내용
+            ext (str): 확장자
+        """
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            self._commit(temp_path, self._path(key, ext))
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def copy_to(self, key: str, ext: str, dest_path: str) -> bool:
+        """
+        캐시된 파일을 지정 경로로 복사합니다.
+
+        Args:
+            key (str): 캐시 키
+            ext (str): 확장자
+            dest_path (str): 복사할 경로
+
+        Returns:
+            bool: 캐시 적중 여부
+        """
+        path = self._path(key, ext)
+        try:
+            shutil.copyfile(path, dest_path)
+        except FileNotFoundError:
+            return False
+        self._touch(path)
+        return True
+
+    def put_file(self, key: str, ext: str, src_path: str):
+        """
+        파일을 원자적으로 캐시에 저장합니다.
+
+        Args:
+            key (str): 캐시 키
+            ext (str): 확장자
+            src_path (str): 저장할 원본 파일 경로
+        """
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(src_path, temp_path)
+            self._commit(temp_path, self._path(key, ext))
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _commit(self, temp_path: str, path: Path):
+        """
+        임시 파일을 캐시 항목으로 교체하고 누적 크기를 갱신합니다. (용량 초과 시에만 정리)
+
+        Args:
+            temp_path (str): 기록을 마친 임시 파일 경로
+            path (Path): 캐시 항목 경로
+        """
+        size = os.path.getsize(temp_path)
+        try:
+            # 같은 키를 덮어쓰면 이전 항목 크기만큼 줄어듦
+            size -= path.stat().st_size
+        except FileNotFoundError:
+            pass
+        os.replace(temp_path, path)
+
+        with self._lock:
+            self._total_bytes += size
+            over_limit = self._total_bytes > self.max_bytes
+        if over_limit:
+            self.evict()
+
+    def _scan(self):
+        """캐시 항목의 (mtime, 크기, 경로) 목록을 반환합니다. (임시 파일 제외)"""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.is_file() or entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def evict(self):
+        """
+        용량을 초과하면 가장 오래 사용되지 않은 파일부터 삭제합니다.
+
+        디렉토리를 다시 읽어 실제 크기로 누적 크기를 보정합니다.
+        """
+        entries = self._scan()
+        total_bytes = sum(size for _, size, _ in entries)
+
+        if total_bytes <= self.max_bytes:
+            with self._lock:
+                self._total_bytes = total_bytes
+            return
+
+        entries.sort()
+        removed = 0
+        for _, size, path in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total_bytes -= size
+                removed += 1
+            except OSError:
+                continue
+
+        with self._lock:
+            self._total_bytes = total_bytes
+        logger.info(f"렌더링 캐시 정리: {removed}개 파일 삭제")
@@ -0,0 +1,63 @@
+"""
+Shared Chromium Launcher
+
+여러 API 워커가 공유할 Chromium을 별도 프로세스로 실행하는 스크립트
+워커는 PLAYWRIGHT_CDP_ENDPOINT 환경 변수로 이 브라우저에 CDP 접속합니다.
+"""
+
+import sys
+import asyncio
+import argparse
+import logging
+from playwright.async_api import async_playwright
+
+from browser_pool import build_launch_options
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+async def run_chromium(port: int, address: str):
+    """
+    원격 디버깅 포트를 연 Chromium을 실행하고 종료될 때까지 대기합니다.
+
+    Args:
+        port (int): 원격 디버깅 포트
+        address (str): 원격 디버깅 바인드 주소
+    """
+    launch_options = build_launch_options(headless=True)
+    launch_options['args'] = launch_options['args'] + [
+        f'--remote-debugging-port={port}',
+        f'--remote-debugging-address={address}',
+    ]
+
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(**launch_options)
+        logger.info(f"공유 Chromium 실행 완료: http://{address}:{port}")
+
+        # 브라우저가 종료될 때까지 대기
+        disconnected = asyncio.Event()
+        browser.on("disconnected", lambda _: disconnected.set())
+        await disconnected.wait()
+        logger.info("공유 Chromium이 종료되었습니다.")
+
+
+def main():
+    """메인 함수 - CLI 인터페이스"""
+    parser = argparse.ArgumentParser(description='API 워커가 공유할 Chromium 실행')
+    parser.add_argument('--port', type=int, default=9222, help='원격 디버깅 포트 (기본값: 9222)')
+    parser.add_argument('--address', default='127.0.0.1',
+                        help='원격 디버깅 바인드 주소 (기본값: 127.0.0.1)')
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(run_chromium(args.port, args.address))
+    except KeyboardInterrupt:
+        logger.info("사용자에 의해 중단되었습니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
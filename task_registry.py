@@ -0,0 +1,196 @@
+"""
+Task Registry Module
+
+변환 작업 상태 저장소
+용량 제한(LRU)과 만료 시간(TTL)이 있는 작업 레지스트리를 제공합니다.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 기본 최대 작업 수
+DEFAULT_CAPACITY = 10_000
+
+# 기본 작업 보관 시간 (24시간)
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+# 아직 끝나지 않은 작업 상태 (용량 초과/만료 시에도 제거하지 않음)
+UNFINISHED_STATUSES = ("pending", "processing")
+
+# 제거된 작업을 정리하는 콜백 (작업 ID, 작업 정보)
+EvictCallback = Callable[[List[Tuple[str, Dict[str, Any]]]], None]
+
+
+class TaskRegistry:
+    """LRU + TTL 방식으로 작업 정보를 보관하는 클래스"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 on_evict: Optional[EvictCallback] = None):
+        """
+        TaskRegistry 초기화
+
+        진행 중인 작업(pending/processing)은 용량 초과나 만료로 제거하지 않습니다.
+
+        Args:
+            capacity (int): 최대 보관 작업 수 (초과 시 가장 오래된 완료 작업부터 제거)
+            ttl_seconds (float): 작업 보관 시간 (초)
+            on_evict (Callable, optional): 용량 초과/만료로 제거된 작업 목록을 받는 콜백
+                (업로드/출력 파일 삭제 등, 락 밖에서 호출됨)
+        """
+        self.capacity = capacity
+        self.ttl_seconds = ttl_seconds
+        self.on_evict = on_evict
+        self._tasks: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._timestamps: Dict[str, float] = {}
+        # 백그라운드 작업과 실행기 스레드 양쪽에서 접근할 수 있도록 스레드 락 사용
+        self._lock = threading.Lock()
+
+    def __contains__(self, task_id: str) -> bool:
+        with self._lock:
+            return task_id in self._tasks
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._tasks)
+
+    def set(self, task_id: str, task: Dict[str, Any]):
+        """
+        작업을 등록합니다.
+
+        Args:
+            task_id (str): 작업 ID
+            task (Dict[str, Any]): 작업 정보
+        """
+        with self._lock:
+            self._tasks[task_id] = task
+            self._tasks.move_to_end(task_id)
+            self._timestamps[task_id] = time.monotonic()
+
+            # 용량 초과 시 가장 오래 사용되지 않은 완료 작업부터 제거
+            evicted = []
+            excess = len(self._tasks) - self.capacity
+            if excess > 0:
+                victims = []
+                for candidate_id, candidate in self._tasks.items():
+                    if len(victims) >= excess:
+                        break
+                    if candidate.get("status") not in UNFINISHED_STATUSES:
+                        victims.append(candidate_id)
+                evicted = [(victim_id, self._pop(victim_id)) for victim_id in victims]
+
+        self._notify_evicted(evicted)
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 정보를 조회합니다.
+
+        Args:
+            task_id (str): 작업 ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 작업 정보 (없으면 None)
+        """
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is not None:
+                self._tasks.move_to_end(task_id)
+            return task
+
+    def update(self, task_id: str, **fields) -> bool:
+        """
+        작업 정보의 일부 필드를 갱신합니다.
+
+        Args:
+            task_id (str): 작업 ID
+            **fields: 갱신할 필드
+
+        Returns:
+            bool: 갱신 성공 여부 (작업이 이미 제거된 경우 False)
+        """
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return False
+            task.update(fields)
+            return True
+
+    def delete(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업을 삭제합니다.
+
+        Args:
+            task_id (str): 작업 ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 삭제된 작업 정보 (없으면 None)
+        """
+        with self._lock:
+            return self._pop(task_id)
+
+    def _pop(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """작업과 타임스탬프를 제거합니다. (락을 잡은 상태에서 호출)"""
+        self._timestamps.pop(task_id, None)
+        return self._tasks.pop(task_id, None)
+
+    def _notify_evicted(self, evicted: List[Tuple[str, Dict[str, Any]]]):
+        """제거된 작업을 on_evict 콜백에 전달합니다."""
+        if not evicted or self.on_evict is None:
+            return
+        try:
+            self.on_evict(evicted)
+        except Exception as e:
+            logger.warning(f"제거된 작업 정리 실패: {e}")
+
+    def snapshot(self) -> Iterator[Dict[str, Any]]:
+        """
+        현재 작업 목록을 순회하는 이터레이터를 반환합니다.
+
+        Returns:
+            Iterator[Dict[str, Any]]: 작업 정보 이터레이터
+        """
+        with self._lock:
+            tasks = list(self._tasks.values())
+        return iter(tasks)
+
+    def evict_expired(self) -> int:
+        """
+        보관 시간이 지난 작업을 제거합니다.
+
+        Returns:
+            int: 제거된 작업 수
+        """
+        deadline = time.monotonic() - self.ttl_seconds
+        with self._lock:
+            expired = [
+                task_id for task_id, ts in self._timestamps.items()
+                if ts < deadline and self._tasks[task_id].get("status") not in UNFINISHED_STATUSES
+            ]
+            evicted = [(task_id, self._pop(task_id)) for task_id in expired]
+
+        if evicted:
+            logger.info(f"만료된 작업 {len(evicted)}개 제거")
+            self._notify_evicted(evicted)
+        return len(evicted)
+
+
+async def run_evictor(registry: TaskRegistry, interval: float = 300):
+    """
+    주기적으로 만료된 작업을 제거하는 백그라운드 루프
+
+    Args:
+        registry (TaskRegistry): 작업 레지스트리
+        interval (float): 검사 주기 (초)
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            # 제거된 작업의 파일 정리(on_evict)가 이벤트 루프를 막지 않도록 스레드에서 실행
+            await asyncio.to_thread(registry.evict_expired)
+        except Exception as e:
+            logger.warning(f"만료 작업 제거 실패: {e}")